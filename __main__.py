@@ -18,12 +18,65 @@ In addition, you should have the following subfolders
 
 Moving any of these folders or files will prevent the game from working properly
 
+To play a level without a window (see simulate.py), type
+
+    python froggit simulate easy1.json --ticks 10000
+
+To measure the per-frame cost of the game (see benchmark.py), type
+
+    python froggit bench queries complete.json
+
+To play back a recorded game without a window (see replay.py), type
+
+    python froggit replay session.frog
+
+To simulate many levels at once on every core (see batch.py), type
+
+    python froggit batch easy1.json complete.json --seeds 8
+
+To pack the images into a texture atlas ahead of time (see game2d/atlas.py), type
+
+    python froggit atlas
+
 Author: Walker M. White (wmw2)
 Date:   November 1, 2020
 """
-from consts import *
-from app import *
+import os
+import sys
+
+# Make the modules in this folder visible when run as python -m froggit
+sys.path.insert(0,os.path.dirname(os.path.abspath(__file__)))
 
 # Application code
 if __name__ == '__main__':
-    Froggit(width=GAME_WIDTH,height=GAME_HEIGHT).run()
+    if len(sys.argv) > 1 and sys.argv[1] == 'simulate':
+        from simulate import main
+        sys.exit(main(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == 'bench':
+        from benchmark import main
+        sys.exit(main(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == 'replay':
+        from replay import main
+        sys.exit(main(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == 'batch':
+        from batch import main
+        sys.exit(main(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == 'atlas':
+        os.environ.setdefault('GAME2D_HEADLESS','1')
+        from game2d.atlas import main
+        sys.exit(main(sys.argv[2:],os.path.join(os.path.dirname(os.path.abspath(__file__)),'Images')))
+
+    # The third and fourth arguments only apply to the game (see consts.py)
+    import consts
+    try:
+        consts.GAME_TICK = float(sys.argv[3])
+    except:
+        pass # Use original value
+    try:
+        consts.RECORD_FILE = sys.argv[4]
+    except:
+        pass # Use original value
+
+    from consts import *
+    from app import *
+    Froggit(width=GAME_WIDTH,height=GAME_HEIGHT,tick=GAME_TICK,catchup=GAME_CATCHUP).run()
@@ -66,6 +66,10 @@ class Froggit(GameApp):
     #
     # Attribute _text: A message to display to the player
     # Invariant: _text is a GLabel, or None if there is no message to display
+    #
+    # Attribute _recorder: The recorder for the input to the level (see replay.py)
+    # Invariant: _recorder is a Recorder, or None if RECORD_FILE is None or no
+    #            level has been started
 
     # LIST MORE ATTRIBUTES (AND THEIR INVARIANTS) HERE IF NECESSARY
 
@@ -127,6 +131,7 @@ class Froggit(GameApp):
         self._level = None
         self._state = STATE_INACTIVE
         self._last = 0
+        self._recorder = None
 
     def update(self,dt):
         """
@@ -193,22 +198,24 @@ class Froggit(GameApp):
         if self._level != None:
             if self._level.getFrog() is None:
                 self._state = STATE_PAUSED
-                self._text = GLabel(text = "Press 'C' to Continue",
+                self._text = GLabel.cached(text = "Press 'C' to Continue",
                              font_size=ALLOY_SMALL,font_name = ALLOY_FONT,
                              linecolor = '#FFFFFF',fillcolor='#0000ff',
                              x=self.width//2,y=self.height//2-GRID_SIZE/2)
             if self._level.getLives() == 0:
                 self._state = STATE_COMPLETE
-                self._text = GLabel(text = "You lose",font_size= ALLOY_SMALL,
+                self._text = GLabel.cached(text = "You lose",font_size= ALLOY_SMALL,
                      font_name = ALLOY_FONT,linecolor = '#FFFFFF',
                      fillcolor='#0000ff',x=self.width//2,y=self.height//2-GRID_SIZE/2)
 
             if self._state != STATE_PAUSED and self._state != STATE_COMPLETE:
+                if self._recorder != None:
+                    self._recorder.record(self.input,dt)
                 self._level.update(self.input,dt)
 
             if  self._level.getOccupied() == True:
                 self._state = STATE_COMPLETE
-                self._text = GLabel(text = "You win",font_size= ALLOY_SMALL,
+                self._text = GLabel.cached(text = "You win",font_size= ALLOY_SMALL,
                      font_name = ALLOY_FONT,linecolor = '#FFFFFF',
                      fillcolor = '#0000ff',x=self.width//2,y=self.height//2-GRID_SIZE/2)
 
@@ -228,7 +235,9 @@ class Froggit(GameApp):
         # IMPLEMENT ME
         if self._title != None:
             self._title.draw(self.view)
-        if self._level != None:
+        if self._level != None and self._state == STATE_ACTIVE:
+            self._level.draw(self.view,self.alpha)
+        elif self._level != None:
             self._level.draw(self.view)
         if self._text != None:
             self._text.draw(self.view)
@@ -256,8 +265,10 @@ class Froggit(GameApp):
             self._state = STATE_LOADING
             # State changed; reset factor
 
+            self.view.detach_all()
             self._level = Level(self.load_json(DEFAULT_LEVEL),
                           self.load_json("objects.json"))
+            self._startRecording()
 
             self.height = self._level.getHeight()*GRID_SIZE + GRID_SIZE
             self.width = self._level.getWidth()*GRID_SIZE
@@ -275,3 +286,16 @@ class Froggit(GameApp):
             self._state = STATE_ACTIVE
         # Update last_keys
         self._last = curr_keys
+
+    def _startRecording(self):
+        """
+        Starts recording the input to a new level, if RECORD_FILE is set.
+
+        The recorder is made for the first level. Every level after that is
+        recorded in the same file as a restart.
+        """
+        if self._recorder != None:
+            self._recorder.restart()
+        elif RECORD_FILE != None:
+            from replay import Recorder
+            self._recorder = Recorder(RECORD_FILE,DEFAULT_LEVEL)
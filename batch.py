@@ -0,0 +1,255 @@
+"""
+Batch simulation module for Froggit
+
+This module runs many headless simulations (see simulate.py) at once, spread across
+all of the cores of the computer.  Each job is a (level file, input policy, seed)
+tuple, and is simulated for a fixed number of ticks.  The result of each job is a
+dictionary of statistics:
+
+    'deaths':  the total number of lives lost
+    'lanes':   the number of lives lost in each lane, by row
+    'exits':   for each exit reached, by (column,row), the number of times it was
+               reached and the total seconds that the frog took to get there
+    'rate':    the number of ticks simulated per second
+
+This module may be used as froggit.batch, or from the command line:
+
+    python froggit batch easy1.json complete.json --seeds 8 --ticks 20000
+
+With no level files, it simulates every level in the JSON folder.
+"""
+import os
+import sys
+os.environ.setdefault('GAME2D_HEADLESS','1')
+
+# Make the modules in this folder visible when used as froggit.batch
+if os.path.dirname(os.path.abspath(__file__)) not in sys.path:
+    sys.path.insert(0,os.path.dirname(os.path.abspath(__file__)))
+
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from game2d import *
+from consts import *
+from simulate import *
+
+# The default number of ticks to simulate per job
+BATCH_TICKS = 10000
+# The level files that are broken on purpose, and skipped by default
+BATCH_BROKEN = ('error1.json','error2.json')
+
+# The JSON data loaded by this process, by file name
+_loaded = {}
+
+
+def load_cached(name):
+    """
+    Returns the JSON data for the level file name, loading it at most once.
+
+    Each worker process has its own cache, so every file is read once per worker
+    instead of once per job.
+
+    Parameter name: the level file
+    Precondition: name is a string naming a level file
+    """
+    if not name in _loaded:
+        _loaded[name] = load_level(name)
+    return _loaded[name]
+
+
+def level_files():
+    """
+    Returns the names of the level files in the JSON folder.
+
+    The object data file and the broken level files (BATCH_BROKEN) are left out.
+    """
+    names = []
+    for name in sorted(os.listdir(GameApp.json)):
+        if name.endswith('.json') and name != OBJECT_DATA and not name in BATCH_BROKEN:
+            names.append(name)
+    return names
+
+
+def run_job(job,ticks=BATCH_TICKS,dt=SIMULATION_DT):
+    """
+    Simulates a single job and returns its statistics.
+
+    The statistics are described in the module docstring.  The dictionary also
+    has the level, policy, seed, ticks, and seconds of the job, along with the
+    number of wins and losses.
+
+    Parameter job: the job to simulate
+    Precondition: job is a (level file, policy name, seed) tuple
+
+    Parameter ticks: the number of ticks to simulate
+    Precondition: ticks is an int >= 0
+
+    Parameter dt: the number of seconds per tick
+    Precondition: dt is a number > 0
+    """
+    (name,policy,seed) = job
+    simulation = Simulation(load_cached(name),load_cached(OBJECT_DATA),policy,seed,dt)
+    lanes = {}
+    exits = {}
+
+    frog = None
+    born = 0
+    deaths = 0
+    start = time.perf_counter()
+    for tick in range(ticks):
+        simulation.step()
+        level = simulation.getLevel()
+        if level.getFrog() is not None and level.getFrog() is not frog:
+            frog = level.getFrog()
+            born = tick
+        elif level.getFrog() is None and frog is not None:
+            died = simulation.getDeaths() > deaths
+            _record(level,died,exits,lanes,(tick-born)*dt)
+            deaths = simulation.getDeaths()
+            frog = None
+    seconds = time.perf_counter()-start
+
+    return {'level': name, 'policy': policy, 'seed': seed,
+            'ticks': ticks, 'seconds': seconds,
+            'rate': ticks/seconds if seconds > 0 else float('inf'),
+            'deaths': simulation.getDeaths(), 'wins': simulation.getWins(),
+            'losses': simulation.getLosses(), 'lanes': lanes, 'exits': exits}
+
+
+def _record(level,died,exits,lanes,seconds):
+    """
+    Records why the frog is gone from the level: it died, or it reached an exit.
+
+    Parameter level: the level that the frog just left
+    Precondition: level is a Level whose frog is None
+
+    Parameter died: True if the frog died, False if it reached an exit
+    Precondition: died is a bool
+
+    Parameter exits: the exit statistics to add to
+    Precondition: exits is a dict from (column,row) to [count,seconds]
+
+    Parameter lanes: the death statistics to add to
+    Precondition: lanes is a dict from row to a count
+
+    Parameter seconds: the number of seconds since the frog started
+    Precondition: seconds is a number >= 0
+    """
+    safe = level.getSafeFrogs()
+    if died:
+        row = int(level.getDeadFrog().y // GRID_SIZE)
+        lanes[row] = lanes.get(row,0)+1
+    elif len(safe) > 0:
+        key = (int(safe[-1].x // GRID_SIZE),int(safe[-1].y // GRID_SIZE))
+        if not key in exits:
+            exits[key] = [0,0.0]
+        exits[key][0] += 1
+        exits[key][1] += seconds
+
+
+def _init_worker():
+    """
+    Loads the object data once when a worker process starts.
+    """
+    load_cached(OBJECT_DATA)
+
+
+def run_batch(jobs,ticks=BATCH_TICKS,dt=SIMULATION_DT,workers=None):
+    """
+    Simulates all of the jobs across a pool of processes.
+
+    Returns the list of job statistics (see run_job) in the same order as jobs.
+
+    Parameter jobs: the jobs to simulate
+    Precondition: jobs is a list of (level file, policy name, seed) tuples
+
+    Parameter ticks: the number of ticks to simulate per job
+    Precondition: ticks is an int >= 0
+
+    Parameter dt: the number of seconds per tick
+    Precondition: dt is a number > 0
+
+    Parameter workers: the number of processes to use
+    Precondition: workers is an int > 0, or None to use every core
+    """
+    count = len(jobs)
+    with ProcessPoolExecutor(max_workers=workers,initializer=_init_worker) as pool:
+        return list(pool.map(run_job,jobs,[ticks]*count,[dt]*count))
+
+
+def summarize(results):
+    """
+    Returns the statistics of the results combined by level file.
+
+    Each value has the same keys as a job result, except that the times in 'exits'
+    are the average (not total) seconds to reach that exit, and 'rate' is the
+    average rate of the jobs.
+
+    Parameter results: the job statistics
+    Precondition: results is a list of dictionaries returned by run_job
+    """
+    levels = {}
+    for result in results:
+        if not result['level'] in levels:
+            levels[result['level']] = {'level': result['level'], 'jobs': 0, 'ticks': 0,
+                                       'seconds': 0.0, 'deaths': 0, 'wins': 0,
+                                       'losses': 0, 'lanes': {}, 'exits': {}}
+        total = levels[result['level']]
+        total['jobs'] += 1
+        for key in ('ticks','seconds','deaths','wins','losses'):
+            total[key] += result[key]
+        for (row,count) in result['lanes'].items():
+            total['lanes'][row] = total['lanes'].get(row,0)+count
+        for (key,value) in result['exits'].items():
+            if not key in total['exits']:
+                total['exits'][key] = [0,0.0]
+            total['exits'][key][0] += value[0]
+            total['exits'][key][1] += value[1]
+
+    for total in levels.values():
+        total['rate'] = total['ticks']/total['seconds'] if total['seconds'] > 0 else float('inf')
+        for value in total['exits'].values():
+            value[1] = value[1]/value[0]
+    return levels
+
+
+def main(args=None):
+    """
+    Runs a batch of simulations from the command line and reports the statistics.
+
+    Parameter args: the command line arguments (after the word batch)
+    Precondition: args is a list of strings, or None to use sys.argv
+    """
+    parser = argparse.ArgumentParser(prog='froggit batch',
+                                     description='Simulate many Froggit levels across all cores.')
+    parser.add_argument('levels',nargs='*',help='the level files (default: every level)')
+    parser.add_argument('--policies',nargs='+',choices=sorted(POLICIES),default=['random'],
+                        help='the input policies to simulate')
+    parser.add_argument('--seeds',type=int,default=4,help='the number of seeds per level and policy')
+    parser.add_argument('--ticks',type=int,default=BATCH_TICKS,help='the number of ticks per job')
+    parser.add_argument('--dt',type=float,default=SIMULATION_DT,help='the seconds per tick')
+    parser.add_argument('--workers',type=int,default=None,help='the number of processes')
+    options = parser.parse_args(args)
+
+    levels = options.levels if options.levels else level_files()
+    jobs = [(level,policy,seed) for level in levels
+            for policy in options.policies for seed in range(options.seeds)]
+
+    start = time.perf_counter()
+    results = run_batch(jobs,options.ticks,options.dt,options.workers)
+    elapsed = time.perf_counter()-start
+
+    for (name,total) in summarize(results).items():
+        print('%s: %d jobs, %.0f ticks per second per job, deaths: %d, wins: %d, losses: %d'
+              % (name,total['jobs'],total['rate'],total['deaths'],total['wins'],total['losses']))
+        if total['lanes']:
+            print('  deaths by row: %s' % ', '.join('%d: %d' % (row,total['lanes'][row])
+                                                   for row in sorted(total['lanes'])))
+        for key in sorted(total['exits']):
+            print('  exit at %s: reached %d times, %.2f seconds on average'
+                  % (key,total['exits'][key][0],total['exits'][key][1]))
+    ticks = options.ticks*len(jobs)
+    print('total: %d ticks in %.3f seconds (%.0f ticks per second)'
+          % (ticks,elapsed,ticks/elapsed if elapsed > 0 else float('inf')))
+    return 0
@@ -0,0 +1,738 @@
+"""
+Benchmark module for Froggit
+
+This module measures the cost of parts of the game that run every animation frame.
+Every benchmark plays a level without a window (see simulate.py), so they can be run
+on any machine.  To run a benchmark from the command line, type
+
+    python froggit bench queries complete.json
+
+Use 'python froggit bench --help' to see the list of benchmarks.  The memory
+benchmarks need Python 3.9 or later (for tracemalloc.reset_peak).
+
+The labels benchmark renders text, so it needs Kivy and cannot run headless.  Run it
+with the environment variable GAME2D_HEADLESS set to 0.
+"""
+import os
+os.environ.setdefault('GAME2D_HEADLESS','1')
+
+import argparse
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from game2d import *
+from consts import *
+from lanes import *
+from simulate import *
+
+# The default number of frames to measure
+BENCHMARK_FRAMES = 1000
+# The rotation (in degrees) given to lane objects in the transforms benchmark
+BENCHMARK_ANGLE = 30
+# The numbers of objects in the crowds of the many benchmark
+BENCHMARK_CROWDS = (4,8,16,64,256,512,768,1024,2048)
+
+
+def _noop():
+    """
+    Does nothing; used to measure the cost of measuring.
+    """
+    pass
+
+
+def _measure(function):
+    """
+    Returns the peak number of bytes allocated while calling function.
+
+    The result includes a small fixed cost from tracemalloc itself.  Subtract the
+    result of measuring _noop to remove it.
+
+    Parameter function: the function to call
+    Precondition: function is callable with no arguments, and tracemalloc is tracing
+    """
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    function()
+    return tracemalloc.get_traced_memory()[1]-before
+
+
+def bench_queries(name,frames=BENCHMARK_FRAMES):
+    """
+    Measures the memory allocated by the lane query methods each frame.
+
+    Each frame, every lane is updated and its objects placed.  Then the query
+    methods (carPos, getLogs, getExits, getOpenings) are called once per lane,
+    and the memory allocated by those calls alone is measured with tracemalloc.
+
+    Returns a dictionary with the number of calls and bytes allocated per frame.
+
+    Parameter name: the level file
+    Precondition: name is a string naming a level file
+
+    Parameter frames: the number of frames to measure
+    Precondition: frames is an int > 0
+    """
+    level = Level(load_level(name),load_level(OBJECT_DATA))
+    input = HeadlessInput()
+    lanes = level._lanes
+
+    queries = []
+    for lane in lanes:
+        if isinstance(lane,Road):
+            queries.append(lane.carPos)
+        elif isinstance(lane,Water):
+            queries.append(lane.getLogs)
+        elif isinstance(lane,Hedge):
+            queries.append(lane.getExits)
+            queries.append(lane.getOpenings)
+
+    allocated = 0
+    tracemalloc.start()
+    for frame in range(frames):
+        for lane in lanes:
+            lane.update(input,SIMULATION_DT)
+            lane.getObjects()
+
+        # Measure each call by itself, so the loop is not counted
+        overhead = _measure(_noop)
+        for query in queries:
+            allocated += _measure(query)-overhead
+    tracemalloc.stop()
+
+    return {'calls': len(queries), 'bytes': allocated/frames}
+
+
+def report_queries(options):
+    """
+    Runs bench_queries from the command line and prints the results.
+
+    Parameter options: the parsed command line arguments
+    Precondition: options has attributes level and frames
+    """
+    result = bench_queries(options.level,options.frames)
+    print('%s: %.0f lane queries per frame, %.1f bytes allocated per frame'
+          % (options.level,result['calls'],result['bytes']))
+
+
+class _NullView(object):
+    """
+    A view that accepts attached objects and ignores them, so lanes can be drawn
+    without a window.
+    """
+
+    def attach(self,cmd,layer):
+        """
+        Does nothing.
+
+        Parameter cmd: the drawing instructions to attach
+        Precondition: none
+
+        Parameter layer: the layer to attach to
+        Precondition: none
+        """
+        pass
+
+    def detach(self,cmd):
+        """
+        Does nothing.
+
+        Parameter cmd: the drawing instructions to detach
+        Precondition: none
+        """
+        pass
+
+
+def bench_draws(name,frames=BENCHMARK_FRAMES):
+    """
+    Counts the lane objects drawn each frame, after leaving out those off screen.
+
+    Each frame, every lane is updated and drawn.  A moving lane draws its objects
+    twice (to wrap around), so without culling a frame would draw twice the number
+    of objects in moving lanes, plus the objects in static lanes.
+
+    Returns a dictionary with the number of objects, the objects that would be drawn
+    without culling, and the average, smallest, and largest number drawn per frame.
+
+    Parameter name: the level file
+    Precondition: name is a string naming a level file
+
+    Parameter frames: the number of frames to measure
+    Precondition: frames is an int > 0
+    """
+    level = Level(load_level(name),load_level(OBJECT_DATA))
+    input = HeadlessInput()
+    view = _NullView()
+
+    objects = 0
+    unculled = 0
+    for lane in level._lanes:
+        count = len(lane.getObjects())
+        objects += count
+        unculled += count if lane.isStatic() else 2*count
+
+    counts = []
+    for frame in range(frames):
+        for lane in level._lanes:
+            lane.update(input,SIMULATION_DT)
+            lane.draw(view)
+        counts.append(level.getDrawCount())
+
+    return {'objects': objects, 'unculled': unculled, 'drawn': sum(counts)/frames,
+            'fewest': min(counts), 'most': max(counts)}
+
+
+def report_draws(options):
+    """
+    Runs bench_draws from the command line and prints the results.
+
+    Parameter options: the parsed command line arguments
+    Precondition: options has attributes level and frames
+    """
+    result = bench_draws(options.level,options.frames)
+    print('%s: %d lane objects, %d drawn per frame without culling'
+          % (options.level,result['objects'],result['unculled']))
+    print('drawn per frame with culling: %.1f on average (%d to %d)'
+          % (result['drawn'],result['fewest'],result['most']))
+
+
+def _introcs_matrices(x,y,angle,sx,sy):
+    """
+    Returns the forward and inverse introcs matrices, as GObject used to build them.
+
+    Parameter x: the horizontal translation
+    Precondition: x is a number
+
+    Parameter y: the vertical translation
+    Precondition: y is a number
+
+    Parameter angle: the rotation in degrees
+    Precondition: angle is a number
+
+    Parameter sx: the horizontal scale
+    Precondition: sx is a nonzero number
+
+    Parameter sy: the vertical scale
+    Precondition: sy is a nonzero number
+    """
+    from introcs.geom import Matrix
+    matrix = Matrix()
+    matrix.scale(sx,sy)
+    matrix.rotate(angle)
+    matrix.translate(x,y)
+    inverse = Matrix()
+    inverse.translate(-x,-y)
+    inverse.rotate(-angle)
+    inverse.scale(1.0/sx,1.0/sy)
+    return (matrix,inverse)
+
+
+def _gtransforms(x,y,angle,sx,sy):
+    """
+    Returns the forward and inverse GTransform, as GObject now builds them.
+
+    The parameters are the same as for _introcs_matrices.
+    """
+    matrix = GTransform(x,y,angle,sx,sy)
+    return (matrix,matrix.inverse())
+
+
+def bench_transforms(name,frames=BENCHMARK_FRAMES,build=_gtransforms,angle=BENCHMARK_ANGLE):
+    """
+    Measures the time spent on rotated collision transforms each frame.
+
+    Each frame, every lane is updated.  Then, as if every lane object were turned by
+    angle degrees, the transforms of each object are rebuilt (since it moved), and the
+    corners of the frog are mapped into the space of the object, which is the work
+    done by a rotated GObject.collides.  Only that work is timed.
+
+    Returns a dictionary with the number of objects and the seconds per frame.
+
+    Parameter name: the level file
+    Precondition: name is a string naming a level file
+
+    Parameter frames: the number of frames to measure
+    Precondition: frames is an int > 0
+
+    Parameter build: the function that builds the forward and inverse transforms
+    Precondition: build is _introcs_matrices or _gtransforms
+
+    Parameter angle: the rotation to give each lane object
+    Precondition: angle is a number
+    """
+    level = Level(load_level(name),load_level(OBJECT_DATA))
+    input = HeadlessInput()
+    frog = level.getFrog()
+    (w,h) = (frog.width/2.0,frog.height/2.0)
+    (forward,backward) = build(frog.x,frog.y,frog.angle,1,1)
+
+    objects = [obj for lane in level._lanes for obj in lane.getObjects()]
+    seconds = 0
+    for frame in range(frames):
+        for lane in level._lanes:
+            lane.update(input,SIMULATION_DT)
+
+        start = time.perf_counter()
+        for obj in objects:
+            (matrix,inverse) = build(obj.x,obj.y,obj.angle+angle,1,1)
+            comp = forward*inverse
+            for (x,y) in ((-w,h),(w,h),(w,-h),(-w,-h)):
+                tuple(comp._transform(x,y))
+        seconds += time.perf_counter()-start
+
+    return {'objects': len(objects), 'seconds': seconds/frames}
+
+
+def report_transforms(options):
+    """
+    Runs bench_transforms from the command line, with introcs matrices and GTransform.
+
+    Parameter options: the parsed command line arguments
+    Precondition: options has attributes level and frames
+    """
+    for build in (_introcs_matrices,_gtransforms):
+        result = bench_transforms(options.level,options.frames,build)
+        print('%s: %.3f ms per frame for %d rotated objects'
+              % ('introcs Matrix' if build is _introcs_matrices else 'GTransform',
+                 1000*result['seconds'],result['objects']))
+
+
+def _layers(level):
+    """
+    Returns the lane objects of the level with the broadphase layer of each.
+
+    Cars are 'vehicle', logs are 'log', and the exits and openings of a hedge are
+    'exit' and 'opening'.  The result is a list of (object, layer) tuples.
+
+    Parameter level: the level to collect objects from
+    Precondition: level is a Level
+    """
+    result = []
+    for lane in level._lanes:
+        if isinstance(lane,Road):
+            result.extend((car,'vehicle') for car in lane.carPos())
+        elif isinstance(lane,Water):
+            result.extend((log,'log') for log in lane.getLogs())
+        elif isinstance(lane,Hedge):
+            result.extend((exit,'exit') for exit in lane.getExits())
+            result.extend((opening,'opening') for opening in lane.getOpenings())
+    return result
+
+
+def bench_broadphase(name,frames=BENCHMARK_FRAMES,grid=True):
+    """
+    Measures the time to find every pair of overlapping lane objects each frame.
+
+    Each frame, every lane is updated and its objects placed.  Then every lane object
+    (and the frog) is tested against every other, either with a GBroadphase (which
+    is refreshed each frame, and the refresh is timed) or with a loop over all of the
+    objects.  Only the tests are timed.
+
+    Returns a dictionary with the number of objects, the number of colliding pairs
+    found per frame, and the seconds per frame.
+
+    Parameter name: the level file
+    Precondition: name is a string naming a level file
+
+    Parameter frames: the number of frames to measure
+    Precondition: frames is an int > 0
+
+    Parameter grid: True to use a GBroadphase, False to test every pair
+    Precondition: grid is a bool
+    """
+    level = Level(load_level(name),load_level(OBJECT_DATA))
+    input = HeadlessInput()
+    objects = _layers(level)+[(level.getFrog(),'frog')]
+    phase = GBroadphase(2*GRID_SIZE)
+    for (obj,layer) in objects:
+        phase.add(obj,layer)
+
+    found = 0
+    seconds = 0
+    for frame in range(frames):
+        for lane in level._lanes:
+            lane.update(input,SIMULATION_DT)
+            lane.getObjects()
+
+        start = time.perf_counter()
+        if grid:
+            phase.refresh()
+            for (obj,layer) in objects:
+                found += len(phase.query(obj))
+        else:
+            for (obj,layer) in objects:
+                for (other,kind) in objects:
+                    if not other is obj and obj.collides(other):
+                        found += 1
+        seconds += time.perf_counter()-start
+
+    return {'objects': len(objects), 'found': found/frames, 'seconds': seconds/frames}
+
+
+def report_broadphase(options):
+    """
+    Runs bench_broadphase from the command line, with and without the broadphase.
+
+    Parameter options: the parsed command line arguments
+    Precondition: options has attributes level and frames
+    """
+    for grid in (False,True):
+        result = bench_broadphase(options.level,options.frames,grid)
+        print('%s: %.3f ms per frame for %d objects, %.1f collisions per frame'
+              % ('GBroadphase' if grid else 'every pair',1000*result['seconds'],
+                 result['objects'],result['found']))
+
+
+def bench_many(name,frames=BENCHMARK_FRAMES,vectorized=True):
+    """
+    Measures the time to test the frog against every car and every log each frame.
+
+    Each frame, every lane is updated and its objects placed.  Then the frog is tested
+    for collision with every car in the level, and its center is tested against every
+    log, either one object at a time or with collides_many and contains_many.  Only
+    the tests are timed.
+
+    Returns a dictionary with the number of cars and logs, and the seconds per frame.
+
+    Parameter name: the level file
+    Precondition: name is a string naming a level file
+
+    Parameter frames: the number of frames to measure
+    Precondition: frames is an int > 0
+
+    Parameter vectorized: True to use collides_many and contains_many
+    Precondition: vectorized is a bool
+    """
+    level = Level(load_level(name),load_level(OBJECT_DATA))
+    input = HeadlessInput()
+    frog = level.getFrog()
+    cars = [obj for (obj,layer) in _layers(level) if layer == 'vehicle']
+    logs = [obj for (obj,layer) in _layers(level) if layer == 'log']
+
+    seconds = 0
+    for frame in range(frames):
+        for lane in level._lanes:
+            lane.update(input,SIMULATION_DT)
+            lane.getObjects()
+
+        point = (frog.x,frog.y)
+        start = time.perf_counter()
+        if vectorized:
+            collides_many(frog,cars)
+            contains_many(point,logs)
+        else:
+            [frog.collides(car) for car in cars]
+            [log.contains(point) for log in logs]
+        seconds += time.perf_counter()-start
+
+    return {'cars': len(cars), 'logs': len(logs), 'seconds': seconds/frames}
+
+
+def bench_crowd(count,frames=BENCHMARK_FRAMES,vectorized=True):
+    """
+    Measures the time to test a point against a crowd of rectangles.
+
+    The crowd is count rectangles in rows across the window.  Each frame a point is 
+    tested against every rectangle in the crowd.  When vectorized is True, the test 
+    uses the numpy path of contains_many for any count (its threshold is turned off), 
+    so that the two can be compared at every size.
+
+    Returns the seconds per frame.
+
+    Parameter count: the number of rectangles in the crowd
+    Precondition: count is an int > 0
+
+    Parameter frames: the number of frames to measure
+    Precondition: frames is an int > 0
+
+    Parameter vectorized: True to use the numpy path of contains_many
+    Precondition: vectorized is a bool
+    """
+    import game2d.gobject as gobject
+    crowd = [GRectangle(x=(37*pos) % 800,y=(23*pos) % 600,width=40,height=30)
+             for pos in range(count)]
+    point = (400,300)
+
+    limit = gobject.MANY_CONTAINS
+    if vectorized:
+        gobject.MANY_CONTAINS = 0
+    try:
+        start = time.perf_counter()
+        for frame in range(frames):
+            if vectorized:
+                contains_many(point,crowd)
+            else:
+                [item.contains(point) for item in crowd]
+        seconds = time.perf_counter()-start
+    finally:
+        gobject.MANY_CONTAINS = limit
+
+    return seconds/frames
+
+
+def report_many(options):
+    """
+    Runs bench_many from the command line, one at a time and vectorized.
+
+    It then runs bench_crowd for each size in BENCHMARK_CROWDS, to show the number of
+    objects at which numpy pays off.  The threshold MANY_CONTAINS in game2d/gobject.py 
+    is set from these results.
+
+    Parameter options: the parsed command line arguments
+    Precondition: options has attributes level and frames
+    """
+    for vectorized in (False,True):
+        result = bench_many(options.level,options.frames,vectorized)
+        print('%s: %.3f ms per frame for %d cars and %d logs'
+              % ('collides_many/contains_many' if vectorized else 'collides/contains',
+                 1000*result['seconds'],result['cars'],result['logs']))
+
+    print('contains for a crowd of rectangles, in ms per frame:')
+    for count in BENCHMARK_CROWDS:
+        frames = max(10,options.frames*8//count)
+        loop = bench_crowd(count,frames,False)
+        vect = bench_crowd(count,frames,True)
+        print('%5d: %.3f one at a time, %.3f with numpy (%.2fx)'
+              % (count,1000*loop,1000*vect,loop/vect))
+
+
+def bench_setters(name,frames=BENCHMARK_FRAMES):
+    """
+    Measures the time to move a GImage for every object in the level each frame.
+
+    The lane objects are LaneObjects, whose positions are plain attributes, so moving
+    them calls no game2d setter at all.  To measure the setters, each lane object gets
+    a GImage of the same image, size and hitbox (as the lanes used before they had
+    LaneObjects).  Each frame, every lane is updated, and then the x, y and angle of
+    each GImage are set to those of its lane object.  The frog is also turned and moved 
+    the way a hop does.  Only the setters are timed.  They check their values, unless 
+    game2d is in production mode (see game2d/checks.py).  See report_setters to 
+    compare the two.
+
+    Returns a dictionary with the number of objects moved and the seconds per frame.
+
+    Parameter name: the level file
+    Precondition: name is a string naming a level file
+
+    Parameter frames: the number of frames to measure
+    Precondition: frames is an int > 0
+    """
+    level = Level(load_level(name),load_level(OBJECT_DATA))
+    input = HeadlessInput()
+    frog = level.getFrog()
+    pairs = [(obj,GImage(source=obj.source,width=obj.width,height=obj.height,
+                         hitbox=obj.hitbox,x=obj.x,y=obj.y,angle=obj.angle))
+             for lane in level._lanes for obj in lane.getObjects()]
+
+    seconds = 0
+    for frame in range(frames):
+        for lane in level._lanes:
+            lane.update(input,SIMULATION_DT)
+            lane.getObjects()
+
+        start = time.perf_counter()
+        for (obj,image) in pairs:
+            image.x = obj.x
+            image.y = obj.y
+            image.angle = obj.angle
+        frog.setAngle(FROG_NORTH if frame % 2 else FROG_EAST)
+        frog.setX(frog.getX())
+        frog.setY(frog.getY())
+        seconds += time.perf_counter()-start
+
+    return {'objects': len(pairs)+1, 'seconds': seconds/frames}
+
+
+def _run_setters(name,frames,production):
+    """
+    Returns the result of bench_setters, run in a new Python process.
+
+    Production mode is chosen when game2d is imported, so each mode needs a process
+    of its own.
+
+    Parameter name: the level file
+    Precondition: name is a string naming a level file
+
+    Parameter frames: the number of frames to measure
+    Precondition: frames is an int > 0
+
+    Parameter production: True to run in production mode
+    Precondition: production is a bool
+    """
+    if os.path.isfile(name):
+        name = os.path.abspath(name)
+    env = dict(os.environ)
+    env['GAME2D_PRODUCTION'] = '1' if production else '0'
+    code = ('import benchmark; result = benchmark.bench_setters(%s,%d); '
+            'print(result["objects"],result["seconds"])' % (repr(name),frames))
+    folder = os.path.dirname(os.path.abspath(__file__))
+    output = subprocess.run([sys.executable,'-c',code],env=env,cwd=folder,check=True,
+                            stdout=subprocess.PIPE,universal_newlines=True).stdout
+    (objects,seconds) = output.split()
+    return {'objects': int(objects), 'seconds': float(seconds)}
+
+
+def report_setters(options):
+    """
+    Runs bench_setters from the command line, with and without the setter checks,
+    and prints the results side by side.
+
+    Each mode is run three times, taking turns, and the fastest run of each is kept,
+    so that a slow moment of the machine does not land on one mode only.
+
+    Parameter options: the parsed command line arguments
+    Precondition: options has attributes level and frames
+    """
+    checked = None
+    production = None
+    for run in range(3):
+        result = _run_setters(options.level,options.frames,False)
+        if checked is None or result['seconds'] < checked['seconds']:
+            checked = result
+        result = _run_setters(options.level,options.frames,True)
+        if production is None or result['seconds'] < production['seconds']:
+            production = result
+    print('%s: %d objects moved per frame' % (options.level,checked['objects']))
+    print('checked: %.3f ms per frame, production mode: %.3f ms per frame (%.0f%% of checked)'
+          % (1000*checked['seconds'],1000*production['seconds'],
+             100*production['seconds']/checked['seconds']))
+
+
+def bench_load(name,frames=BENCHMARK_FRAMES):
+    """
+    Measures the time and memory to load a level.
+
+    The level is built frames times from JSON data that is already loaded, so only
+    the construction of the level (its lanes, tiles, and objects) is timed.  The
+    memory is what one level keeps once it is built.
+
+    Returns a dictionary with the number of lane objects, the seconds per load, and
+    the bytes kept per level.
+
+    Parameter name: the level file
+    Precondition: name is a string naming a level file
+
+    Parameter frames: the number of times to load the level
+    Precondition: frames is an int > 0
+    """
+    data = load_level(name)
+    objects = load_level(OBJECT_DATA)
+    level = Level(data,objects)
+    count = sum(len(lane.getObjects()) for lane in level._lanes)
+    level = None
+
+    start = time.perf_counter()
+    for frame in range(frames):
+        Level(data,objects)
+    seconds = time.perf_counter()-start
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    level = Level(data,objects)
+    kept = tracemalloc.get_traced_memory()[0]-before
+    tracemalloc.stop()
+
+    return {'objects': count, 'seconds': seconds/frames, 'bytes': kept}
+
+
+def report_load(options):
+    """
+    Runs bench_load from the command line and prints the results.
+
+    Parameter options: the parsed command line arguments
+    Precondition: options has attributes level and frames
+    """
+    result = bench_load(options.level,options.frames)
+    print('%s: %.3f ms to load, %d bytes kept for %d lane objects'
+          % (options.level,1000*result['seconds'],result['bytes'],result['objects']))
+
+
+def _paused_label(make):
+    """
+    Makes the label that Froggit.update makes every frame while the game is paused.
+
+    Parameter make: the function that makes the label
+    Precondition: make is GLabel or GLabel.cached
+    """
+    return make(text="Press 'C' to Continue",font_size=ALLOY_SMALL,font_name=ALLOY_FONT,
+                linecolor='#FFFFFF',fillcolor='#0000ff',x=GAME_WIDTH//2,y=GAME_HEIGHT//2)
+
+
+def bench_labels(frames=BENCHMARK_FRAMES,cached=True):
+    """
+    Measures the cost of making the paused message label every frame.
+
+    The frames are first timed, and then played again while tracemalloc measures the
+    memory that has not been given back by the end.  With the label cache, both
+    should stay flat: only the first frame renders any text.
+
+    Returns a dictionary with the seconds per frame and the bytes kept per frame.
+
+    Parameter frames: the number of frames to measure
+    Precondition: frames is an int > 0
+
+    Parameter cached: True to use GLabel.cached, False to use the GLabel constructor
+    Precondition: cached is a bool
+    """
+    make = GLabel.cached if cached else GLabel
+    GLabel.clear_cache()
+
+    label = None
+    start = time.perf_counter()
+    for frame in range(frames):
+        label = _paused_label(make)
+    seconds = time.perf_counter()-start
+
+    label = None
+    GLabel.clear_cache()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for frame in range(frames):
+        label = _paused_label(make)
+    kept = tracemalloc.get_traced_memory()[0]-before
+    tracemalloc.stop()
+
+    return {'seconds': seconds/frames, 'bytes': kept/frames}
+
+
+def report_labels(options):
+    """
+    Runs bench_labels from the command line, with and without the label cache.
+
+    Parameter options: the parsed command line arguments
+    Precondition: options has the attribute frames
+    """
+    if HEADLESS:
+        print('The labels benchmark needs Kivy; set GAME2D_HEADLESS=0 to run it.')
+        return
+    for cached in (False,True):
+        result = bench_labels(options.frames,cached)
+        print('%s: %.3f ms per frame, %.1f bytes kept per frame'
+              % ('GLabel.cached' if cached else 'GLabel',1000*result['seconds'],result['bytes']))
+
+
+# The benchmarks, by name
+BENCHMARKS = {'queries': report_queries, 'labels': report_labels, 'draws': report_draws,
+              'transforms': report_transforms, 'broadphase': report_broadphase,
+              'many': report_many, 'setters': report_setters,
+              'load': report_load}
+
+
+def main(args=None):
+    """
+    Runs a benchmark from the command line.
+
+    Parameter args: the command line arguments (after the word bench)
+    Precondition: args is a list of strings, or None to use sys.argv
+    """
+    parser = argparse.ArgumentParser(prog='froggit bench',
+                                     description='Measure the per-frame cost of Froggit.')
+    parser.add_argument('benchmark',choices=sorted(BENCHMARKS),help='the benchmark to run')
+    parser.add_argument('level',nargs='?',default='complete.json',
+                        help='the level file (in the JSON folder, or a path)')
+    parser.add_argument('--frames',type=int,default=BENCHMARK_FRAMES,
+                        help='the number of frames to measure')
+    options = parser.parse_args(args)
+    BENCHMARKS[options.benchmark](options)
+    return 0
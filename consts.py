@@ -20,6 +20,8 @@ GAME_WIDTH  = 1024
 GAME_HEIGHT = 896
 # The size in pixels of a single grid square
 GRID_SIZE    = 64
+# The size in pixels of a cell in the lane occupancy tables (must divide GRID_SIZE)
+LANE_CELL    = GRID_SIZE//4
 
 
 ### FROG CONSTANTS ###
@@ -88,12 +90,22 @@ SPLAT_SOUND = 'splat.wav'
 TRILL_SOUND = 'trill.wav'
 
 
+### ANIMATION CONSTANTS ###
+
+# The number of times per second to update the game (0 updates once every frame)
+GAME_TICK = 60
+# The maximum number of updates in one frame when the game falls behind
+GAME_CATCHUP = 5
+
+
 ### JSON FILES ###
 
 # The default level file
 DEFAULT_LEVEL  = 'easy2.json'
 # The object data (hitboxes) file
 OBJECT_DATA    = 'objects.json'
+# The file to record the player input to (see replay.py), or None to not record
+RECORD_FILE    = None
 
 
 ### USE COMMAND LINE ARGUMENTS TO CHANGE DEFAULT LEVEL FILE AND FROG SPEED
@@ -109,6 +121,16 @@ you start the game.
 
 The second argument is the FROG_SPEED, which is the amount of time between move steps.  
 A large value means a much slower moving frog.
+
+The third argument is the GAME_TICK, which is the number of game updates per second.
+Use 30 on a slow computer, or 0 to update once every animation frame.
+
+The fourth argument is the RECORD_FILE.  If it is given, the player input is saved to
+this file so that the game can be replayed later with 'python froggit replay'.
+
+The third and fourth arguments are only read by __main__.py when it starts the game,
+since the other commands (like 'python froggit simulate') use these positions for 
+arguments of their own.
 """
 try:
     file = sys.argv[1]
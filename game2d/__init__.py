@@ -7,11 +7,18 @@ simpler for students in CS 1110.
 Author: Walker M. White (wmw2)
 Date:   August 1, 2017 (Python 3 version)
 """
-from .gobject import GObject, GScene
+from .headless import HEADLESS, HeadlessInput
+from .checks import CHECKED
+from .gtransform import GTransform
+from .gobject import GObject, GScene, collides_many, contains_many
 from .grectangle import GRectangle, GEllipse, GImage, GLabel
 from .gsprite import GSprite
 from .gtile import GTile
+from .gbatch import GBatch
+from .gbake import GBake
+from .gbroadphase import GBroadphase
 from .gpath import GPath, GTriangle, GPolygon
-from .gview import GInput, GView
+if not HEADLESS:
+    from .gview import GInput, GView
 from .sound import Sound, SoundLibrary
 from .app import GameApp
\ No newline at end of file
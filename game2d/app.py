@@ -7,15 +7,23 @@ The primary class for 2D game support.
 Author: Walker M. White (wmw2)
 Date:   August 1, 2017 (Python 3 version)
 """
-# Basic Kivy Modules
-import kivy
-import kivy.app
-
-# Lower-level kivy modules to support animation
-from kivy.config import Config
-from kivy.clock  import Clock
-from kivy.core.window import Window
-from kivy.logger import Logger
+from .headless import HEADLESS
+if HEADLESS:
+    # There is no window, so there is no application to build
+    import logging
+    Logger = logging.getLogger('game2d')
+    _Application = object
+else:
+    # Basic Kivy Modules
+    import kivy
+    import kivy.app
+    
+    # Lower-level kivy modules to support animation
+    from kivy.config import Config
+    from kivy.clock  import Clock
+    from kivy.core.window import Window
+    from kivy.logger import Logger
+    _Application = kivy.app.App
 
 import traceback
 import os.path
@@ -26,7 +34,7 @@ import sys
 import numpy
 
 
-class GameApp(kivy.app.App):
+class GameApp(_Application):
     """
     A controller class for a simple game application.
     
@@ -44,9 +52,15 @@ class GameApp(kivy.app.App):
     
     :meth:`draw`: This method draws all of the objects to the screen.  The only 
     thing you should have in this method are calls to ``self.view.draw()``.
+    
+    In headless mode (see :mod:`game2d.headless`) you cannot create a game window.
+    However, the class methods for finding and loading resources still work once
+    you call :meth:`set_root` with the application directory.
     """
     # Class attribute for tracking textures (to reduce memory footprint)
     TEXTURE_CACHE = {}
+    # Class attribute for the image atlas (False if not loaded yet, None if unavailable)
+    ATLAS = False
     
     
     # MUTABLE ATTRIBUTES
@@ -71,6 +85,51 @@ class GameApp(kivy.app.App):
         self._fps = value
         Clock.schedule_interval(self._refresh,1.0/self._fps)
     
+    @property
+    def tick(self):
+        """
+        The number of times per second to call :meth:`update`
+        
+        If this value is 0 (the default), :meth:`update` is called once per animation
+        frame with the time since the last frame.  Otherwise, the game is updated at a
+        fixed rate: every call to :meth:`update` gets the same ``dt`` of ``1/tick``
+        seconds, and a frame runs as many updates as are needed to catch up with the
+        clock (which may be none at all).  This makes the game behave the same on any
+        hardware, and lets a slow computer update less often (e.g. 30 times a second)
+        than it draws.  Use :attr:`alpha` in :meth:`draw` to smooth out the motion.
+        
+        **Invariant**: Must be an int or float >= 0.
+        """
+        return self._tick
+    
+    @tick.setter
+    def tick(self,value):
+        assert type(value) in [int,float], 'value %s is not a number' % repr(value)
+        assert value >= 0, 'value %s is negative' % repr(value)
+        self._tick = value
+        self._accum = 0.0
+        self._alpha = 1.0
+    
+    @property
+    def catchup(self):
+        """
+        The maximum number of updates in a single animation frame
+        
+        This value only matters if :attr:`tick` is not 0.  If a frame is so long that
+        the game needs more updates than this to catch up, the rest of the time is
+        dropped and the game slows down instead.  Otherwise, a slow update could make
+        the next frame longer, which needs even more updates, and so on.
+        
+        **Invariant**: Must be an int > 0.
+        """
+        return self._catchup
+    
+    @catchup.setter
+    def catchup(self,value):
+        assert type(value) == int, 'value %s is not an int' % repr(value)
+        assert value > 0, 'value %s is not positive' % repr(value)
+        self._catchup = value
+    
     @property
     def width(self):
         """
@@ -117,6 +176,20 @@ class GameApp(kivy.app.App):
         """
         return self._view
     
+    @property
+    def alpha(self):
+        """
+        The fraction of an update that has passed since the last call to :meth:`update`
+        
+        When :attr:`tick` is not 0, the screen is usually drawn part way between two
+        updates.  To draw smooth motion, :meth:`draw` should show each moving object 
+        this fraction of the way from where it was before the last update to where it
+        is now.  If :attr:`tick` is 0, this value is always 1.
+        
+        **Invariant**: Must be a float in 0..1.
+        """
+        return self._alpha
+    
     @property
     def input(self):
         """
@@ -213,6 +286,10 @@ class GameApp(kivy.app.App):
         has already been loaded, it will return the cached texture.  Otherwise, it will
         load the texture and cache it before returning it.
         
+        If the image is in the image atlas (see :meth:`load_atlas`), the texture is 
+        the region of the atlas page for that image, so that all of the images share
+        a few textures.
+        
         :param name: The file name
         :type name:  ``str``
         """
@@ -221,6 +298,16 @@ class GameApp(kivy.app.App):
             return None
         elif name in cls.TEXTURE_CACHE:
             return cls.TEXTURE_CACHE[name]
+        elif HEADLESS:
+            return None
+        
+        if cls.ATLAS is False:
+            cls.load_atlas()
+        key = os.path.splitext(name)[0]
+        if not cls.ATLAS is None and key in cls.ATLAS.textures:
+            texture = cls.ATLAS[key]
+            cls.TEXTURE_CACHE[name] = texture
+            return texture
         
         try:
             from kivy.core.image import Image
@@ -235,6 +322,35 @@ class GameApp(kivy.app.App):
         
         return texture
     
+    @classmethod
+    def load_atlas(cls):
+        """
+        Returns: The atlas for the **Images** folder, or None if it cannot be loaded
+        
+        The atlas packs every image into a few large textures (see :mod:`game2d.atlas`).
+        If the atlas is missing or older than the images, it is built first, which needs 
+        the Python Imaging Library.  If it cannot be built, the images are loaded as
+        separate textures instead.
+        """
+        from . import atlas
+        cls.ATLAS = None
+        if HEADLESS:
+            return None
+        
+        try:
+            if atlas.is_stale(cls.images):
+                Logger.info('GameApp: Building the image atlas.')
+                atlas.build_atlas(cls.images)
+            from kivy.atlas import Atlas
+            cls.ATLAS = Atlas(atlas.atlas_path(cls.images))
+        except:
+            Logger.info('GameApp: Images will not use an atlas.')
+            exc_type, exc_value, exc_tb = sys.exc_info()
+            items = traceback.format_exception(exc_type, exc_value, exc_tb)
+            Logger.info(items[-1].strip())
+        
+        return cls.ATLAS
+    
     @classmethod
     def unload_texture(cls,name):
         """
@@ -285,6 +401,32 @@ class GameApp(kivy.app.App):
                 data = None
         return data
     
+    @classmethod
+    def set_root(cls,path):
+        """
+        Sets the resource paths to the given application directory.
+        
+        The folders **JSON**, **Fonts**, **Sounds**, and **Images** are all expected to
+        be inside of this directory.  This method is called for you when the game
+        starts.  You only need to call it yourself in headless mode, where there is
+        no game window.
+        
+        :param path: The application directory
+        :type path:  ``str``
+        """
+        assert type(path) == str, '%s is not a valid path' % repr(path)
+        GameApp.json   = str(os.path.join(path, 'JSON'))
+        GameApp.fonts  = str(os.path.join(path, 'Fonts'))
+        GameApp.sounds = str(os.path.join(path, 'Sounds'))
+        GameApp.images = str(os.path.join(path, 'Images'))
+        GameApp.ATLAS  = False
+        
+        if not HEADLESS:
+            import kivy.resources
+            kivy.resources.resource_add_path(GameApp.fonts)
+            kivy.resources.resource_add_path(GameApp.sounds)
+            kivy.resources.resource_add_path(GameApp.images)
+    
     # BUILT-IN METHODS
     def __init__(self,**keywords):
         """
@@ -300,15 +442,23 @@ class GameApp(kivy.app.App):
         The game window will not show until you start the game. To start the game, use 
         the method ``run()``.
         
+        To update the game at a fixed rate, also provide the ``tick`` (and optionally 
+        the ``catchup``) attribute.
+        
         **You will never call the constructor or run yourself**.  That is handled for 
         you in the provided code.
         
         :param keywords: dictionary of keyword arguments 
         :type keywords:  keys are attribute names
         """
+        if HEADLESS:
+            raise RuntimeError('Module game2d cannot open a game window in headless mode')
+        
         w = keywords.pop('width', 0.0)
         h = keywords.pop('height', 0.0)
         f = keywords.pop('fps', 60.0)
+        t = keywords.pop('tick', 0)
+        c = keywords.pop('catchup', 5)
         
         assert type(w) in [int,float], 'width %s is not a number' % repr(w)
         assert type(h) in [int,float], 'height %s is not a number' % repr(h)
@@ -320,6 +470,8 @@ class GameApp(kivy.app.App):
         Window.size = (self.width,self.height)
         
         self._fps = f
+        self.tick = t
+        self.catchup = c
         
         x = keywords.pop('left', None)
         y = keywords.pop('top', None)
@@ -399,8 +551,8 @@ class GameApp(kivy.app.App):
         """
         Updates the state of the game one animation frame.
         
-        This method is called 60x a second (depending on the ``fps``) to provide on-screen 
-        animation. Any code that moves objects or processes user input (keyboard or mouse)
+        This method is called 60x a second (depending on the ``fps``, or the ``tick`` if
+        it is not 0) to provide on-screen animation. Any code that moves objects or processes user input (keyboard or mouse)
         goes in this method.
         
         Think of this method as the body of the loop.  You will need to add attributes
@@ -443,13 +595,33 @@ class GameApp(kivy.app.App):
         This method a callback-proxy for the methods `update` and `draw`.  It handles
         important issues behind the scenes, particularly with clearing the window.
         
+        If :attr:`tick` is not 0, this runs however many fixed updates are needed to 
+        catch up with the clock (up to :attr:`catchup`), and sets :attr:`alpha` before
+        drawing.
+        
         :param dt: time in seconds since last update
         :type dt:  ``int`` or ``float``
         """
         self.view.clear()
-        self.update(dt)
+        if self._tick == 0:
+            self.update(dt)
+            self.draw()
+            self.input.refresh()
+            return
+        
+        step = 1.0/self._tick
+        self._accum += dt
+        count = 0
+        while self._accum >= step and count < self._catchup:
+            self.update(step)
+            self.input.refresh()
+            self._accum -= step
+            count += 1
+        if self._accum >= step:
+            # Too far behind; drop the extra time rather than spiral
+            self._accum = self._accum % step
+        self._alpha = self._accum/step
         self.draw()
-        self.input.refresh()
     
     def _setpaths(self):
         """
@@ -462,14 +634,5 @@ class GameApp(kivy.app.App):
         
         path = os.path.abspath(inspect.getfile(self.__class__))
         path = os.path.dirname(path)
-        
-        GameApp.json   = str(os.path.join(path, 'JSON'))
-        GameApp.fonts  = str(os.path.join(path, 'Fonts'))
-        GameApp.sounds = str(os.path.join(path, 'Sounds'))
-        GameApp.images = str(os.path.join(path, 'Images'))
-        
-        import kivy.resources
-        kivy.resources.resource_add_path(GameApp.fonts)
-        kivy.resources.resource_add_path(GameApp.sounds)
-        kivy.resources.resource_add_path(GameApp.images)
+        GameApp.set_root(path)
 
@@ -0,0 +1,204 @@
+"""
+A module to pack the game images into texture atlases.
+
+Every image in the **Images** folder is normally its own texture, so drawing a frame
+binds a different texture for almost every object.  An atlas packs all of the images
+into one (or a few) large pages, and records the region of each image in a page.  The
+atlas is written in the Kivy ``.atlas`` format, so it can be loaded by
+:class:`kivy.atlas.Atlas`, and :meth:`GameApp.load_texture` returns the region of an
+image in place of a separate texture.  :class:`GImage`, :class:`GSprite` and
+:class:`GTile` all draw from these regions without any change.
+
+The atlas is built automatically when a game starts (if the Python Imaging Library is
+installed) and it is missing or older than the images.  It can also be built ahead of
+time with :func:`build_atlas`.  Building an atlas does not need Kivy, so it works in
+headless mode.
+"""
+import os
+import json
+
+# The folder (inside of Images) that holds the atlas
+ATLAS_FOLDER = 'atlas'
+# The name of the atlas file (and the prefix of its pages)
+ATLAS_NAME = 'images'
+# The width and height of each atlas page
+ATLAS_SIZE = 2048
+# The empty space around each image, so that filtering does not bleed between them
+ATLAS_PADDING = 2
+# The image file extensions that are packed into the atlas
+ATLAS_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.bmp')
+
+
+def atlas_path(folder):
+    """
+    Returns: The path of the atlas file for the given image folder
+
+    :param folder: The image folder
+    :type folder:  ``str``
+    """
+    return os.path.join(folder,ATLAS_FOLDER,ATLAS_NAME+'.atlas')
+
+
+def atlas_images(folder):
+    """
+    Returns: The sorted list of image files in the folder that belong in the atlas
+
+    Subfolders (including the atlas folder itself) are not searched.
+
+    :param folder: The image folder
+    :type folder:  ``str``
+    """
+    names = []
+    for name in sorted(os.listdir(folder)):
+        path = os.path.join(folder,name)
+        if os.path.isfile(path) and os.path.splitext(name)[1].lower() in ATLAS_EXTENSIONS:
+            names.append(name)
+    return names
+
+
+def is_stale(folder):
+    """
+    Returns: True if the atlas for the given image folder must be (re)built
+
+    The atlas is stale if it does not exist, or if any image is newer than it.
+
+    :param folder: The image folder
+    :type folder:  ``str``
+    """
+    path = atlas_path(folder)
+    if not os.path.isfile(path):
+        return True
+
+    built = os.path.getmtime(path)
+    for name in atlas_images(folder):
+        if os.path.getmtime(os.path.join(folder,name)) > built:
+            return True
+    return False
+
+
+def pack(sizes,size=ATLAS_SIZE,padding=ATLAS_PADDING):
+    """
+    Returns: The placement of rectangles of the given sizes on pages
+
+    The rectangles are packed onto shelves, tallest first.  The result is a dictionary
+    mapping each key of ``sizes`` to a (page,x,y) tuple, where (x,y) is the top left
+    corner of the rectangle (with y increasing downwards, as in an image file).
+
+    :param sizes: The rectangle sizes
+    :type sizes:  ``dict`` of keys to (width,height) tuples of ints
+
+    :param size: The width and height of each page
+    :type size:  ``int`` > 0
+
+    :param padding: The empty space around each rectangle
+    :type padding:  ``int`` >= 0
+    """
+    order = sorted(sizes,key=lambda key : (-sizes[key][1],-sizes[key][0],key))
+    result = {}
+    page = 0
+    x = y = padding
+    shelf = 0
+    for key in order:
+        w, h = sizes[key]
+        if w+2*padding > size or h+2*padding > size:
+            raise ValueError('%s is too large for an atlas page of size %d' % (repr(key),size))
+        if x+w+padding > size:
+            x = padding
+            y += shelf+padding
+            shelf = 0
+        if y+h+padding > size:
+            page += 1
+            x = y = padding
+            shelf = 0
+        result[key] = (page,x,y)
+        x += w+padding
+        shelf = max(shelf,h)
+    return result
+
+
+def build_atlas(folder,size=ATLAS_SIZE,padding=ATLAS_PADDING):
+    """
+    Returns: The path of the atlas built for the given image folder
+
+    This packs every image in the folder (see :func:`atlas_images`) into pages of
+    the given width (and at most the given height), and writes the pages and the
+    atlas file to the atlas folder.  The region of each image is named by its file
+    name, without the extension.
+
+    This method needs the Python Imaging Library (Pillow).
+
+    :param folder: The image folder
+    :type folder:  ``str``
+
+    :param size: The width and height of each page
+    :type size:  ``int`` > 0
+
+    :param padding: The empty space around each image
+    :type padding:  ``int`` >= 0
+    """
+    from PIL import Image
+
+    images = {}
+    for name in atlas_images(folder):
+        images[name] = Image.open(os.path.join(folder,name)).convert('RGBA')
+    places = pack({name : images[name].size for name in images},size,padding)
+
+    output = os.path.dirname(atlas_path(folder))
+    if not os.path.isdir(output):
+        os.makedirs(output)
+
+    # Trim each page to the height that it uses, to save texture memory
+    heights = []
+    for name in sorted(places):
+        page, x, y = places[name]
+        while page >= len(heights):
+            heights.append(0)
+        heights[page] = max(heights[page],y+images[name].size[1]+padding)
+    pages = [Image.new('RGBA',(size,height)) for height in heights]
+
+    # Kivy measures regions from the bottom of the page
+    regions = {}
+    for name in sorted(places):
+        page, x, y = places[name]
+        w, h = images[name].size
+        pages[page].paste(images[name],(x,y))
+        file = '%s-%d.png' % (ATLAS_NAME,page)
+        if not file in regions:
+            regions[file] = {}
+        regions[file][os.path.splitext(name)[0]] = [x, heights[page]-y-h, w, h]
+
+    for page in range(len(pages)):
+        pages[page].save(os.path.join(output,'%s-%d.png' % (ATLAS_NAME,page)))
+
+    path = atlas_path(folder)
+    with open(path,'w') as f:
+        json.dump(regions,f,indent=1,sort_keys=True)
+    return path
+
+
+def main(args=None,folder='Images'):
+    """
+    Builds the atlas from the command line and reports the regions it packed.
+
+    :param args: The command line arguments (after the word atlas)
+    :type args:  ``list`` of ``str``, or None to use sys.argv
+
+    :param folder: The default image folder
+    :type folder:  ``str``
+    """
+    import argparse
+    parser = argparse.ArgumentParser(prog='froggit atlas',
+                                     description='Pack the images into a texture atlas.')
+    parser.add_argument('folder',nargs='?',default=folder,help='the image folder')
+    parser.add_argument('--size',type=int,default=ATLAS_SIZE,help='the width of each page')
+    parser.add_argument('--padding',type=int,default=ATLAS_PADDING,
+                        help='the empty space around each image')
+    options = parser.parse_args(args)
+
+    path = build_atlas(options.folder,options.size,options.padding)
+    with open(path) as f:
+        regions = json.load(f)
+    for page in sorted(regions):
+        print('%s: %d images' % (page,len(regions[page])))
+    print('wrote %s' % path)
+    return 0
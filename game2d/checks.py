@@ -0,0 +1,32 @@
+"""
+Production mode for 2D game support.
+
+The setters of the game2d classes check every value that they are given, so that a
+mistake is caught where it is made and not several frames later.  These checks are
+not free; an object that moves every frame pays for them every frame.  In production
+mode the setters skip them.  Only game2d objects have these setters, so a game that
+moves lightweight objects of its own (such as the ``LaneObject`` of Froggit, which 
+GBatch draws) saves nothing on those.  Production mode is selected when the environment variable
+``GAME2D_PRODUCTION`` is set (to anything other than ``0``) before game2d is imported,
+or automatically when Python runs with ``-O``.
+
+A bad value in production mode is not caught, and may fail later in a less helpful
+way.  Develop with the checks on.
+"""
+import os
+
+
+def _is_checked():
+    """
+    Returns True if game2d should check the values given to setters.
+
+    :return: False if production mode is requested or Python is optimized
+    :rtype:  ``bool``
+    """
+    if not __debug__:
+        return False
+    return os.environ.get('GAME2D_PRODUCTION','0') in ('','0')
+
+
+# Whether or not the game2d setters check their values
+CHECKED = _is_checked()
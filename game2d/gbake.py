@@ -0,0 +1,187 @@
+"""
+A module to support shapes that are drawn once into a texture.
+
+Shapes that never change (like the tiles of a background) still cost something to draw
+every frame.  A bake draws a collection of shapes once into an offscreen framebuffer
+(a Kivy ``Fbo``), and after that draws the texture of that framebuffer as a single
+rectangle.  If the shapes change, or the framebuffer is lost (such as when the window
+changes size), call :meth:`GBake.refresh` to draw them again.
+"""
+from .headless import HEADLESS
+if not HEADLESS:
+    from kivy.graphics import *
+    from kivy.graphics.instructions import *
+    from kivy.metrics import dp
+from .gobject import GObject
+import math
+
+
+class GBake(object):
+    """
+    A class representing a collection of shapes drawn once into a single texture.
+
+    The bake covers the rectangle with the given ``left``, ``bottom``, ``width``, and
+    ``height``.  Any part of a shape outside of that rectangle is cut off.  The shapes
+    must not be drawn or attached anywhere else.  Use :meth:`attach` to put the bake
+    on a layer of a :class:`GView`.
+    """
+
+    # IMMUTABLE PROPERTIES
+    @property
+    def objects(self):
+        """
+        The shapes drawn into this bake.
+
+        **Invariant**: Value is a tuple of :class:`GObject` objects
+        """
+        return self._objects
+
+    @property
+    def left(self):
+        """
+        The left edge of this bake.
+
+        **Invariant**: Value is an ``int`` or ``float``
+        """
+        return self._left
+
+    @property
+    def bottom(self):
+        """
+        The bottom edge of this bake.
+
+        **Invariant**: Value is an ``int`` or ``float``
+        """
+        return self._bottom
+
+    @property
+    def width(self):
+        """
+        The width of this bake.
+
+        **Invariant**: Value is an ``int`` or ``float`` > 0
+        """
+        return self._width
+
+    @property
+    def height(self):
+        """
+        The height of this bake.
+
+        **Invariant**: Value is an ``int`` or ``float`` > 0
+        """
+        return self._height
+
+    # BUILT-IN METHODS
+    def __init__(self,**keywords):
+        """
+        Creates a new bake of the given shapes.
+
+        To use the constructor for this class, you should provide it with a list of
+        keyword arguments that initialize various attributes.  For example, to bake
+        the list ``tiles`` into a 400x300 texture, use the constructor::
+
+            GBake(objects=tiles,width=400,height=300)
+
+        The keywords ``width`` and ``height`` are required.  The keywords ``left`` and
+        ``bottom`` are optional (both are 0 by default).
+
+        :param keywords: dictionary of keyword arguments
+        :type keywords:  keys are attribute names, including 'width' and 'height'
+        """
+        if not 'width' in keywords:
+            raise ValueError("The 'width' argument must be specified.")
+        if not 'height' in keywords:
+            raise ValueError("The 'height' argument must be specified.")
+        objects = tuple(keywords['objects']) if 'objects' in keywords else ()
+        assert all(map(lambda x : isinstance(x,GObject), objects)), '%s has a non-shape' % repr(objects)
+        for key in ('width','height','left','bottom'):
+            value = keywords[key] if key in keywords else 0
+            assert type(value) in [int,float], '%s %s is not a number' % (key,repr(value))
+        assert keywords['width'] > 0 and keywords['height'] > 0, 'the size must be positive'
+
+        self._objects = objects
+        self._width = keywords['width']
+        self._height = keywords['height']
+        self._left = keywords['left'] if 'left' in keywords else 0
+        self._bottom = keywords['bottom'] if 'bottom' in keywords else 0
+        self._view = None
+        self._cache = None
+        self._fbo = None
+        self._reset()
+
+    # PUBLIC METHODS
+    def refresh(self):
+        """
+        Draws the shapes into the texture again.
+
+        If the bake is attached to a view, the new texture takes the place of the old
+        one.
+        """
+        self._reset()
+
+    def attach(self, view, layer):
+        """
+        Keeps this bake on a layer of the provided view until it is detached.
+
+        :param view: view to attach to
+        :type view:  :class:`GView`
+
+        :param layer: the layer to attach to
+        :type layer:  one of the strings in ``GView.LAYERS``
+        """
+        if not self._view is None and not self._view is view:
+            self.detach()
+        view.attach(self._cache,layer)
+        self._view = view
+
+    def detach(self):
+        """
+        Removes this bake from the view it is attached to.
+
+        Nothing happens if this bake is not attached.
+        """
+        if not self._view is None:
+            self._view.detach(self._cache)
+            self._view = None
+
+    # HIDDEN METHODS
+    def _reset(self):
+        """
+        Resets the drawing cache, drawing the shapes into a new framebuffer.
+
+        The framebuffer has one pixel per screen pixel (which may be more than one
+        per point, on a high resolution display), so the texture is as sharp as the
+        shapes would be.
+        """
+        if HEADLESS:
+            self._cache = None
+            return
+
+        for shape in self._objects:
+            if not shape._view is None:
+                shape.detach()
+        if not self._fbo is None:
+            self._fbo.clear()
+
+        scale = dp(1)
+        size = (int(math.ceil(self._width*scale)),int(math.ceil(self._height*scale)))
+        fbo = Fbo(size=size)
+        fbo.add(ClearColor(0,0,0,0))
+        fbo.add(ClearBuffers())
+        fbo.add(PushMatrix())
+        fbo.add(Scale(scale,scale,1))
+        fbo.add(Translate(-self._left,-self._bottom,0))
+        for shape in self._objects:
+            fbo.add(shape._cache)
+        fbo.add(PopMatrix())
+        self._fbo = fbo
+
+        old = self._cache if not self._view is None else None
+        self._cache = InstructionGroup()
+        self._cache.add(fbo)
+        self._cache.add(Color(1,1,1))
+        self._cache.add(Rectangle(pos=(self._left,self._bottom),size=(self._width,self._height),
+                                  texture=fbo.texture))
+        if not old is None:
+            self._view._replace(old,self._cache)
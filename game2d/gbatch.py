@@ -0,0 +1,309 @@
+"""
+A module to support batched drawing of many images.
+
+Every :class:`GImage` has its own drawing instructions: a transform, a color, and a
+rectangle.  That is fine for a few images, but the cost adds up for a large number of
+images that move together (like the cars in a lane).  A batch draws a whole collection
+of images as a single Kivy ``Mesh`` for each texture they use.  Combined with the image
+atlas (see :mod:`game2d.atlas`), that is usually a single mesh.
+
+The batch copies the position, size, angle and scale of each image into the mesh when
+it is created, and again each time :meth:`GBatch.refresh` is called, in a single pass.
+If the images all move together, it is even cheaper to leave them alone and just move
+the batch, with the attribute ``x``.  The attribute ``wrap`` draws the batch a second
+time, one ``wrap`` to the left, so that images that move off one side come back on the
+other without touching the mesh at all.
+
+Call :meth:`GBatch.cull` each frame with the edges of the window to leave out the images
+that are entirely off screen.  The attribute ``drawn`` is the number of images drawn.
+"""
+from .headless import HEADLESS
+from .checks import CHECKED
+if HEADLESS:
+    from .headless import Translate
+else:
+    from kivy.graphics import *
+    from kivy.graphics.instructions import *
+from .app import GameApp
+import math
+
+
+class GBatch(object):
+    """
+    A class representing a collection of images drawn as a single mesh.
+
+    The images are only used to build the mesh; they are not drawn themselves.  The
+    ``fillcolor`` and ``linecolor`` of the images are ignored, so every image is drawn
+    untinted and without a border.  In fact, an image does not have to be a
+    :class:`GImage` at all.  Any object with the attributes ``source``, ``x``, ``y``,
+    ``width``, ``height``, ``angle`` and ``scale`` can be drawn, which lets a game draw
+    lightweight objects that have no drawing instructions of their own.  Use
+    :meth:`attach` to put the batch on a layer of a :class:`GView`.
+    """
+
+    # IMMUTABLE PROPERTIES
+    @property
+    def images(self):
+        """
+        The images drawn by this batch.
+
+        **Invariant**: Value is a tuple of :class:`GImage` (or similar) objects
+        """
+        return self._images
+
+    @property
+    def drawn(self):
+        """
+        The number of images drawn, counting both copies if ``wrap`` is not 0.
+        
+        This is the number of images left after the last call to :meth:`cull`.  If
+        the batch has never been culled, every image is drawn.
+
+        **Invariant**: Value is an int >= 0
+        """
+        return self._drawn
+
+    # MUTABLE PROPERTIES
+    @property
+    def x(self):
+        """
+        The horizontal offset of the batch.
+
+        Every image is drawn this far to the right of its own position (as of the
+        last :meth:`refresh`).  Changing this value does not touch the mesh.
+
+        **Invariant**: Value must be an ``int`` or ``float``
+        """
+        return self._trans.x
+
+    @x.setter
+    def x(self,value):
+        if CHECKED:
+            assert type(value) in [int,float], '%s is not a number' % repr(value)
+        self._trans.x = float(value)
+        self._wrapped.x = float(value)-self._wrap
+
+    @property
+    def wrap(self):
+        """
+        The distance to the second copy of the batch, or 0 for no second copy.
+
+        If this is not 0, every image is also drawn ``wrap`` to the left of where it
+        would be drawn otherwise.
+
+        **Invariant**: Value must be an ``int`` or ``float`` >= 0
+        """
+        return self._wrap
+
+    @wrap.setter
+    def wrap(self,value):
+        if CHECKED:
+            assert type(value) in [int,float], '%s is not a number' % repr(value)
+            assert value >= 0, '%s is negative' % repr(value)
+        self._wrap = float(value)
+        self._wrapped.x = self._trans.x-self._wrap
+        if self._defined:
+            self._reset()
+
+    # BUILT-IN METHODS
+    def __init__(self,**keywords):
+        """
+        Creates a new batch of images.
+
+        To use the constructor for this class, you should provide it with a list of
+        keyword arguments that initialize various attributes.  For example, to draw
+        the images in the list ``cars`` as one mesh, use the constructor::
+
+            GBatch(images=cars)
+
+        The keywords ``x`` and ``wrap`` are optional.
+
+        :param keywords: dictionary of keyword arguments
+        :type keywords:  keys are attribute names
+        """
+        self._defined = False
+        self._view = None
+        self._meshes = []
+        images = tuple(keywords['images']) if 'images' in keywords else ()
+        assert all(map(lambda x : hasattr(x,'source') and hasattr(x,'scale'), images)), '%s has a non-image' % repr(images)
+        self._images = images
+        self._extents = ()
+        self._visible = [None,None]
+        self._drawn = 0
+        self._trans = Translate(0,0,0)
+        self._wrapped = Translate(0,0,0)
+        self._wrap = 0.0
+        self.wrap = keywords['wrap'] if 'wrap' in keywords else 0
+        self.x = keywords['x'] if 'x' in keywords else 0
+        self._measure()
+        self._reset()
+        self._defined = True
+
+    # PUBLIC METHODS
+    def refresh(self):
+        """
+        Copies the current position, size, angle and scale of every image to the mesh.
+
+        This is a single pass over the images.  The textures of the images are not
+        checked again, so if the ``source`` of an image changes, make a new batch.
+        """
+        self._measure()
+        for (mesh,entries,copy) in self._meshes:
+            mesh.vertices = self._vertices(entries)
+    
+    def cull(self,left,right):
+        """
+        Returns: The number of images drawn after leaving out those that are off screen
+        
+        An image is left out of a copy of the batch if its bounding box (as of the 
+        last :meth:`refresh`, moved by the offset of that copy) is entirely to the left 
+        of ``left`` or to the right of ``right``.  The mesh is only changed if the set 
+        of images on screen has changed since the last call.
+        
+        :param left: The left edge of the window
+        :type left:  ``int`` or ``float``
+        
+        :param right: The right edge of the window
+        :type right:  ``int`` or ``float``
+        """
+        shifts = [self._trans.x]
+        if self._wrap > 0:
+            shifts.append(self._trans.x-self._wrap)
+        
+        drawn = 0
+        for copy in range(len(shifts)):
+            shift = shifts[copy]
+            visible = tuple(extent[1]+shift > left and extent[0]+shift < right
+                            for extent in self._extents)
+            drawn += sum(visible)
+            if visible != self._visible[copy]:
+                self._visible[copy] = visible
+                for (mesh,entries,which) in self._meshes:
+                    if which == copy:
+                        mesh.indices = self._indices(entries,visible)
+        self._drawn = drawn
+        return drawn
+
+    def attach(self, view, layer):
+        """
+        Keeps this batch on a layer of the provided view until it is detached.
+
+        :param view: view to attach to
+        :type view:  :class:`GView`
+
+        :param layer: the layer to attach to
+        :type layer:  one of the strings in ``GView.LAYERS``
+        """
+        if not self._view is None and not self._view is view:
+            self.detach()
+        view.attach(self._cache,layer)
+        self._view = view
+
+    def detach(self):
+        """
+        Removes this batch from the view it is attached to.
+
+        Nothing happens if this batch is not attached.
+        """
+        if not self._view is None:
+            self._view.detach(self._cache)
+            self._view = None
+
+    # HIDDEN METHODS
+    def _reset(self):
+        """
+        Resets the drawing cache.
+
+        The images are grouped by texture (regions of the same atlas page count as
+        the same texture), and each group becomes one mesh.
+        """
+        copies = [self._trans,self._wrapped] if self._wrap > 0 else [self._trans]
+        self._visible = [None,None]
+        self._drawn = len(self._images)*len(copies)
+        if HEADLESS:
+            self._cache = None
+            return
+
+        groups = {}
+        order = []
+        for index in range(len(self._images)):
+            image = self._images[index]
+            texture = GameApp.load_texture(image.source)
+            key = None if texture is None else texture.id
+            if not key in groups:
+                groups[key] = (texture,[])
+                order.append(key)
+            groups[key][1].append((index,image,texture))
+
+        old = self._cache if not self._view is None else None
+        self._meshes = []
+        self._cache = InstructionGroup()
+        for copy in range(len(copies)):
+            self._cache.add(PushMatrix())
+            self._cache.add(copies[copy])
+            self._cache.add(Color(1,1,1))
+            for key in order:
+                (texture,entries) = groups[key]
+                mesh = Mesh(vertices=self._vertices(entries),indices=self._indices(entries,None),
+                            mode='triangles',texture=texture)
+                self._meshes.append((mesh,entries,copy))
+                self._cache.add(mesh)
+            self._cache.add(PopMatrix())
+        if not old is None:
+            self._view._replace(old,self._cache)
+
+    def _measure(self):
+        """
+        Computes the horizontal extent (left,right) of the bounding box of each image.
+        """
+        extents = []
+        for image in self._images:
+            (sx,sy) = image.scale
+            radians = math.radians(image.angle)
+            half = (abs(math.cos(radians))*image.width*sx+abs(math.sin(radians))*image.height*sy)/2.0
+            extents.append((image.x-half,image.x+half))
+        self._extents = tuple(extents)
+
+    def _indices(self,entries,visible):
+        """
+        Returns the mesh indices that draw the given images.
+
+        :param entries: the images in the mesh, each with its position in ``images``
+        :type entries:  ``list`` of (``int``, :class:`GImage`, ``Texture``) tuples
+
+        :param visible: whether to draw each image, by its position in ``images``
+        :type visible:  ``tuple`` of ``bool``, or None to draw every image
+        """
+        indx = []
+        for pos in range(len(entries)):
+            if visible is None or visible[entries[pos][0]]:
+                quad = 4*pos
+                indx.extend([quad,quad+1,quad+2,quad+2,quad+3,quad])
+        return indx
+
+    def _vertices(self,entries):
+        """
+        Returns the mesh vertices for the given images.
+
+        Each image is four vertices (x, y, u, v), in the order bottom left, bottom
+        right, top right, top left.
+
+        :param entries: the images in the mesh, each with its position and texture
+        :type entries:  ``list`` of (``int``, :class:`GImage`, ``Texture``) tuples
+        """
+        vert = []
+        for (index,image,texture) in entries:
+            (sx,sy) = image.scale
+            w = image.width*sx/2.0
+            h = image.height*sy/2.0
+            radians = math.radians(image.angle)
+            c = math.cos(radians)
+            s = math.sin(radians)
+            x = image.x
+            y = image.y
+            uv = texture.tex_coords if not texture is None else (0,0,1,0,1,1,0,1)
+            vert.extend([x-c*w+s*h, y-s*w-c*h, uv[0], uv[1],
+                         x+c*w+s*h, y+s*w-c*h, uv[2], uv[3],
+                         x+c*w-s*h, y+s*w+c*h, uv[4], uv[5],
+                         x-c*w-s*h, y-s*w+c*h, uv[6], uv[7]])
+        return vert
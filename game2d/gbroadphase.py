@@ -0,0 +1,347 @@
+"""
+A module to support collision detection among many objects.
+
+:meth:`GObject.collides` tests a single pair of objects.  Finding every object that
+collides with another this way means testing it against everything in the game.  A
+broadphase keeps the objects in a uniform grid, so that only the objects in the cells
+under the bounding box of an object are tested.  The cost of a query depends on the
+number of objects nearby, not the number of objects in the game.
+
+Every object in a broadphase has a layer (a name such as ``'vehicle'`` or ``'log'``)
+and a mask (the layers that it collides with).  Two objects are only tested against
+each other if each is in the mask of the other, so a log never needs to be tested
+against a car.
+
+The broadphase does not know when an object moves.  Call :meth:`GBroadphase.refresh`
+once the objects have moved (such as once per animation frame), or
+:meth:`GBroadphase.move` if only one has.
+"""
+from .gobject import GObject
+
+
+class GBroadphase(object):
+    """
+    A class representing a uniform grid of objects for fast collision queries.
+
+    The objects are filed in every cell of the grid that their bounding box (including
+    the hitbox) covers.  Candidates from those cells are then tested exactly with
+    :meth:`GObject.collides`.  So, as with that method, an object may also be anything
+    with an ``angle``, a ``_bbox`` method, and a ``collides`` method.
+    """
+
+    # IMMUTABLE PROPERTIES
+    @property
+    def cell(self):
+        """
+        The width (and height) of each cell of the grid.
+
+        **Invariant**: Value is an ``int`` or ``float`` > 0
+        """
+        return self._cell
+
+    @property
+    def layers(self):
+        """
+        The names of the layers that have been used, in the order first used.
+
+        **Invariant**: Value is a tuple of strings
+        """
+        return tuple(self._order)
+
+    # BUILT-IN METHODS
+    def __init__(self,cell=64):
+        """
+        Creates a new, empty broadphase.
+
+        A good cell size is about the size of the typical object.  Much smaller, and
+        each object is filed in many cells.  Much larger, and each cell holds objects
+        that are not really nearby.
+
+        :param cell: the width (and height) of each cell of the grid
+        :type cell:  ``int`` or ``float`` > 0
+        """
+        assert type(cell) in [int,float], '%s is not a number' % repr(cell)
+        assert cell > 0, '%s is not positive' % repr(cell)
+        self._cell = cell
+        self._bits = {}
+        self._order = []
+        self._grid = {}
+        # Each entry is [object, layer bit, mask bits, box, cells, rank]
+        self._entries = {}
+        self._members = {}
+        self._rank = 0
+        self._reach = 0
+
+    def __len__(self):
+        """
+        Returns: The number of objects in this broadphase.
+        """
+        return len(self._entries)
+
+    def __contains__(self,obj):
+        """
+        Returns: True if obj is in this broadphase.
+
+        :param obj: the object to look for
+        :type obj:  any value
+        """
+        return obj in self._entries
+
+    # PUBLIC METHODS
+    def add(self,obj,layer,mask=None):
+        """
+        Adds an object to this broadphase on the given layer.
+
+        If the object is already in this broadphase, its layer and mask are changed.
+
+        :param obj: the object to add
+        :type obj:  :class:`GObject`
+
+        :param layer: the layer of the object
+        :type layer:  ``str``
+
+        :param mask: the layers that this object collides with (default every layer)
+        :type mask:  ``str``, a sequence of ``str``, or None
+        """
+        assert isinstance(obj,GObject) or hasattr(obj,'_bbox'), '%s is not an instance of GObject' % repr(obj)
+        assert type(layer) == str, '%s is not a string' % repr(layer)
+        if obj in self._entries:
+            self.remove(obj)
+
+        bit = self._bit(layer)
+        entry = [obj,bit,self._mask(mask),None,(),self._rank]
+        self._rank += 1
+        self._entries[obj] = entry
+        self._members[bit].append(entry)
+        self._file(entry)
+
+    def remove(self,obj):
+        """
+        Removes an object from this broadphase.
+
+        Nothing happens if the object is not in this broadphase.
+
+        :param obj: the object to remove
+        :type obj:  :class:`GObject`
+        """
+        if not obj in self._entries:
+            return
+        entry = self._entries.pop(obj)
+        self._members[entry[1]].remove(entry)
+        self._unfile(entry)
+
+    def clear(self):
+        """
+        Removes every object from this broadphase.
+
+        The layers are kept, so that their masks stay the same.
+        """
+        self._grid = {}
+        self._entries = {}
+        for bit in self._members:
+            self._members[bit] = []
+
+    def move(self,obj):
+        """
+        Files an object again, after it has moved or changed shape.
+
+        :param obj: the object that moved
+        :type obj:  :class:`GObject` in this broadphase
+        """
+        assert obj in self._entries, '%s is not in this broadphase' % repr(obj)
+        self._file(self._entries[obj])
+
+    def refresh(self):
+        """
+        Files every object that has moved or changed shape again.
+
+        An object is only filed again if its bounding box has changed.
+        """
+        for entry in self._entries.values():
+            if entry[0]._bbox() != entry[3]:
+                self._file(entry)
+
+    def query(self,obj,mask=None):
+        """
+        Returns: The objects in this broadphase that collide with obj.
+
+        The objects are returned as a list, in the order that they were added.  The
+        object itself is never part of the result.  The object does not have to be in
+        this broadphase; if it is, it must be filed where it is now (see :meth:`move`).
+
+        :param obj: the object to test
+        :type obj:  :class:`GObject`
+
+        :param mask: the layers to search (default the mask that obj was added with,
+            or every layer if obj is not in this broadphase)
+        :type mask:  ``str``, a sequence of ``str``, or None
+        """
+        assert isinstance(obj,GObject) or hasattr(obj,'_bbox'), '%s is not an instance of GObject' % repr(obj)
+        if mask is None and obj in self._entries:
+            bits = self._entries[obj][2]
+        else:
+            bits = self._mask(mask)
+
+        found = {}
+        for entry in self._nearby(self._search(obj,obj._bbox())):
+            if entry[1] & bits and not entry[0] is obj and obj.collides(entry[0]):
+                found[entry[5]] = entry[0]
+        return [found[rank] for rank in sorted(found)]
+
+    def pairs(self,layerA,layerB):
+        """
+        Returns: The pairs of colliding objects in the two layers.
+
+        Each pair is a tuple (a,b) with a in ``layerA`` and b in ``layerB``.  A pair is
+        only included if each object has the layer of the other in its mask.  If the
+        two layers are the same, each pair appears once.  The pairs are in the order
+        that their objects were added.
+
+        :param layerA: the layer of the first object in each pair
+        :type layerA:  ``str``
+
+        :param layerB: the layer of the second object in each pair
+        :type layerB:  ``str``
+        """
+        assert type(layerA) == str, '%s is not a string' % repr(layerA)
+        assert type(layerB) == str, '%s is not a string' % repr(layerB)
+        if not layerA in self._bits or not layerB in self._bits:
+            return []
+        bitA = self._bits[layerA]
+        bitB = self._bits[layerB]
+
+        result = []
+        for first in self._members[bitA]:
+            if not first[2] & bitB:
+                continue
+            found = {}
+            for entry in self._nearby(self._search(first[0],first[3])):
+                if (entry[1] == bitB and entry[2] & bitA
+                    and (bitA != bitB or entry[5] > first[5])
+                    and first[0].collides(entry[0])):
+                    found[entry[5]] = entry[0]
+            for rank in sorted(found):
+                result.append((first[0],found[rank]))
+        return result
+
+    # HIDDEN METHODS
+    def _bit(self,layer):
+        """
+        Returns: The bit for the given layer, making a new bit if necessary.
+
+        :param layer: the layer name
+        :type layer:  ``str``
+        """
+        if not layer in self._bits:
+            self._bits[layer] = 1 << len(self._order)
+            self._order.append(layer)
+            self._members[self._bits[layer]] = []
+        return self._bits[layer]
+
+    def _mask(self,mask):
+        """
+        Returns: The bits for the given layer names.
+
+        Layers that are not used yet are given bits, so that objects added to them
+        later are in the mask.
+
+        :param mask: the layer names, or None for every layer
+        :type mask:  ``str``, a sequence of ``str``, or None
+        """
+        if mask is None:
+            return -1
+        if type(mask) == str:
+            return self._bit(mask)
+        bits = 0
+        for layer in mask:
+            assert type(layer) == str, '%s is not a string' % repr(layer)
+            bits |= self._bit(layer)
+        return bits
+
+    def _search(self,obj,box):
+        """
+        Returns: The box to search for objects that obj might collide with.
+        
+        This is the bounding box of obj, unless obj is rotated by an angle that is not
+        a multiple of 90 degrees.  Then :meth:`GObject.collides` tests the sides of the 
+        other object against obj in its own (rotated) coordinates, which can report a 
+        collision with an object up to the size of that object outside of the box. So 
+        the box is grown by the size of the largest object in the grid.
+        
+        :param obj: the object to search around
+        :type obj:  :class:`GObject`
+
+        :param box: the bounding box (l,t,r,b) of obj
+        :type box:  ``tuple`` of four numbers, as given by :meth:`GObject._bbox`
+        """
+        if obj.angle % 90 == 0:
+            return box
+        (l,t,r,b) = box
+        reach = self._reach
+        return (l-reach,t+reach,r+reach,b-reach)
+
+    def _cells(self,box):
+        """
+        Returns: The grid cells (as (column,row) tuples) under the given box.
+
+        :param box: the bounding box (l,t,r,b)
+        :type box:  ``tuple`` of four numbers, as given by :meth:`GObject._bbox`
+        """
+        (l,t,r,b) = box
+        # The box of an object turned 90 or 270 degrees has the top below the bottom
+        (b,t) = (min(b,t),max(b,t))
+        size = self._cell
+        return tuple((column,row)
+                     for column in range(int(l//size),int(r//size)+1)
+                     for row in range(int(b//size),int(t//size)+1))
+
+    def _nearby(self,box):
+        """
+        Yields the entries filed in the grid cells under the given box.
+
+        An entry filed in more than one of these cells is only yielded once.
+
+        :param box: the bounding box (l,t,r,b)
+        :type box:  ``tuple`` of four numbers, as given by :meth:`GObject._bbox`
+        """
+        grid = self._grid
+        seen = set()
+        for key in self._cells(box):
+            if key in grid:
+                for entry in grid[key]:
+                    if not entry[5] in seen:
+                        seen.add(entry[5])
+                        yield entry
+
+    def _file(self,entry):
+        """
+        Files an entry in the grid cells under its current bounding box.
+
+        :param entry: the entry to file
+        :type entry:  a ``list`` from ``_entries``
+        """
+        box = entry[0]._bbox()
+        self._reach = max(self._reach,box[2]-box[0]+abs(box[1]-box[3]))
+        cells = self._cells(box)
+        if cells != entry[4]:
+            self._unfile(entry)
+            for key in cells:
+                if not key in self._grid:
+                    self._grid[key] = []
+                self._grid[key].append(entry)
+            entry[4] = cells
+        entry[3] = box
+
+    def _unfile(self,entry):
+        """
+        Removes an entry from the grid cells it is filed in.
+
+        :param entry: the entry to remove
+        :type entry:  a ``list`` from ``_entries``
+        """
+        for key in entry[4]:
+            cell = self._grid[key]
+            cell.remove(entry)
+            if not cell:
+                del self._grid[key]
+        entry[4] = ()
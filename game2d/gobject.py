@@ -8,9 +8,15 @@ These classes will not work unless you adhere to proper subclassing practices.
 Author: Walker M. White (wmw2)
 Date:   November 1, 2020
 """
-from kivy.graphics import *
-from kivy.graphics.instructions import *
-from introcs.geom import Point2, Matrix
+from .headless import HEADLESS
+from .checks import CHECKED
+if HEADLESS:
+    from .headless import Translate, Rotate, Scale, Color
+else:
+    from kivy.graphics import *
+    from kivy.graphics.instructions import *
+from introcs.geom import Point2
+from .gtransform import GTransform
 
 
 def is_color(c):
@@ -103,9 +109,11 @@ class GObject(object):
 
     @x.setter
     def x(self,value):
-        assert type(value) in [int,float], '%s is not a number' % repr(value)
+        if CHECKED:
+            assert type(value) in [int,float], '%s is not a number' % repr(value)
         self._trans.x = float(value)
         self._mtrue = False
+        self._box = None
 
     @property
     def y(self):
@@ -118,9 +126,31 @@ class GObject(object):
 
     @y.setter
     def y(self,value):
-        assert type(value) in [int,float], '%s is not a number' % repr(value)
+        if CHECKED:
+            assert type(value) in [int,float], '%s is not a number' % repr(value)
         self._trans.y = float(value)
         self._mtrue = False
+        self._box = None
+
+    @property
+    def shift(self):
+        """
+        The offset (dx,dy) from its position at which this shape is drawn.
+
+        This only changes where the shape is drawn.  It does not change ``x`` or ``y``,
+        and it is ignored by :meth:`contains` and :meth:`collides`.  It is useful to 
+        draw a shape part way between two positions without moving it.
+
+        **invariant**: Value must be a tuple of two ``int`` or ``float`` values
+        """
+        return (self._shift.x,self._shift.y)
+
+    @shift.setter
+    def shift(self,value):
+        if CHECKED:
+            assert is_num_tuple(value,2), '%s is not a tuple of two numbers' % repr(value)
+        self._shift.x = float(value[0])
+        self._shift.y = float(value[1])
 
     @property
     def width(self):
@@ -135,9 +165,11 @@ class GObject(object):
 
     @width.setter
     def width(self,value):
-        assert type(value) in [int,float], '%s is not a number' % repr(value)
-        assert value > 0, '%s is not positive' % repr(value)
+        if CHECKED:
+            assert type(value) in [int,float], '%s is not a number' % repr(value)
+            assert value > 0, '%s is not positive' % repr(value)
         self._width = float(value)
+        self._box = None
         if self._defined:
             self._reset()
 
@@ -154,9 +186,11 @@ class GObject(object):
 
     @height.setter
     def height(self,value):
-        assert type(value) in [int,float], '%s is not a number' % repr(value)
-        assert value > 0, '%s is not positive' % repr(value)
+        if CHECKED:
+            assert type(value) in [int,float], '%s is not a number' % repr(value)
+            assert value > 0, '%s is not positive' % repr(value)
         self._height = float(value)
+        self._box = None
         if self._defined:
             self._reset()
     
@@ -184,16 +218,18 @@ class GObject(object):
 
     @hitbox.setter
     def hitbox(self,value):
+        self._box = None
         if value is None:
             self._hitbox = None
             return
         
-        try:
-            size = len(value)
-        except:
-            size = 0
-        assert size == 4, '%s is not a tuple or list of size 4' % repr(value)
-        assert all(map(lambda x : type(x) in [int,float], value)), '%s has non-numerical elements' % repr(value)
+        if CHECKED:
+            try:
+                size = len(value)
+            except:
+                size = 0
+            assert size == 4, '%s is not a tuple or list of size 4' % repr(value)
+            assert all(map(lambda x : type(x) in [int,float], value)), '%s has non-numerical elements' % repr(value)
         self._hitbox = tuple(value)
 
     @property
@@ -216,8 +252,9 @@ class GObject(object):
     @scale.setter
     def scale(self,value):
         # Do some checking here
-        assert type(value) in [int,float] or is_num_tuple(value,2), \
-                '%s is not a valid scaling factor' % repr(value)
+        if CHECKED:
+            assert type(value) in [int,float] or is_num_tuple(value,2), \
+                    '%s is not a valid scaling factor' % repr(value)
         if type(value) in [int,float]:
             self._scale.x = float(value)
             self._scale.y = float(value)
@@ -225,6 +262,7 @@ class GObject(object):
             self._scale.x = float(value[0])
             self._scale.y = float(value[1])
         self._mtrue = False
+        self._box = None
 
     @property
     def angle(self):
@@ -239,12 +277,13 @@ class GObject(object):
 
     @angle.setter
     def angle(self,value):
-        import numpy as np
-        assert type(value) in [int,float], '%s is not a number' % repr(value)
-        diff = np.allclose([self._rotate.angle],[value])
+        if CHECKED:
+            assert type(value) in [int,float], '%s is not a number' % repr(value)
+        diff = abs(self._rotate.angle-value) <= 1e-08+1e-05*abs(value)
         self._rotate.angle = float(value)
         if not diff:
             self._mtrue = False
+            self._box = None
 
     @property
     def linecolor(self):
@@ -268,7 +307,8 @@ class GObject(object):
     @linecolor.setter
     def linecolor(self,value):
         import introcs
-        assert value is None or is_color(value), '%s is not a valid color' % repr(value)
+        if CHECKED:
+            assert value is None or is_color(value), '%s is not a valid color' % repr(value)
         if type(value) in [tuple, list] and len(value) == 3:
             value = list(value)+[1.0]
         elif type(value) in [introcs.RGB, introcs.HSV]:
@@ -306,7 +346,8 @@ class GObject(object):
     @fillcolor.setter
     def fillcolor(self,value):
         import introcs
-        assert value is None or is_color(value), '%s is not a valid color' % repr(value)
+        if CHECKED:
+            assert value is None or is_color(value), '%s is not a valid color' % repr(value)
         if type(value) in [tuple, list] and len(value) == 3:
             value = list(value)+[1.0]
         elif type(value) in [introcs.RGB, introcs.HSV]:
@@ -336,7 +377,8 @@ class GObject(object):
 
     @name.setter
     def name(self,value):
-        assert value is None or type(value) == str, '%s is not a valid name' % repr(value)
+        if CHECKED:
+            assert value is None or type(value) == str, '%s is not a valid name' % repr(value)
         self._name = value
 
     # DERIVED PROPERTIES
@@ -373,7 +415,8 @@ class GObject(object):
 
     @left.setter
     def left(self,value):
-        assert type(value) in [int,float], '%s is not a number' % repr(value)
+        if CHECKED:
+            assert type(value) in [int,float], '%s is not a number' % repr(value)
         diff = value-self.left
         self.x += diff
 
@@ -410,7 +453,8 @@ class GObject(object):
 
     @right.setter
     def right(self,value):
-        assert type(value) in [int,float], '%s is not a number' % repr(value)
+        if CHECKED:
+            assert type(value) in [int,float], '%s is not a number' % repr(value)
         diff = value-self.right
         self.x += diff
 
@@ -447,7 +491,8 @@ class GObject(object):
 
     @top.setter
     def top(self,value):
-        assert type(value) in [int,float], '%s is not a number' % repr(value)
+        if CHECKED:
+            assert type(value) in [int,float], '%s is not a number' % repr(value)
         diff = value-self.top
         self.y += diff
 
@@ -485,7 +530,8 @@ class GObject(object):
 
     @bottom.setter
     def bottom(self,value):
-        assert type(value) in [int,float], '%s is not a number' % repr(value)
+        if CHECKED:
+            assert type(value) in [int,float], '%s is not a number' % repr(value)
         diff = value-self.bottom
         self.y += diff
 
@@ -499,7 +545,7 @@ class GObject(object):
         This value is constructed dynamically as needed.  It should only be used
         internally in this package
 
-        **invariant**: Either a :class:`Matrix` or ``None``
+        **invariant**: Either a :class:`GTransform` or ``None``
         """
         if not self._mtrue or self._matrix is None:
             self._build_matrix()
@@ -513,11 +559,9 @@ class GObject(object):
         This value is constructed dynamically as needed.  It should only be used
         internally in this package
 
-        **invariant**: Either a :class:`Matrix` or ``None``
+        **invariant**: Either a :class:`GTransform` or ``None``
         """
-        if not self._mtrue or self._matrix is None:
-            self._build_matrix()
-        return self._invrse
+        return self.matrix.inverse()
 
 
     # BUILT-IN METHODS
@@ -543,10 +587,13 @@ class GObject(object):
         """
         # Set the properties.
         self._defined = False
+        self._view = None
+        self._box = None
 
         # Create the Kivy transforms for position and size
         self._mtrue  = False
         self._trans  = Translate(0,0,0)
+        self._shift  = Translate(0,0,0)
         self._rotate = Rotate(angle=0,axis=(0,0,1))
         self._scale  = Scale(1,1,1)
 
@@ -613,18 +660,18 @@ class GObject(object):
         
         This collision method takes hitboxes into account
         
+        The object may also be any object with an ``angle`` and a method ``_bbox`` (like 
+        the one in this class), such as a lightweight stand-in for a :class:`GImage`, as 
+        long as both it and this shape are rotated in 90 degree increments.
+        
         :param obj: the object to check for collision
         :type obj: :class:`GObject`
 
         :return: True if the shape collides with object
         :rtype:  ``bool``
         """
-        assert isinstance(obj,GObject), '%s is not an instance of GObject' % repr(object)
+        assert isinstance(obj,GObject) or hasattr(obj,'_bbox'), '%s is not an instance of GObject' % repr(obj)
         
-        # Get the hitboxes
-        h1 = (0,0,0,0) if self._hitbox is None else self._hitbox
-        h2 = (0,0,0,0) if obj._hitbox is None else obj._hitbox
-
         # Optimize for 90 degree turns
         if (self.angle % 360) in [0,90,180,270] and (obj.angle % 360) in [0,90,180,270]:
             (l0,t0,r0,b0) = obj._bbox()
@@ -633,6 +680,10 @@ class GObject(object):
             isy = b1 <= b0 <= t1 or b0 <= b1 <= t0
             return isx and isy
         
+        # Get the hitboxes
+        h1 = (0,0,0,0) if self._hitbox is None else self._hitbox
+        h2 = (0,0,0,0) if obj._hitbox is None else obj._hitbox
+        
         comp = obj.matrix*self.matrix.inverse()
         w = obj.width/2.0
         h = obj.height/2.0
@@ -708,7 +759,7 @@ class GObject(object):
             return self.inverse.transform(point)
         else:
             assert is_num_tuple(point,2), "%s is not a valid point" % repr(point)
-            p = self.inverse._transform(point[0],point[2])
+            p = self.inverse._transform(point[0],point[1])
             return Point2(p[0],p[1])
 
     def draw(self, view):
@@ -725,29 +776,70 @@ class GObject(object):
         except:
             raise IOError('Cannot draw %s since it was not initialized properly' % repr(self))
 
+    def attach(self, view, layer):
+        """
+        Keeps this shape on a layer of the provided view until it is detached.
+
+        Unlike :meth:`draw`, which must be called every animation frame, an attached
+        shape stays on screen.  Any change to its position, angle, or appearance 
+        shows up automatically.  A shape can only be attached to one view (and one
+        layer) at a time; attaching it again moves it.
+
+        :param view: view to attach to
+        :type view:  :class:`GView`
+
+        :param layer: the layer to attach to
+        :type layer:  one of the strings in ``GView.LAYERS``
+        """
+        if not self._view is None and not self._view is view:
+            self.detach()
+        try:
+            view.attach(self._cache,layer)
+        except AssertionError:
+            raise
+        except:
+            raise IOError('Cannot attach %s since it was not initialized properly' % repr(self))
+        self._view = view
+
+    def detach(self):
+        """
+        Removes this shape from the view it is attached to.
+
+        Nothing happens if this shape is not attached.
+        """
+        if not self._view is None:
+            self._view.detach(self._cache)
+            self._view = None
+
     # HIDDEN METHODS
     def _reset(self):
         """
         Resets the drawing cache.
+
+        If this shape is attached to a view, the new cache takes the place of the
+        old one.  In headless mode there is nothing to draw, so the cache is None.
         """
+        if HEADLESS:
+            self._cache = None
+            return
+        old = self._cache if not self._view is None else None
         self._cache = InstructionGroup()
         self._cache.add(PushMatrix())
         self._cache.add(self._trans)
+        self._cache.add(self._shift)
         self._cache.add(self._rotate)
         self._cache.add(self._scale)
+        if not old is None:
+            self._view._replace(old,self._cache)
 
     def _build_matrix(self):
         """
-        Builds the transform matrices after a settings change.
+        Builds the transform matrix after a settings change.
+        
+        The inverse is not built until it is needed (see :meth:`GTransform.inverse`).
         """
-        self._matrix = Matrix()
-        self._matrix.scale(self._scale.x,self._scale.y)
-        self._matrix.rotate(self._rotate.angle)
-        self._matrix.translate(self._trans.x,self._trans.y)
-        self._invrse = Matrix()
-        self._invrse.translate(-self._trans.x,-self._trans.y)
-        self._invrse.rotate(-self._rotate.angle)
-        self._invrse.scale(1.0/self._scale.x,1.0/self._scale.y)
+        self._matrix = GTransform(self._trans.x,self._trans.y,self._rotate.angle,
+                                  self._scale.x,self._scale.y)
         self._mtrue = True
 
     def _bbox(self):
@@ -757,9 +849,15 @@ class GObject(object):
         The bounding box is returned as a tuple (l,t,r,b). This function allows for 
         fast(er) collisions when the object is rotated in 90 degree increments.
         
+        The box is kept until the position, size, angle, scale, or hitbox changes, so 
+        an object that has not moved does not compute it again.
+        
         :return: The bounding box for the shape
         :rtype:  ``tuple`` of four ``float`` values
         """
+        if not self._box is None:
+            return self._box
+        
         oangle = self.angle % 360
         hit = (0,0,0,0) if self._hitbox is None else self._hitbox
         w = self.width/2
@@ -798,7 +896,8 @@ class GObject(object):
             b = min(p0[1],p1[1],p2[1],p3[1])
             t = max(p0[1],p1[1],p2[1],p3[1])
         
-        return (l,t,r,b)
+        self._box = (l,t,r,b)
+        return self._box
 
 
 #mark -
@@ -835,7 +934,8 @@ class GScene(GObject):
 
     @children.setter
     def children(self,value):
-        assert is_gobject_list(value), '%s is not a list of valid objects' % repr(value)
+        if CHECKED:
+            assert is_gobject_list(value), '%s is not a list of valid objects' % repr(value)
         self._children = list(value)
         if self._defined:
             self._reset()
@@ -932,11 +1032,103 @@ class GScene(GObject):
 
 
     # HIDDEN METHODS
+    def _bbox(self):
+        """
+        Returns: The axis-aligned bounding box for this scene
+        
+        The size of a scene depends on its children, which can move without telling 
+        the scene, so the box is never kept between calls.
+        
+        :return: The bounding box for the scene
+        :rtype:  ``tuple`` of four ``float`` values
+        """
+        self._box = None
+        return GObject._bbox(self)
+    
     def _reset(self):
         """
         Resets the drawing cache
         """
         GObject._reset(self)
+        if HEADLESS:
+            return
         for x in self.children:
             self._cache.add(x._cache)
         self._cache.add(PopMatrix())
+
+
+#mark -
+# The fewest objects for which contains_many uses numpy.  Measured with the crowds of 
+# 'python froggit bench many': numpy breaks even at about 8 rectangles and is faster 
+# from 16 on (about 4x by a few hundred).
+MANY_CONTAINS = 16
+
+
+def collides_many(obj,objs):
+    """
+    Checks whether an object collides with each of many others.
+    
+    The result is the same as ``[obj.collides(x) for x in objs]``, as a numpy array of 
+    booleans, so that it can be used in the same way as the result of 
+    :func:`contains_many`.  Each object is tested with :meth:`GObject.collides`.  The
+    bounding boxes used by that test are cached (see :meth:`GObject._bbox`), so testing 
+    them all at once with numpy is no faster, even for thousands of objects.
+    
+    :param obj: the object to check for collision
+    :type obj: :class:`GObject`
+    
+    :param objs: the objects to check against (see :meth:`GObject.collides`)
+    :type objs: a sequence of :class:`GObject`
+    
+    :return: For each object in objs, True if it collides with obj
+    :rtype:  numpy array of ``bool``
+    """
+    import numpy as np
+    assert isinstance(obj,GObject), '%s is not an instance of GObject' % repr(obj)
+    return np.array([obj.collides(x) for x in objs],dtype=bool)
+
+
+def contains_many(point,objs):
+    """
+    Checks whether each of many objects contains a point.
+    
+    The result is the same as ``[x.contains(point) for x in objs]``, as a numpy array of 
+    booleans.  A :class:`GObject` that is rotated in 90 degree increments, and that does 
+    not have its own ``contains`` (like :class:`GEllipse` does), is tested with its 
+    bounding box, all at once with numpy.  Any other object is tested with its own 
+    ``contains``.
+    
+    If fewer than ``MANY_CONTAINS`` objects can be tested with numpy, every object is 
+    tested with its own ``contains``, as that is faster.
+    
+    :param point: the point to check
+    :type point: :class:`Point2` or a pair of numbers
+    
+    :param objs: the objects to check
+    :type objs: a sequence of :class:`GObject`
+    
+    :return: For each object in objs, True if it contains the point
+    :rtype:  numpy array of ``bool``
+    """
+    import numpy as np
+    if isinstance(point,Point2):
+        point = (point.x,point.y)
+    assert is_num_tuple(point,2), "%s is not a valid point" % repr(point)
+    if len(objs) < MANY_CONTAINS:
+        return np.array([x.contains(point) for x in objs],dtype=bool)
+    
+    basic = GObject.contains
+    fast = [isinstance(x,GObject) and type(x).contains is basic 
+            and (x._rotate.angle % 360) in [0,90,180,270] for x in objs]
+    if sum(fast) < MANY_CONTAINS:
+        return np.array([x.contains(point) for x in objs],dtype=bool)
+    boxes = np.array([x._bbox() if ok else (0,0,0,0) for (x,ok) in zip(objs,fast)],
+                     dtype=float).reshape(-1,4)
+    
+    # The same test as GObject.contains
+    (x,y) = point
+    result = (boxes[:,0] <= x) & (x <= boxes[:,2]) & (boxes[:,3] <= y) & (y <= boxes[:,1])
+    for pos in range(len(objs)):
+        if not fast[pos]:
+            result[pos] = objs[pos].contains(point)
+    return result
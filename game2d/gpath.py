@@ -8,8 +8,11 @@ Author: Walker M. White (wmw2)
 Date:   August 1, 2017 (Python 3 version)
 """
 # Lower-level kivy modules to support animation
-from kivy.graphics import *
-from kivy.graphics.instructions import *
+from .headless import HEADLESS
+from .checks import CHECKED
+if not HEADLESS:
+    from kivy.graphics import *
+    from kivy.graphics.instructions import *
 from .gobject import GObject
 
 
@@ -117,8 +120,10 @@ class GPath(GObject):
     
     @points.setter
     def points(self,value):
-        assert is_point_tuple(value,2),'value %s is not a valid list of points' %  repr(value)
+        if CHECKED:
+            assert is_point_tuple(value,2),'value %s is not a valid list of points' %  repr(value)
         self._points = tuple(value)
+        self._box = None
         if self._defined:
             self._reset()
     
@@ -135,8 +140,9 @@ class GPath(GObject):
     
     @linewidth.setter
     def linewidth(self,value):
-        assert type(value) in [int,float], 'value %s is not a number' % repr(value)
-        assert value >= 0, 'value %s is negative' % repr(value)
+        if CHECKED:
+            assert type(value) in [int,float], 'value %s is not a number' % repr(value)
+            assert value >= 0, 'value %s is negative' % repr(value)
         self._linewidth = value
         if self._defined:
             self._reset()
@@ -255,6 +261,8 @@ class GPath(GObject):
         Resets the drawing cache
         """
         GObject._reset(self)
+        if HEADLESS:
+            return
         if not self._linecolor is None:
             self._cache.add(self._linecolor)
             line = Line(points=self.points,cap='round',joint='round',width=self.linewidth)
@@ -294,9 +302,11 @@ class GTriangle(GPath):
     
     @points.setter
     def points(self,value):
-        assert is_point_tuple(value,3),'value %s is not a valid list of points' %  repr(value)
-        assert len(value) == 6, 'value %s does not have the right length'  %  repr(value)
+        if CHECKED:
+            assert is_point_tuple(value,3),'value %s is not a valid list of points' %  repr(value)
+            assert len(value) == 6, 'value %s does not have the right length'  %  repr(value)
         self._points = tuple(value)
+        self._box = None
         if self._defined:
             self._reset()
     
@@ -354,6 +364,8 @@ class GTriangle(GPath):
         Resets the drawing cache
         """
         GObject._reset(self)
+        if HEADLESS:
+            return
         
         vertices = ()
         for x in range(3):
@@ -411,8 +423,10 @@ class GPolygon(GPath):
     
     @points.setter
     def points(self,value):
-        assert is_point_tuple(value,3),'value %s is not a valid list of points' %  repr(value)
+        if CHECKED:
+            assert is_point_tuple(value,3),'value %s is not a valid list of points' %  repr(value)
         self._points = tuple(value)
+        self._box = None
         if self._defined:
             self._reset()
     
@@ -453,7 +467,8 @@ class GPolygon(GPath):
     
     @source_width.setter
     def source_width(self,value):
-        assert value is None or type(value) in [int,float], 'value %s is not a valid width' % repr(value)
+        if CHECKED:
+            assert value is None or type(value) in [int,float], 'value %s is not a valid width' % repr(value)
         self._source_width = None
         if self._defined:
             self._reset()
@@ -478,7 +493,8 @@ class GPolygon(GPath):
     
     @source_height.setter
     def source_height(self,value):
-        assert value is None or _is_num(value), 'value %s is not a valid width' % repr(value)
+        if CHECKED:
+            assert value is None or _is_num(value), 'value %s is not a valid width' % repr(value)
         self._source_height = None
         if self._defined:
             self._reset()
@@ -576,6 +592,8 @@ class GPolygon(GPath):
         Resets the drawing cache
         """
         GObject._reset(self)
+        if HEADLESS:
+            return
         self._make_mesh()
         
         self._cache.add(self._fillcolor)
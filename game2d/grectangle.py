@@ -8,10 +8,13 @@ to draw shapes.
 Author: Walker M. White (wmw2)
 Date:   August 1, 2017 (Python 3 version)
 """
-from kivy.graphics import *
-from kivy.graphics.instructions import *
-from kivy.uix.label import Label
-from kivy.uix.image import Image
+from .headless import HEADLESS
+from .checks import CHECKED
+if not HEADLESS:
+    from kivy.graphics import *
+    from kivy.graphics.instructions import *
+    from kivy.uix.label import Label
+    from kivy.uix.image import Image
 from .gobject import GObject
 from .app import GameApp
 
@@ -43,8 +46,9 @@ class GRectangle(GObject):
     
     @linewidth.setter
     def linewidth(self,value):
-        assert type(value) in [int,float], '%s is not a number' % repr(value)
-        assert value >= 0, '%s is negative' % repr(value)
+        if CHECKED:
+            assert type(value) in [int,float], '%s is not a number' % repr(value)
+            assert value >= 0, '%s is negative' % repr(value)
         self._linewidth = value
         if self._defined:
             self._reset()
@@ -81,6 +85,8 @@ class GRectangle(GObject):
         Resets the drawing cache
         """
         GObject._reset(self)
+        if HEADLESS:
+            return
         x = -self.width/2.0
         y = -self.height/2.0
         
@@ -167,6 +173,8 @@ class GEllipse(GRectangle):
         Resets the drawing cache.
         """
         GObject._reset(self)
+        if HEADLESS:
+            return
         x = -self.width/2.0
         y = -self.height/2.0
         
@@ -217,7 +225,8 @@ class GImage(GRectangle):
 
     @source.setter
     def source(self,value):
-        assert value is None or GameApp.is_image(value), '%s is not an image file' % repr(value)
+        if CHECKED:
+            assert value is None or GameApp.is_image(value), '%s is not an image file' % repr(value)
         self._source = value
         if self._defined:
             self._reset()
@@ -254,6 +263,8 @@ class GImage(GRectangle):
         Resets the drawing cache.
         """
         GObject._reset(self)
+        if HEADLESS:
+            return
         
         self._texture = GameApp.load_texture(self.source)
         if not self._texture is None and (self.width == 0 or self.height == 0):
@@ -300,7 +311,16 @@ class GLabel(GRectangle):
     to the font by filename, including the .ttf. If you give no name, it will use the 
     default Kivy font.  The `bold` attribute only works for the default Kivy font; for 
     other fonts you will need the .ttf file for the bold version of that font.  See the
-    provided `ComicSans.ttf` and `ComicSansBold.ttf` for an example."""
+    provided `ComicSans.ttf` and `ComicSansBold.ttf` for an example.
+    
+    Making a label renders its text to a texture, which is slow.  If the same label is
+    made over and over (such as a message made every animation frame), use the class
+    method :meth:`cached` in place of the constructor.  That makes the label once and 
+    returns the same label, with the same texture and drawing instructions, after that."""
+    # Class attribute for sharing labels, keyed by their keyword arguments (but not position)
+    LABEL_CACHE = {}
+    # The most labels kept in LABEL_CACHE; the least recently used label goes first
+    LABEL_LIMIT = 32
     
     # MUTABLE PROPERTIES
     @property
@@ -313,7 +333,8 @@ class GLabel(GRectangle):
     
     @font_size.setter
     def font_size(self,value):
-        assert type(value) in [int,float], 'value %s is not a number' % repr(value)
+        if CHECKED:
+            assert type(value) in [int,float], 'value %s is not a number' % repr(value)
         self._fsize = value
         self._label.font_size = value
         self._label.texture_update()
@@ -347,7 +368,8 @@ class GLabel(GRectangle):
 
     @bold.setter
     def bold(self,value):
-        assert type(value) == bool, repr(value)+' is not a bool'
+        if CHECKED:
+            assert type(value) == bool, repr(value)+' is not a bool'
         self._label.bold = value
         self._label.texture_update()
 
@@ -365,7 +387,8 @@ class GLabel(GRectangle):
     
     @text.setter
     def text(self,value):
-        assert type(value) == str, 'value %s is not a string' % repr(value)
+        if CHECKED:
+            assert type(value) == str, 'value %s is not a string' % repr(value)
         self._label.text = value
         self._label.texture_update()
     
@@ -387,7 +410,8 @@ class GLabel(GRectangle):
     
     @halign.setter
     def halign(self,value):
-        assert value in ('left','right','center'), 'value %s is not a valid horizontal alignment' % repr(value)
+        if CHECKED:
+            assert value in ('left','right','center'), 'value %s is not a valid horizontal alignment' % repr(value)
         self._halign = value
         self._label.halign = value
         if self._defined:
@@ -411,7 +435,8 @@ class GLabel(GRectangle):
     
     @valign.setter
     def valign(self,value):
-        assert value in ('top','middle','bottom'), 'value %s is not a valid vertical alignment' % repr(value)
+        if CHECKED:
+            assert value in ('top','middle','bottom'), 'value %s is not a valid vertical alignment' % repr(value)
         self._valign = value
         self._label.valign = value
         if self._defined:
@@ -429,9 +454,11 @@ class GLabel(GRectangle):
     
     @x.setter
     def x(self,value):
-        assert type(value) in [int,float], 'value %s is not a number' % repr(value)
+        if CHECKED:
+            assert type(value) in [int,float], 'value %s is not a number' % repr(value)
         self._trans.x = float(value)
         self._mtrue = False
+        self._box = None
         self._hanchor = 'center'
         self._ha = value
     
@@ -445,9 +472,11 @@ class GLabel(GRectangle):
     
     @y.setter
     def y(self,value):
-        assert type(value) in [int,float], 'value %s is not a number' % repr(value)
+        if CHECKED:
+            assert type(value) in [int,float], 'value %s is not a number' % repr(value)
         self._trans.y = float(value)
         self._mtrue = False
+        self._box = None
         self._vanchor = 'center'
         self._hv = value
     
@@ -477,7 +506,8 @@ class GLabel(GRectangle):
     
     @left.setter
     def left(self,value):
-        assert type(value) in [int,float], 'value %s is not a number' % repr(value)
+        if CHECKED:
+            assert type(value) in [int,float], 'value %s is not a number' % repr(value)
         diff = value-self.left
         self.x += diff
         self._hanchor = 'left'
@@ -509,7 +539,8 @@ class GLabel(GRectangle):
     
     @right.setter
     def right(self,value):
-        assert type(value) in [int,float], 'value %s is not a number' % repr(value)
+        if CHECKED:
+            assert type(value) in [int,float], 'value %s is not a number' % repr(value)
         diff = value-self.right
         self.x += diff
         self._hanchor = 'right'
@@ -541,7 +572,8 @@ class GLabel(GRectangle):
     
     @top.setter
     def top(self,value):
-        assert type(value) in [int,float], 'value %s is not a number' % repr(value)
+        if CHECKED:
+            assert type(value) in [int,float], 'value %s is not a number' % repr(value)
         diff = value-self.top
         self.y += diff
         self._vanchor = 'top'
@@ -573,7 +605,8 @@ class GLabel(GRectangle):
     
     @bottom.setter
     def bottom(self,value):
-        assert type(value) in [int,float], 'value %s is not a number' % repr(value)
+        if CHECKED:
+            assert type(value) in [int,float], 'value %s is not a number' % repr(value)
         diff = value-self.bottom
         self.y += diff
         self._vanchor = 'bottom'
@@ -630,6 +663,67 @@ class GLabel(GRectangle):
         return '%s,text=%s,center=(%s,%s),angle=%s]' \
                 % (s,repr(self.text),repr(self.x),repr(self.y),repr(self.angle))
     
+    # CLASS METHODS
+    @classmethod
+    def cached(cls,**keywords):
+        """
+        Returns: A shared label made from the given keyword arguments
+        
+        The first time this is called with a set of keywords (the text, font, size, 
+        colors, and so on), it makes a new label and keeps it in ``LABEL_CACHE``.  After 
+        that, it returns that label again, without rendering the text.  The position 
+        keywords (``x``, ``y``, ``left``, ``right``, ``top`` and ``bottom``) are not part 
+        of this, as moving a label does not render it again.  Instead, they are set on 
+        the label each time it is returned.  The label is shared, so you should not change 
+        any of its other attributes.
+        
+        At most ``LABEL_LIMIT`` labels are kept.  When there are more, the label that was
+        used least recently is removed.
+        
+        :param keywords: dictionary of keyword arguments 
+        :type keywords:  keys are attribute names
+        """
+        style = {}
+        for name in keywords:
+            if not name in ('x','y','left','right','top','bottom'):
+                style[name] = keywords[name]
+        key = []
+        for name in sorted(style):
+            value = style[name]
+            key.append((name,tuple(value) if type(value) == list else value))
+        key = tuple(key)
+        
+        cache = cls.LABEL_CACHE
+        if key in cache:
+            label = cache.pop(key)
+        else:
+            label = cls(**style)
+            if len(cache) >= cls.LABEL_LIMIT:
+                del cache[next(iter(cache))]
+        cache[key] = label
+        
+        # Position the label as the constructor would
+        if 'left' in keywords and not 'x' in keywords:
+            label.left = keywords['left']
+        elif 'right' in keywords and not 'x' in keywords:
+            label.right = keywords['right']
+        else:
+            label.x = keywords['x'] if 'x' in keywords else 0
+        if 'bottom' in keywords and not 'y' in keywords:
+            label.bottom = keywords['bottom']
+        elif 'top' in keywords and not 'y' in keywords:
+            label.top = keywords['top']
+        else:
+            label.y = keywords['y'] if 'y' in keywords else 0
+        return label
+    
+    @classmethod
+    def clear_cache(cls):
+        """
+        Removes every label made by :meth:`cached`.
+        """
+        cls.LABEL_CACHE.clear()
+    
     # HIDDEN METHODS
     def _callback(self,instance=None,value=None):
         """
@@ -653,6 +747,7 @@ class GLabel(GRectangle):
         self._width  = max(self.width, self._label.width)
         self._height = max(self.height,self._label.height)
         self._defined = True
+        self._box = None
         
         # Reset the absolute anchor
         if self._hanchor == 'left':
@@ -9,8 +9,11 @@ by changing the current frame.
 Author: Walker M. White (wmw2)
 Date:   November 1, 2020
 """
-from kivy.graphics import *
-from kivy.graphics.instructions import *
+from .headless import HEADLESS
+from .checks import CHECKED
+if not HEADLESS:
+    from kivy.graphics import *
+    from kivy.graphics.instructions import *
 from .grectangle import GRectangle, GObject
 from .app import GameApp
 
@@ -33,7 +36,13 @@ class GSprite(GRectangle):
     
     If the image supports transparency, then this object can be used to represent irregular 
     shapes.  However, the :meth:`contains` method still treats this shape as a  rectangle.
+    
+    Sprites with the same source and format have the same frames.  The frame regions are 
+    cut out of the texture once and kept in ``REGION_CACHE``, so that making another 
+    sprite (such as a new frog) only looks them up.
     """
+    # Class attribute for sharing frame regions, keyed by (source,format)
+    REGION_CACHE = {}
     
     # IMMUTABLE PROPERTIES
     @property
@@ -57,7 +66,8 @@ class GSprite(GRectangle):
 
     @source.setter
     def source(self,value):
-        assert value is None or GameApp.is_image(value), '%s is not an image file' % repr(value)
+        if CHECKED:
+            assert value is None or GameApp.is_image(value), '%s is not an image file' % repr(value)
         self._source = value
         if self._defined:
             self._reset()
@@ -77,9 +87,10 @@ class GSprite(GRectangle):
     
     @format.setter
     def format(self,value):
-        assert type(value) in [tuple,list] and len(value) == 2, '%s does is not a tuple pair' % repr(value)
-        assert type(value[0]) == int and type(value[1]) == int, '%s does not have int values' % repr(value)
-        assert value[0] > 0 and value[1] > 0, '%s does not have valid values' % repr(value)
+        if CHECKED:
+            assert type(value) in [tuple,list] and len(value) == 2, '%s does is not a tuple pair' % repr(value)
+            assert type(value[0]) == int and type(value[1]) == int, '%s does not have int values' % repr(value)
+            assert value[0] > 0 and value[1] > 0, '%s does not have valid values' % repr(value)
         self._format = tuple(value)
         count = value[0]*value[1]
         
@@ -101,8 +112,9 @@ class GSprite(GRectangle):
     
     @frame.setter
     def frame(self,value):
-        assert type(value) == int, '%s is not an int' % repr(value)
-        assert value >= 0 and value < self.count, '%s is out of range' % repr(value)
+        if CHECKED:
+            assert type(value) == int, '%s is not an int' % repr(value)
+            assert value >= 0 and value < self.count, '%s is out of range' % repr(value)
         self._frame = value
         if not self.hitboxes is None:
             self.hitbox = self.hitboxes[value]
@@ -131,15 +143,17 @@ class GSprite(GRectangle):
         if value is None:
             self._hitboxes = None
             self._hitbox   = None
+            self._box      = None
             return
         
-        try:
-            size = len(value)
-        except:
-            size = 0
-        assert size == self.count, '%s is not a tuple or list of size %s' % (repr(value),repr(self.count))
-        assert all(map(lambda x : type(x) in [tuple,list] and len(x) == 4, value)), '%s contains an invalid hitbox' % repr(value)
-        assert all(map(lambda x : all(map(lambda y: type(y) in [int,float], x)),value)),  '%s contains an invalid hitbox' % repr(value)
+        if CHECKED:
+            try:
+                size = len(value)
+            except:
+                size = 0
+            assert size == self.count, '%s is not a tuple or list of size %s' % (repr(value),repr(self.count))
+            assert all(map(lambda x : type(x) in [tuple,list] and len(x) == 4, value)), '%s contains an invalid hitbox' % repr(value)
+            assert all(map(lambda x : all(map(lambda y: type(y) in [int,float], x)),value)),  '%s contains an invalid hitbox' % repr(value)
         self._hitboxes = tuple(map(tuple,value))
         self.hitbox = self._hitboxes[self.frame]
     
@@ -181,6 +195,8 @@ class GSprite(GRectangle):
         Resets the drawing cache.
         """
         GObject._reset(self)
+        if HEADLESS:
+            return
         
         texture = GameApp.load_texture(self.source)
         if texture:
@@ -190,13 +206,10 @@ class GSprite(GRectangle):
                 self.width  = width
                 self.height = height
             
-            ty = 0
-            for row in range(self._format[0]):
-                tx = 0
-                for col in range(self._format[1]):
-                    self._images[row*self._format[1]+col] = texture.get_region(int(tx),texture.height-int(ty)-int(height),int(width),int(height))
-                    tx += width
-                ty += width
+            key = (self.source,self._format)
+            if not key in GSprite.REGION_CACHE:
+                GSprite.REGION_CACHE[key] = self._build_regions(texture)
+            self._images = GSprite.REGION_CACHE[key]
         else:
             print('Failed to load',repr(self.source))
         
@@ -216,4 +229,22 @@ class GSprite(GRectangle):
             self._cache.add(line)
         
         self._cache.add(PopMatrix())
-
+    
+    def _build_regions(self,texture):
+        """
+        Returns the tuple of texture regions for the frames of this sprite.
+        
+        :param texture: The texture for the source file
+        :type texture:  ``Texture``
+        """
+        width  = texture.width/self._format[1]
+        height = texture.height/self._format[0]
+        images = []
+        ty = 0
+        for row in range(self._format[0]):
+            tx = 0
+            for col in range(self._format[1]):
+                images.append(texture.get_region(int(tx),texture.height-int(ty)-int(height),int(width),int(height)))
+                tx += width
+            ty += width
+        return tuple(images)
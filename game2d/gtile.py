@@ -8,8 +8,11 @@ this is very similar to GImage.
 Author: Walker M. White (wmw2)
 Date:   November 1, 2020
 """
-from kivy.graphics import *
-from kivy.graphics.instructions import *
+from .headless import HEADLESS
+from .checks import CHECKED
+if not HEADLESS:
+    from kivy.graphics import *
+    from kivy.graphics.instructions import *
 from .grectangle import GRectangle, GObject
 from .app import GameApp
 
@@ -23,7 +26,15 @@ class GTile(GObject):
     **explicitly** with the ``scale`` attribute).  Instead it repeats the image
     to fill in all of the remaining space.  This is ideal for terrain and other
     background features
+    
+    Tiles with the same source, size and texture have the same mesh.  The mesh data 
+    is made once and kept in ``MESH_CACHE``, so that every lane of a level (and of 
+    every level after it) shares it.  The texture is part of the key since the same
+    image has different texture coordinates on its own and as a region of the atlas.
     """
+    # Class attribute for sharing mesh data, keyed by (source,width,height,texture)
+    # where texture is the size and tex_coords of the texture
+    MESH_CACHE = {}
     
     # MUTABLE PROPERTIES
     @property
@@ -37,7 +48,8 @@ class GTile(GObject):
     
     @source.setter
     def source(self,value):
-        assert value is None or GameApp.is_image(value), '%s is not an image file' % repr(value)
+        if CHECKED:
+            assert value is None or GameApp.is_image(value), '%s is not an image file' % repr(value)
         self._source = value
         if self._defined:
             self._reset()
@@ -99,8 +111,8 @@ class GTile(GObject):
         Resets the drawing cache.
         """
         GObject._reset(self)
-        x = -self.width/2.0
-        y = -self.height/2.0
+        if HEADLESS:
+            return
         
         self._texture = GameApp.load_texture(self.source)
         if not self._texture is None and self.width == 0:
@@ -108,6 +120,32 @@ class GTile(GObject):
         if not self._texture is None and self.height == 0:
             self.height = self._texture.height
         
+        texture = self._texture
+        if not texture is None:
+            texture = (texture.width,texture.height,tuple(texture.tex_coords))
+        key = (self.source,self.width,self.height,texture)
+        if not key in GTile.MESH_CACHE:
+            GTile.MESH_CACHE[key] = self._build_mesh()
+        (vert,indx) = GTile.MESH_CACHE[key]
+        
+        mesh = Mesh(vertices=vert, indices=indx,mode='triangles',texture=self._texture)
+        if not self._fillcolor is None:
+            self._cache.add(self._fillcolor)
+        else:
+            self._cache.add(Color(1,1,1))
+        self._cache.add(mesh)
+        
+        self._cache.add(PopMatrix())
+    
+    def _build_mesh(self):
+        """
+        Returns the vertices and indices of the mesh for this tile.
+        
+        The mesh is centered on the origin, with one quad for each copy of the
+        image (the last row and column may be partial).
+        """
+        x = -self.width/2.0
+        y = -self.height/2.0
         grid_x = self._texture.width
         grid_y = self._texture.height
         size_x = int(self.width//grid_x)
@@ -118,6 +156,11 @@ class GTile(GObject):
         rng_x = size_x+1 if rem_x > 0 else size_x
         rng_y = size_y+1 if rem_y > 0 else size_y
         
+        # The texture may be a region of an atlas, so map each tile into its corners
+        u0, v0 = self._texture.tex_coords[0:2]
+        du = self._texture.tex_coords[2]-u0
+        dv = self._texture.tex_coords[7]-v0
+        
         vert = []
         indx = []
         pos = 0
@@ -125,18 +168,10 @@ class GTile(GObject):
             for jj in range(rng_y):
                 ni = 1 if ii < size_x else rem_x/grid_x
                 nj = 1 if jj < size_y else rem_y/grid_y
-                vert.extend([x+ii*grid_x,      y+jj*grid_y,         0, 1])
-                vert.extend([x+(ii+ni)*grid_x, y+jj*grid_y,        ni, 1])
-                vert.extend([x+(ii+ni)*grid_x, y+(jj+nj)*grid_y,   ni, 1-nj])
-                vert.extend([x+ii*grid_x,      y+(jj+nj)*grid_y,    0, 1-nj])
+                vert.extend([x+ii*grid_x,      y+jj*grid_y,      u0,       v0])
+                vert.extend([x+(ii+ni)*grid_x, y+jj*grid_y,      u0+ni*du, v0])
+                vert.extend([x+(ii+ni)*grid_x, y+(jj+nj)*grid_y, u0+ni*du, v0+nj*dv])
+                vert.extend([x+ii*grid_x,      y+(jj+nj)*grid_y, u0,       v0+nj*dv])
                 indx.extend([pos,pos+1,pos+2,pos+2,pos+3,pos])
                 pos += 4
-        
-        mesh = Mesh(vertices=vert, indices=indx,mode='triangles',texture=self._texture)
-        if not self._fillcolor is None:
-            self._cache.add(self._fillcolor)
-        else:
-            self._cache.add(Color(1,1,1))
-        self._cache.add(mesh)
-        
-        self._cache.add(PopMatrix())
\ No newline at end of file
+        return (tuple(vert),tuple(indx))
\ No newline at end of file
@@ -0,0 +1,140 @@
+"""
+A module to support fast 2D transforms.
+
+The transform of a :class:`GObject` (scale, then rotate, then translate) was once an
+``introcs`` ``Matrix``, which is a 4x4 numpy array.  Building one costs several numpy
+calls, and the object built a second one for the inverse every time it moved.  A 2D
+object only needs six numbers, so :class:`GTransform` keeps those six as floats, and
+only computes the inverse the first time that it is asked for.
+"""
+from introcs.geom import Point2
+import math
+
+
+class GTransform(object):
+    """
+    A class representing a 2D affine transform.
+
+    A transform maps the point (x,y) to the point (a*x+b*y+tx, c*x+d*y+ty).  Each
+    transform is immutable, so an object may hand out its transform (and the inverse,
+    which is computed once and kept) without copying it.
+    """
+    __slots__ = ('_a','_b','_c','_d','_tx','_ty','_inverse')
+
+    # IMMUTABLE PROPERTIES
+    @property
+    def entries(self):
+        """
+        The six entries (a,b,c,d,tx,ty) of this transform.
+
+        **Invariant**: Value is a tuple of six ``float`` values
+        """
+        return (self._a,self._b,self._c,self._d,self._tx,self._ty)
+
+    # BUILT-IN METHODS
+    def __init__(self,x=0,y=0,angle=0,sx=1,sy=1):
+        """
+        Creates the transform that scales, then rotates, then translates.
+
+        With no arguments, this is the identity transform.
+
+        :param x: the horizontal translation
+        :type x:  ``int`` or ``float``
+
+        :param y: the vertical translation
+        :type y:  ``int`` or ``float``
+
+        :param angle: the counter-clockwise rotation in degrees
+        :type angle:  ``int`` or ``float``
+
+        :param sx: the horizontal scale
+        :type sx:  ``int`` or ``float``
+
+        :param sy: the vertical scale
+        :type sy:  ``int`` or ``float``
+        """
+        if angle:
+            radians = math.radians(angle)
+            cos = math.cos(radians)
+            sin = math.sin(radians)
+        else:
+            cos = 1.0
+            sin = 0.0
+        self._a = cos*sx
+        self._b = -sin*sy
+        self._c = sin*sx
+        self._d = cos*sy
+        self._tx = float(x)
+        self._ty = float(y)
+        self._inverse = None
+
+    def __mul__(self,other):
+        """
+        Returns: The transform that applies this transform, and then ``other``.
+
+        This is the same order as the ``introcs`` ``Matrix``, so that ``p * q`` reads
+        left to right.
+
+        :param other: the transform to apply second
+        :type other:  :class:`GTransform`
+        """
+        assert isinstance(other,GTransform), '%s is not a transform' % repr(other)
+        result = GTransform.__new__(GTransform)
+        result._a  = other._a*self._a+other._b*self._c
+        result._b  = other._a*self._b+other._b*self._d
+        result._c  = other._c*self._a+other._d*self._c
+        result._d  = other._c*self._b+other._d*self._d
+        result._tx = other._a*self._tx+other._b*self._ty+other._tx
+        result._ty = other._c*self._tx+other._d*self._ty+other._ty
+        result._inverse = None
+        return result
+
+    def __repr__(self):
+        """
+        Returns: An unambiguous string representation of this transform.
+        """
+        return '%s%s' % (self.__class__.__name__,repr(self.entries))
+
+    # PUBLIC METHODS
+    def inverse(self):
+        """
+        Returns: The inverse of this transform.
+
+        The inverse is computed the first time it is needed, and kept after that.
+        """
+        if self._inverse is None:
+            det = self._a*self._d-self._b*self._c
+            assert det != 0, '%s is not invertible' % repr(self)
+            result = GTransform.__new__(GTransform)
+            result._a  =  self._d/det
+            result._b  = -self._b/det
+            result._c  = -self._c/det
+            result._d  =  self._a/det
+            result._tx = -(result._a*self._tx+result._b*self._ty)
+            result._ty = -(result._c*self._tx+result._d*self._ty)
+            result._inverse = self
+            self._inverse = result
+        return self._inverse
+
+    def transform(self,point):
+        """
+        Returns: The given point transformed by this transform.
+
+        :param point: the point to transform
+        :type point:  :class:`Point2`
+        """
+        p = self._transform(point.x,point.y)
+        return Point2(p[0],p[1])
+
+    # HIDDEN METHODS
+    def _transform(self,x=0,y=0):
+        """
+        Returns: The point (x,y) transformed, as a tuple of two floats.
+
+        :param x: the x-coordinate to transform
+        :type x:  ``int`` or ``float``
+
+        :param y: the y-coordinate to transform
+        :type y:  ``int`` or ``float``
+        """
+        return (self._a*x+self._b*y+self._tx,self._c*x+self._d*y+self._ty)
@@ -0,0 +1,293 @@
+"""
+Headless support for 2D game support.
+
+This module allows the game2d classes to run without a display, textures, or sound.
+That is useful for running a game simulation on a server, or as fast as the CPU
+allows.  Headless mode is selected when the environment variable ``GAME2D_HEADLESS``
+is set (to anything other than ``0``) before game2d is imported, or automatically
+when Kivy is not installed.
+
+In headless mode every :class:`GObject` keeps its position, size, angle and hitbox,
+so collisions work exactly as they do on screen.  However, objects build no drawing
+instructions, images load no textures, and sounds are silent.  There is no
+:class:`GameApp` window, so you cannot use :class:`GLabel` or :class:`GView`.  Use
+:class:`HeadlessInput` in place of the :class:`GInput` provided by the application.
+"""
+import os
+
+
+def _is_headless():
+    """
+    Returns True if game2d should run without a display.
+
+    :return: True if headless mode is requested or Kivy is not available
+    :rtype:  ``bool``
+    """
+    if os.environ.get('GAME2D_HEADLESS','0') not in ('','0'):
+        return True
+    try:
+        import kivy.graphics
+    except ImportError:
+        return True
+    return False
+
+
+# Whether or not game2d is running without a display
+HEADLESS = _is_headless()
+
+
+# #mark -
+class Translate(object):
+    """
+    A plain-data replacement for the Kivy ``Translate`` instruction.
+
+    This class only stores the offset, as there is nothing to draw.
+    """
+
+    def __init__(self,x=0,y=0,z=0):
+        """
+        Creates a new translation.
+
+        :param x: The horizontal offset
+        :type x:  ``int`` or ``float``
+
+        :param y: The vertical offset
+        :type y:  ``int`` or ``float``
+
+        :param z: The depth offset
+        :type z:  ``int`` or ``float``
+        """
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+class Rotate(object):
+    """
+    A plain-data replacement for the Kivy ``Rotate`` instruction.
+
+    This class only stores the angle, as there is nothing to draw.
+    """
+
+    def __init__(self,angle=0,axis=(0,0,1)):
+        """
+        Creates a new rotation.
+
+        :param angle: The angle of rotation in degrees
+        :type angle:  ``int`` or ``float``
+
+        :param axis: The axis of rotation
+        :type axis:  3-element tuple of numbers
+        """
+        self.angle = angle
+        self.axis  = axis
+
+
+class Scale(object):
+    """
+    A plain-data replacement for the Kivy ``Scale`` instruction.
+
+    This class only stores the scaling factors, as there is nothing to draw.
+    """
+
+    def __init__(self,x=1,y=1,z=1):
+        """
+        Creates a new scaling factor.
+
+        :param x: The horizontal scale
+        :type x:  ``int`` or ``float``
+
+        :param y: The vertical scale
+        :type y:  ``int`` or ``float``
+
+        :param z: The depth scale
+        :type z:  ``int`` or ``float``
+        """
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+class Color(object):
+    """
+    A plain-data replacement for the Kivy ``Color`` instruction.
+
+    This class only stores the color components, as there is nothing to draw.
+    """
+
+    def __init__(self,r,g,b,a=1.0):
+        """
+        Creates a new color.
+
+        :param r: The red component in 0..1
+        :type r:  ``float``
+
+        :param g: The green component in 0..1
+        :type g:  ``float``
+
+        :param b: The blue component in 0..1
+        :type b:  ``float``
+
+        :param a: The alpha component in 0..1
+        :type a:  ``float``
+        """
+        self.rgba = [r,g,b,a]
+
+
+# #mark -
+class HeadlessInput(object):
+    """
+    A class representing a synthetic input handler
+
+    This class has the same keyboard interface as :class:`GInput`, but the keys are
+    pressed and released by the program instead of the keyboard. This allows you to
+    script or replay input when there is no window.  There is no mouse, so
+    :meth:`is_touch_down` is always False.
+
+    As with :class:`GInput`, you should call :meth:`refresh` at the end of each
+    animation frame so that :meth:`is_key_pressed` and :meth:`is_key_released`
+    work properly.
+    """
+
+    # IMMUTABLE ATTRIBUTES
+    @property
+    def touch(self):
+        """
+        The current (x,y) coordinate of the mouse, if pressed.
+
+        There is no mouse in headless mode, so this value is always None.
+
+        **Immutable**: This value cannot be altered.
+        """
+        return None
+
+    @property
+    def key_count(self):
+        """
+        The number of keys currently held down.
+
+        **Immutable**: This value cannot be altered.
+
+        **Invariant**: Must be an int >= 0."""
+        return self._keycount
+
+    @property
+    def keys(self):
+        """
+        The list of keys that are currently held down.
+
+        **Immutable**: This value cannot be altered.
+
+        **Invariant**: Must be a tuple of strings (possibly empty)
+        """
+        return tuple(k for (k,v) in self._keystate.items() if v)
+
+
+    # BUILT-IN METHODS
+    def __init__(self):
+        """
+        Creates a new synthetic input handler with no keys held down.
+        """
+        self._prvstate = {}
+        self._keystate = {}
+        self._keycount = 0
+
+
+    # PUBLIC METHODS
+    def press(self,key):
+        """
+        Holds down the given key.
+
+        The key stays down until it is released with :meth:`release`.
+
+        :param key: the key to press
+        :type key:  ``str``
+        """
+        assert type(key) == str, '%s is not a valid key' % repr(key)
+        if not self.is_key_down(key):
+            self._keycount += 1
+        self._keystate[key] = True
+
+    def release(self,key):
+        """
+        Releases the given key.
+
+        :param key: the key to release
+        :type key:  ``str``
+        """
+        assert type(key) == str, '%s is not a valid key' % repr(key)
+        if self.is_key_down(key):
+            self._keycount -= 1
+        self._keystate[key] = False
+
+    def release_all(self):
+        """
+        Releases every key currently held down.
+        """
+        for key in self._keystate:
+            self._keystate[key] = False
+        self._keycount = 0
+
+    def refresh(self):
+        """
+        Records the current key state as the state of the previous frame.
+        """
+        self._prvstate.clear()
+        self._prvstate.update(self._keystate)
+
+    def is_key_down(self,key):
+        """
+        Checks wether the key is currently held down.
+
+        :param key: the key to test
+        :type key:  ``str``
+
+        :return: True if ``key`` is currently held down
+        :rtype:  ``bool``
+        """
+        return key in self._keystate and self._keystate[key]
+
+    def is_key_up(self,key):
+        """
+        Checks wether the key is not currently held down
+
+        :param key: the key to test
+        :type key:  ``str``
+
+        :return: True if ``key`` is not currently held down
+        :rtype:  ``bool``
+        """
+        return key in self._keystate and not self._keystate[key]
+
+    def is_key_pressed(self,key):
+        """
+        Checks wether the key was just pressed.
+
+        :param key: the key to test
+        :type key:  ``str``
+
+        :return: True if ``key`` was pressed this frame
+        :rtype:  ``bool``
+        """
+        return self.is_key_down(key) and not (key in self._prvstate and self._prvstate[key])
+
+    def is_key_released(self,key):
+        """
+        Checks wether the key was just released.
+
+        :param key: the key to test
+        :type key:  ``str``
+
+        :return: True if ``key`` was released this frame
+        :rtype:  ``bool``
+        """
+        return self.is_key_up(key) and (key in self._prvstate and self._prvstate[key])
+
+    def is_touch_down(self):
+        """
+        Checks wether the mouse is currently held down.
+
+        :return: Always False, as there is no mouse in headless mode
+        :rtype:  ``bool``
+        """
+        return False
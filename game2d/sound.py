@@ -6,7 +6,9 @@ This classes wrap the Kivy audio interface, making it simpler for students to us
 Author: Walker M. White (wmw2)
 Date:   August 1, 2017 (Python 3 version)
 """
-from kivy.core.audio import SoundLoader
+from .headless import HEADLESS
+if not HEADLESS:
+    from kivy.core.audio import SoundLoader
 from .app import GameApp
 
 
@@ -22,6 +24,9 @@ class Sound(object):
     When a sound is played, it cannot be played again until it finishes, or is stopped.  
     This means that if you want multiple, simultaneous sound effects from the same WAV 
     file.you will need to create multiple Sound objects.
+    
+    In headless mode, sounds are silent.  They are never loaded, and :meth:`play`
+    does nothing.
     """
     # This class is a simply replacement for the built-in Kivy Sound class.  It is a
     # little better with error handling, since GStreamer appears to be quite unreliable.
@@ -36,13 +41,17 @@ class Sound(object):
         
         **Invariant**: Must float in the range 0..1.
         """
+        if self._sound is None:
+            return self._volume
         return self._sound.volume
     
     @volume.setter
     def volume(self,value):
         assert type(value) in [int, float] and value >= 0 and value <= 1, \
             'value %s is not a valid volume' % repr(value)
-        self._sound.volume = value
+        self._volume = value
+        if not self._sound is None:
+            self._sound.volume = value
     
     # IMMUTABLE PROPERTIES
     @property
@@ -66,7 +75,7 @@ class Sound(object):
         
         **Invariant**: Must be a boolean.
         """ 
-        return self._sound.state == 'play'
+        return not self._sound is None and self._sound.state == 'play'
     
     def __init__(self,source):
         """
@@ -78,6 +87,10 @@ class Sound(object):
         from .app import GameApp
         assert GameApp.is_sound(source), 'source %s is not a sound file' % repr(source)
         self._source = source
+        self._volume = 1
+        if HEADLESS:
+            self._sound = None
+            return
         self._sound  = SoundLoader.load(source)
         self._sound.load()
         if self._sound is None:
@@ -92,6 +105,8 @@ class Sound(object):
         :param loop: Whether or not to loop the sound
         :type loop:  ``bool``
         """
+        if self._sound is None:
+            return
         self._sound.loop = loop
         self._sound.play()
 
@@ -101,6 +116,8 @@ class Sound(object):
         
         This will stop the sound immediately, even if it is looping.
         """
+        if self._sound is None:
+            return
         self._sound.stop()
 
 
@@ -63,7 +63,7 @@ class Lane(object):         # You are permitted to change the parent class if yo
     #Invariant: _width must be an int and > 0
 
     #Attribute _objs: the list of objects in the lane
-    #Invariant: _objs must be a list
+    #Invariant: _objs must be a list of LaneObject
 
     #Attribute _speed: the speed at which the objects are moving
     #Invariant: _speed must be an int and > 0
@@ -71,6 +71,32 @@ class Lane(object):         # You are permitted to change the parent class if yo
     #Attribute _offscreen: the offscreen value
     #Invariant: _offscreen must be an int and > 0
 
+    #Attribute _starts: the starting x-value of each object in the lane
+    #Invariant: _starts must be a list of numbers, one for each object in _objs
+
+    #Attribute _clock: the seconds since the lane started, modulo the period
+    #Invariant: _clock must be a float >= 0 and < _period (or 0 if _period is 0)
+
+    #Attribute _period: the seconds for an object to wrap around to where it started
+    #Invariant: _period must be a float >= 0 (0 if the lane does not move)
+
+    #Attribute _stale: True if the objects have not been moved to match the clock
+    #Invariant: _stale must be a bool
+
+    #Attribute _view: the view that the tile and objects are attached to
+    #Invariant: _view must be a GView, or None if the lane has not been drawn
+
+    #Attribute _batch: the objects drawn as one mesh, at their starting positions.
+    #The batch is moved as a whole to match the lane clock, and drawn a second
+    #time one lane width to the left, so that objects wrap around
+    #Invariant: _batch must be a GBatch of _objs, or None if the lane has not been drawn
+
+    #Attribute _cells: the occupancy table of the lane. The lane is cut into cells
+    #LANE_CELL wide, measured in the frame that moves with the objects (so the table
+    #never changes). Each cell has the positions in _objs of the objects that might
+    #cover it
+    #Invariant: _cells must be a tuple of tuples of ints, one for each cell in the lane
+
     # GETTERS AND SETTERS (ONLY ADD IF YOU NEED THEM)
     def getX(self):
         """
@@ -105,15 +131,71 @@ class Lane(object):         # You are permitted to change the parent class if yo
     def getObjects(self):
         """
         Returns list of objects in lane.
+
+        The objects are moved to their current positions before they are returned.
         """
+        self._place()
         return self._objs
 
+    def getObjectX(self,index,lag=0):
+        """
+        Returns the current x-value of the object at the given index.
+
+        This is computed from the lane clock, without moving any objects.
+        If lag is not 0, this is where the object was lag seconds ago.
+
+        Parameter index: the position of the object in the lane
+        Precondition: index is an int in 0..len(getObjects())-1
+
+        Parameter lag: the number of seconds to look back
+        Precondition: lag is a number >= 0
+        """
+        if self._period == 0:
+            return self._objs[index].x
+        left = -self._offscreen*GRID_SIZE
+        span = self._width + 2*self._offscreen*GRID_SIZE
+        clock = self._clock-lag
+        return left + (self._starts[index] - left + self._speed*clock) % span
+
+    def getClock(self):
+        """
+        Returns the seconds since the lane started, modulo the lane period.
+        """
+        return self._clock
+
+    def getPeriod(self):
+        """
+        Returns the seconds for an object to wrap around to where it started.
+
+        This value is 0 if the lane does not move.
+        """
+        return self._period
+
     def getSpeed(self):
         """
         Returns speed of objects.
         """
         return self._speed
 
+    def getDrawCount(self):
+        """
+        Returns the number of objects drawn the last time the lane was drawn.
+
+        Objects outside of the window are not counted, as they are not drawn.
+        An object partly on each side of the window counts twice.
+        """
+        if self._batch is None:
+            return 0
+        return self._batch.drawn
+
+    def isStatic(self):
+        """
+        Returns True if nothing in the lane moves, so it never needs an update.
+
+        Grass and hedges are always static, as is any lane without a speed.
+        """
+        return self._period == 0
+
     # INITIALIZER TO SET LANE POSITION, BACKGROUND,AND OBJECTS
     def __init__(self,level,pos,dict,offscreen,hitboxDict):
 
@@ -137,15 +219,20 @@ class Lane(object):         # You are permitted to change the parent class if yo
 
         if 'objects' in dict:
             for key in dict['objects']:
-                ht = hitboxDict[key['type']]['hitbox']
-                image = GImage(source = key['type'] + '.png',
-                        x = key['position']*GRID_SIZE+GRID_SIZE//2,y=self._tile.y)
-
-                image.hitbox = ht
-
-                if self._speed < 0:
-                    image.angle = 180
-                self._objs.append(image)
+                kind = ObjectType.get(key['type'],hitboxDict[key['type']])
+                self._objs.append(LaneObject(kind,key['position']*GRID_SIZE+GRID_SIZE//2,
+                                             self._tile.y,self._speed < 0))
+
+        self._starts = [object.x for object in self._objs]
+        self._clock = 0.0
+        self._stale = False
+        self._period = 0.0
+        if self._speed != 0:
+            span = self._width + 2*self._offscreen*GRID_SIZE
+            self._period = span/abs(self._speed)
+        self._cells = ()
+        self._view = None
+        self._batch = None
 
     def update(self,input,dt):
         """
@@ -154,42 +241,130 @@ class Lane(object):         # You are permitted to change the parent class if yo
         For all of the objects in the individual lanes (cars,logs,etc),
         it moves them and wraps them around to reappear on the screen.
 
+        The objects move at a constant speed, so every object returns to where
+        it started after _period seconds. Therefore this method only advances the
+        lane clock. The objects are not actually moved until something asks for
+        them (see _place), so lanes that nobody looks at cost nothing.
+
         Parameter input: user input
         Precondition: inut is a GInput
 
         Parameter dt: The time in seconds since last update
         Precondition: dt is a number (int or float)
         """
+        if self._period != 0:
+            self._clock = (self._clock + dt) % self._period
+            self._stale = True
+    # ADDITIONAL METHODS (DRAWING, COLLISIONS, MOVEMENT, ETC)
+    def draw(self,view,lag=0,tile=True):
+        """
+        Draws the game objects to the view.
 
-        for object in self._objs:
+        The first time, it attaches the tile for the lane to the background
+        layer of the view (unless tile is False, as when the level bakes all of
+        the tiles into one texture), and a GBatch of the objects in the lane (one mesh
+        for all of them) to the objects layer. They stay there, so after that
+        this method only has to move the batch and work out which objects are
+        on screen (and does nothing if the lane is static). The objects
+        themselves are not moved to draw them.
 
-            if self._speed < 0:
-                object.x = object.x + (self._speed * dt)
-                if object.x < -self._offscreen*GRID_SIZE:
-                    d =(-self._offscreen*GRID_SIZE) - object.x
-                    object.x = self._width + self._offscreen*GRID_SIZE - d
+        Objects that are entirely outside of the window (such as the ones
+        waiting in the offscreen wrap zone) are left out of the batch (see
+        getDrawCount). The tile always fills the window, so it is never left out.
 
+        If lag is not 0, the objects are drawn where they were lag seconds ago
+        (to draw between two updates).
 
-            if self._speed > 0:
-                    object.x = object.x + (self._speed * dt)
-                    if object.x > self._width + self._offscreen*GRID_SIZE:
-                        d = object.x - (self._width + self._offscreen*GRID_SIZE)
-                        object.x = -self._offscreen*GRID_SIZE + d
-    # ADDITIONAL METHODS (DRAWING, COLLISIONS, MOVEMENT, ETC)
-    def draw(self,view):
+        Parameter view: view to draw to
+        Precondition: view is a GView
+
+        Parameter lag: the number of seconds to look back
+        Precondition: lag is a number >= 0
+
+        Parameter tile: True to attach the tile for the lane
+        Precondition: tile is a bool
         """
-        Draws the game objects to the view.
+        if not self._view is view:
+            if tile:
+                self._tile.attach(view,'background')
+            if self._batch is None:
+                self._batch = self._buildBatch()
+                self._batch.cull(0,self._width)
+            self._batch.attach(view,'objects')
+            self._view = view
+
+        if self._period != 0:
+            span = self._width + 2*self._offscreen*GRID_SIZE
+            self._batch.x = (self._speed*(self._clock-lag)) % span
+            self._batch.cull(0,self._width)
+
+    def _buildBatch(self):
+        """
+        Returns a GBatch of the objects in the lane, at their starting positions.
+
+        The objects are moved to their starting positions to build the batch, and
+        are put back where they belong the next time anything asks for them.
+        """
+        for index in range(len(self._objs)):
+            self._objs[index].x = self._starts[index]
+        self._stale = self._period != 0
+        span = self._width + 2*self._offscreen*GRID_SIZE
+        return GBatch(images=self._objs,wrap=span if self._period != 0 else 0)
+
+    def _buildCells(self,objects):
+        """
+        Builds the occupancy table of the lane for the given objects.
+
+        Each object is added to every cell that its hitbox covers when the lane
+        clock is 0 (which is right now, as this is called by the initializer).
+        It is also added to the cell on either side, so that rounding in the
+        lane clock can never leave an object out of a cell it covers.
+
+        Parameter objects: the objects to put in the table
+        Precondition: objects is a sequence of objects in _objs
+        """
+        left = -self._offscreen*GRID_SIZE
+        span = self._width + 2*self._offscreen*GRID_SIZE
+        count = span//LANE_CELL
+        cells = [[] for _ in range(count)]
+        for index in range(len(self._objs)):
+            if self._objs[index] in objects:
+                (l,t,r,b) = self._objs[index]._bbox()
+                first = int((l-left)//LANE_CELL)-1
+                last = int((r-left)//LANE_CELL)+1
+                if last-first >= count:
+                    first = 0
+                    last = count-1
+                for cell in range(first,last+1):
+                    cells[cell % count].append(index)
+        self._cells = tuple(tuple(cell) for cell in cells)
+
+    def _cellAt(self,x):
+        """
+        Returns the cell of the occupancy table that holds the screen position x.
+
+        The table moves with the objects, so this is (x - offset) modulo the lane
+        width, where the offset is how far the objects have moved. The result is
+        not wrapped to the size of the table.
 
-        It draws each tile for the lanes in the level and the GImages of
-        the objects in each lane.
+        Parameter x: the horizontal screen position
+        Precondition: x is a number
+        """
+        left = -self._offscreen*GRID_SIZE
+        return int((x-left-self._speed*self._clock)//LANE_CELL)
 
-        Parameter view:
-        Precondition:
+    def _place(self):
         """
-        self._tile.draw(view)
+        Moves the objects in the lane to their positions for the lane clock.
 
-        for objects in self._objs:
-            objects.draw(view)
+        Each object is placed relative to its starting position, so there is
+        no error built up from frame to frame. An object that moves past the
+        offscreen edge wraps around to the other side.
+        """
+        if self._stale:
+            for index in range(len(self._objs)):
+                self._objs[index].x = self.getObjectX(index)
+            self._stale = False
 
 
 class Grass(Lane):                           # We recommend AGAINST changing this one
@@ -216,23 +391,149 @@ class Road(Lane):                           # We recommend AGAINST changing this
     than other lanes as they have cars that can kill the frog. Therefore, this class
     does need a method to tell whether or not the frog is safe.
     """
+    # LIST ALL HIDDEN ATTRIBUTES HERE
+    #Attribute _cars: the cars in the lane, collected when the lane is created
+    #Invariant: _cars must be a tuple of the LaneObject objects in _objs
+
     # GETTERS AND SETTERS
     def carPos(self): #Getter for car pos
         """
-        Loops through objects in lane and returns list of cars.
+        Returns the tuple of cars in the lane.
+
+        The tuple is built once by the initializer, so no list is made when this
+        is called every frame.  It should not be modified.
         """
-        cars = []
-        if self._objs != []:
-            for object in self._objs:
-                cars.append(object)
-        return cars
+        self._place()
+        return self._cars
 
     def __init__(self,level,pos,dict,offscreen,htImageDict):
         super().__init__(level=level,pos=pos,dict=dict,offscreen=offscreen,
                          hitboxDict=htImageDict)
         self._tile.source = 'road.png'
+        self._cars = tuple(self._objs)
+        self._buildCells(self._cars)
         # DEFINE ANY NEW METHODS HERE
 
+    def sweptCollides(self,obj,dt,move=(0,0)):
+        """
+        Returns True if a car in this lane hit obj at any time in the last dt seconds.
+
+        Checking only where the cars are now misses a fast car that jumps over obj
+        in a long frame.  Instead, each car is tested over the whole stretch of road
+        it covered since the last frame.  The cars move at the constant lane speed,
+        so that stretch reaches speed*dt back from where the car is now (wrapping
+        around the lane as the cars do).  When dt is 0 this is the same as
+        obj.collides(car) for each car.
+
+        Obj may have moved during the frame too (such as a frog part way through a
+        hop).  Testing the stretch each car covered against where obj is now would
+        count a car that passed that spot before obj got there, so obj is swept as
+        well: both move in a straight line over the frame, and a car only hits obj
+        if their boxes overlap at the same moment.
+
+        Parameter obj: the object to test (usually the frog)
+        Precondition: obj is a GObject rotated a multiple of 90 degrees
+
+        Parameter dt: The time in seconds since last update
+        Precondition: dt is a number (int or float) >= 0
+
+        Parameter move: how far obj moved (dx,dy) in the last dt seconds
+        Precondition: move is a tuple of two numbers
+        """
+        travel = self._speed*dt
+        span = self._width + 2*self._offscreen*GRID_SIZE
+        box = obj._bbox()
+        if abs(travel) >= span:
+            # Every car swept the whole lane
+            for car in self.carPos():
+                if self._sweptHit(car,box,travel,span,move):
+                    return True
+            return False
+
+        # Only the cars now within travel of where obj was can have hit it
+        first = self._cellAt(box[0]-max(move[0],0)+min(travel,0))
+        last = self._cellAt(box[2]-min(move[0],0)+max(travel,0))
+        last = min(last,first+len(self._cells)-1)
+        for cell in range(first,last+1):
+            for index in self._cells[cell % len(self._cells)]:
+                car = self._objs[index]
+                car.x = self.getObjectX(index)
+                if self._sweptHit(car,box,travel,span,move):
+                    return True
+        return False
+
+    def _sweptHit(self,car,box,travel,span,move):
+        """
+        Returns True if car hit the bounding box box in the last travel pixels.
+
+        This uses the same bounding boxes (and tests) as GObject.collides, but
+        moves both boxes back over the last frame.  Seen from the box, the car
+        moves by travel less the move of the box, so the car hits the box if
+        there is a moment in the frame at which the two overlap on both axes.
+
+        Parameter car: the car to test
+        Precondition: car is a car in this lane, at its current position
+
+        Parameter box: the bounding box (l,t,r,b) of the object to test
+        Precondition: box is a tuple of four numbers, as given by GObject._bbox
+
+        Parameter travel: the distance the cars moved since the last frame
+        Precondition: travel is a number
+
+        Parameter span: the distance for a car to wrap around to where it started
+        Precondition: span is a number > 0
+
+        Parameter move: how far the box moved (dx,dy) since the last frame
+        Precondition: move is a tuple of two numbers
+        """
+        (l1,t1,r1,b1) = box
+        (l0,t0,r0,b0) = car._bbox()
+        ys = self._overlap(b0,t0,b1,t1,-move[1])
+        if ys is None:
+            return False
+        if abs(travel) >= span:
+            return True
+        for shift in (0,-span,span):
+            xs = self._overlap(l0+shift,r0+shift,l1,r1,travel-move[0])
+            if not xs is None and max(xs[0],ys[0]) <= min(xs[1],ys[1]):
+                return True
+        return False
+
+    def _overlap(self,lo0,hi0,lo1,hi1,speed):
+        """
+        Returns the part of the last frame in which two intervals overlapped.
+
+        The first interval is lo0..hi0 now, and moved speed over the frame.  The
+        second interval is lo1..hi1 and did not move.  The result is a tuple
+        (first,last) of times, each the fraction of the frame before now (so 0 is
+        now and 1 is the start of the frame), or None if they never overlapped.
+
+        Parameter lo0: the low end of the moving interval now
+        Precondition: lo0 is a number
+
+        Parameter hi0: the high end of the moving interval now
+        Precondition: hi0 is a number >= lo0
+
+        Parameter lo1: the low end of the fixed interval
+        Precondition: lo1 is a number
+
+        Parameter hi1: the high end of the fixed interval
+        Precondition: hi1 is a number >= lo1
+
+        Parameter speed: the distance the first interval moved over the frame
+        Precondition: speed is a number
+        """
+        # At time u the first interval is lo0-u*speed..hi0-u*speed
+        if speed == 0:
+            return (0,1) if lo0 <= hi1 and lo1 <= hi0 else None
+        first = (lo0-hi1)/speed
+        last = (hi0-lo1)/speed
+        if speed < 0:
+            (first,last) = (last,first)
+        first = max(first,0)
+        last = min(last,1)
+        return (first,last) if first <= last else None
+
 
 class Water(Lane):
     """
@@ -247,23 +548,46 @@ class Water(Lane):
     In addition, the logs move the frog. If the frog is currently in this lane, then the
     frog moves at the same rate as all of the logs.
     """
+    # LIST ALL HIDDEN ATTRIBUTES HERE
+    #Attribute _logs: the logs in the lane, collected when the lane is created
+    #Invariant: _logs must be a tuple of the LaneObject objects in _objs that are logs
+
+    # GETTERS AND SETTERS
     def getLogs(self):
         """
-        Loops through list of objects in lane and returns list of logs.
+        Returns the tuple of logs in the lane.
+
+        The tuple is built once by the initializer, so no list is made when this
+        is called every frame.  It should not be modified.
         """
-        logs = []
-        if self._objs != []:
-            for object in self._objs:
-                if 'log' in  object.source :
-                    logs.append(object)
-        return logs
+        self._place()
+        return self._logs
 
     def __init__(self,level,pos,dict,offscreen,htImageDict):
         super().__init__(level=level,pos=pos,dict=dict,offscreen=offscreen,
                         hitboxDict=htImageDict)
         self._tile.source = 'water.png'
+        self._logs = tuple(object for object in self._objs if 'log' in object.source)
+        self._buildCells(self._logs)
         # DEFINE ANY NEW METHODS HERE
 
+    def logAt(self,point):
+        """
+        Returns the log that contains point, or None if there is no such log.
+
+        Only the logs in the cell of the occupancy table under point are
+        tested, so this takes the same time no matter how many logs there are.
+
+        Parameter point: the point to test
+        Precondition: point is a pair of numbers
+        """
+        for index in self._cells[self._cellAt(point[0]) % len(self._cells)]:
+            log = self._objs[index]
+            log.x = self.getObjectX(index)
+            if log.contains(point):
+                return log
+        return None
+
 
 class Hedge(Lane):
     """
@@ -286,30 +610,35 @@ class Hedge(Lane):
     it with the initializer for the Lane.
     """
     # LIST ALL HIDDEN ATTRIBUTES HERE
+    #Attribute _exits: the exits in the lane, collected when the lane is created
+    #Invariant: _exits must be a tuple of the LaneObject objects in _objs that are exits
+    #
+    #Attribute _openings: the openings in the lane, collected when the lane is created
+    #Invariant: _openings must be a tuple of the LaneObject objects in _objs that are openings
+    #
+    #Attribute _exitsOccupied: whether each exit has been reached (1) or not (0)
+    #Invariant: _exitsOccupied must be a list of ints, one for each exit in _exits
 
     # GETTERS AND SETTERS (ONLY ADD IF YOU NEED THEM)
     def getExits(self):
         """
-        Loops through list of objects and returns list of exits.
-        """
-        exits = []
-        if self._objs != []:
+        Returns the tuple of exits in the lane.
 
-            for object in self._objs:
-                if object.source == 'exit.png':
-                    exits.append(object)
-        return exits
+        The tuple is built once by the initializer, so no list is made when this
+        is called every frame.  It should not be modified.
+        """
+        self._place()
+        return self._exits
 
     def getOpenings(self):
         """
-        Loops through list of objects and returns list of openings.
+        Returns the tuple of openings in the lane.
+
+        The tuple is built once by the initializer, so no list is made when this
+        is called every frame.  It should not be modified.
         """
-        openings = []
-        if self._objs != []:
-            for object in self._objs:
-                if object.source == 'open.png':
-                    openings.append(object)
-        return openings
+        self._place()
+        return self._openings
 
             # INITIALIZER TO SET ADDITIONAL EXIT INFORMATION
     def __init__(self,level,pos,dict,offscreen,htImageDict):
@@ -317,12 +646,12 @@ class Hedge(Lane):
                          hitboxDict=htImageDict)
         self._tile.source = 'hedge.png'
 
-        self._exitsOccupied = []
+        self._exits = tuple(object for object in self._objs
+                            if object.source == 'exit.png')
+        self._openings = tuple(object for object in self._objs
+                               if object.source == 'open.png')
+        self._exitsOccupied = [0]*len(self._exits)
         self._allExitsOccupied = True
-        if self._objs != []:
-            for object in self._objs:
-                if object.source == 'exit.png':
-                    self._exitsOccupied.append(0)
 
 
 
@@ -70,11 +70,32 @@ class Level(object):
     #Attribute _lanes: list of lanes
     #Invariant: _lanes must be a list
 
+    #Attribute _rows: for each grid row, the positions (in _lanes) of the lanes
+    #whose tile or objects reach into that row
+    #Invariant: _rows must be a list of lists of ints, one list for each lane
+
+    #Attribute _spans: the lanes of each type reaching into each span of rows,
+    #by (first,last,type)
+    #Invariant: _spans must be a dict of tuples of lanes
+
+    #Attribute _hedges: the hedge lanes, in level order
+    #Invariant: _hedges must be a tuple of Hedge objects
+
+    #Attribute _moving: the lanes with moving objects, which need an update
+    #Invariant: _moving must be a tuple of lanes
+
     #Attribute _noOfLives: value representing the initial number of lives
     #Invariant: _noOfLives must be an int
 
-    #Attribute _lives: list containing images for lives to be displayed
-    #Invariant: _lives must be list
+    #Attribute _background: the tiles of every lane, baked into one texture the
+    #first time the level is drawn
+    #Invariant: _background must be a GBake, or None if the level has not been drawn
+
+    #Attribute _backgroundSize: the size of the view when _background was baked
+    #Invariant: _backgroundSize must be a (width,height) tuple, or None
+
+    #Attribute _bar: the lives bar, built the first time it is drawn
+    #Invariant: _bar must be a Counter, or None if the level has not been drawn
 
     #Attribute _cooldown: time before frog can move again
     #Invariant: _cooldown must be > 0
@@ -94,6 +115,15 @@ class Level(object):
     #Attribute _htImageDict: hitbox value of image
     #Invariant: _htImageDict: must be an int
 
+    #Attribute _lastdt: the time in seconds passed to the last update
+    #Invariant: _lastdt must be a number >= 0
+
+    #Attribute _frogFrom: the frog and its (x,y) position before the last update
+    #Invariant: _frogFrom must be None or a tuple (Frog,float,float)
+
+    #Attribute _shown: the frogs attached to the frog layer of the view
+    #Invariant: _shown must be a list of GObjects
+
     # GETTERS AND SETTERS (ONLY ADD IF YOU NEED THEM)
 
     def getWidth(self):
@@ -172,6 +202,25 @@ class Level(object):
         """
         return self._deadfrog
 
+    def getSafeFrogs(self):
+        """
+        Returns the list of safe frog images, one for each exit reached.
+
+        The list should not be modified.
+        """
+        return self._safeFrogs
+
+    def getDrawCount(self):
+        """
+        Returns the number of lane objects drawn the last time the level was drawn.
+
+        Objects outside of the window are not drawn, and not counted.
+        """
+        count = 0
+        for lane in self._lanes:
+            count += lane.getDrawCount()
+        return count
+
     # INITIALIZER (standard form) TO CREATE THE FROG AND LANES
     def __init__(self,dict,htDict):
 
@@ -183,7 +232,6 @@ class Level(object):
         self._y = dict['start'][1]
         self._lanes = []
         self._noOfLives = 3
-        self._lives=[]
         self._cooldown = FROG_SPEED
         self._safeFrogs = []
         self._allOccupied = False
@@ -224,17 +272,14 @@ class Level(object):
                          y=self._y*GRID_SIZE+GRID_SIZE//2,
                          sFrog=htDict['sprites']['skulls'])
         self._frog.angle= FROG_NORTH
-        self._bar = GLabel(text = "LIVES:",font_name = ALLOY_FONT,
-                    font_size = ALLOY_SMALL, linecolor='dark green',
-                    x=(self.getWidth()-self._noOfLives-1)*GRID_SIZE-ALLOY_SMALL/2,
-                    y=(self.getHeight()+1)*GRID_SIZE -GRID_SIZE/2 )
-
-        for i in range(self._noOfLives):
-             life = GImage(source = FROG_HEAD,width=GRID_SIZE,height=GRID_SIZE,
-                    y=(self.getHeight()+1)*GRID_SIZE - GRID_SIZE/2,
-                    x=(self.getWidth()-i)*GRID_SIZE-GRID_SIZE/2)
-
-             self._lives.append(life)
+        self._bar = None
+        self._background = None
+        self._backgroundSize = None
+        self._lastdt = 0
+        self._frogFrom = None
+        self._shown = []
+        self._buildTypes()
+        self._buildRows()
 
     def update(self,input,dt):
         """
@@ -242,7 +287,8 @@ class Level(object):
 
         It is in charge of playing the game. It calls _lane to draw
         the GTiles in each level and loops through the different arrow
-        keys as input to move the frog, calling the animator.
+        keys as input to move the frog, calling the animator. Static lanes
+        (grass, hedges, and roads without speed) are not updated.
 
 
         Parameter input: user input
@@ -251,7 +297,10 @@ class Level(object):
         Parameter dt: The time in seconds since last update
         Precondition: dt is a number (int or float)
         """
-        for lane in self._lanes:
+        self._lastdt = dt
+        if self._frog != None:
+            self._frogFrom = (self._frog,self._frog.x,self._frog.y)
+        for lane in self._moving:
             lane.update(input,dt)
         dx = self._frog.getX()
         dy = self._frog.getY()
@@ -269,6 +318,8 @@ class Level(object):
                 self._frog.animator.send(dt)
             except:
                 self._frog.animator = None
+        elif self._frog == None:
+            pass # The frog died or reached the exit this frame
         elif input.is_key_down('left') and input.key_count == 1:
             self._keyLeft()
         elif input.is_key_down('right') and input.key_count == 1:
@@ -277,13 +328,13 @@ class Level(object):
             self._keyUp()
         elif input.is_key_down('down') and input.key_count == 1:
             self._keyDown()
-        if self._containsLog(self._lanes,dt) != True:
+        if self._containsLog(self._pointLanes(Water),dt) != True:
             self._onlog = False
-        if (self._frog != None and self._carCrash(self._lanes) == True
-        or self._drown(self._lanes) == True or self._frogOut() == True):
+        if (self._frog != None and self._carCrash(self._sweptLanes(Road),dt) == True
+        or self._drown(self._frogLanes(Water)) == True or self._frogOut() == True):
             self._deadAnimate()
 
-    def draw(self,view):
+    def draw(self,view,alpha=1):
         """
         Draws the game objects to the view.
 
@@ -293,23 +344,86 @@ class Level(object):
         When a frog succesfully reaches the exit, it draws the blue safe
         frog image.
 
+        The objects are attached to the layers of the view (see GView), so
+        they stay on screen from frame to frame. This method only attaches or
+        detaches the objects that appeared or went away since the last frame.
+        The lane tiles never move, so they are baked into a single texture
+        (see _drawBackground).
+
+        When the game updates at a fixed rate, the screen is drawn part way
+        between two updates. The cars, logs, and frog are drawn alpha of the
+        way from where they were before the last update to where they are now.
+
         Parameter view: view to draw to
         Precondition: view is a GView
+
+        Parameter alpha: the fraction of an update since the last update
+        Precondition: alpha is a number in 0..1
         """
+        lag = (1-alpha)*self._lastdt
+        self._drawBackground(view)
         for lane in self._lanes:
-            lane.draw(view)
+            lane.draw(view,lag,False)
 
+        if self._bar is None:
+            self._buildLives()
         self._bar.draw(view)
-        for life in  self._lives:
-            life.draw(view)
-        if not self._frog == None and self._frog.visible == True:
-            self._frog.draw(view)
 
+        shown = []
+        if not self._frog == None and self._frog.visible == True:
+            shown.append(self._frog)
         if self._deadfrog != None and self._deadfrog.visible == True:
-            self._deadfrog.draw(view)
+            shown.append(self._deadfrog)
+        shown.extend(self._safeFrogs)
+        if (len(shown) != len(self._shown)
+            or any(a is not b for (a,b) in zip(shown,self._shown))):
+            for frog in self._shown:
+                frog.detach()
+            for frog in shown:
+                frog.attach(view,'frog')
+            self._shown = shown
+
+        if not self._frog == None and self._frog.visible == True:
+            self._shiftFrog(alpha)
+
+    def _drawBackground(self,view):
+        """
+        Draws the tiles of every lane, baked into a single texture.
+
+        The tiles never move, so they are drawn into the texture once, the first
+        time the level is drawn. They are only drawn again if the size of the
+        view changes.
+
+        Parameter view: view to draw to
+        Precondition: view is a GView
+        """
+        size = (view.width,view.height)
+        if self._background is None:
+            self._background = GBake(objects=[lane.getTile() for lane in self._lanes],
+                                     width=self._width*GRID_SIZE,
+                                     height=self._height*GRID_SIZE)
+        elif self._backgroundSize != size:
+            self._background.refresh()
+        self._background.attach(view,'background')
+        self._backgroundSize = size
+
+    def _shiftFrog(self,alpha):
+        """
+        Draws the frog alpha of the way from its position before the last update.
 
-        for frog in  self._safeFrogs:
-            frog.draw(view)
+        Only the drawing of the frog is shifted (see GObject.shift). The frog
+        itself stays where it is, so this does not change the game. A new frog
+        (one that was restored since the last update) is drawn where it is.
+
+        Parameter alpha: the fraction of an update since the last update
+        Precondition: alpha is a number in 0..1
+        """
+        if alpha == 1 or self._frogFrom == None or self._frogFrom[0] is not self._frog:
+            self._frog.shift = (0,0)
+            return
+        back = 1-alpha
+        self._frog.shift = ((self._frogFrom[1]-self._frog.x)*back,
+                            (self._frogFrom[2]-self._frog.y)*back)
 
     def _checkOccupied(self,lanes):
         """
@@ -318,16 +432,14 @@ class Level(object):
         Loops through the exits in the hedge lane and if the frog
         has occupied all of them, it returns True.
 
-        Parameter lanes: list of lanes in the level to loop through
-        Precondition: lanes is a list
+        Parameter lanes: hedge lanes in the level to loop through
+        Precondition: lanes is a sequence of Hedge objects
         """
         allOccupied = True
         for lane in lanes:
-            if lane.getTile().source == 'hedge.png':
-                for i in range(len(lane.getExits())):
-                    exit = lane.getExits()[i]
-                    if  lane._exitsOccupied[i] == 0:
-                        allOccupied = False
+            for occupied in lane._exitsOccupied:
+                if occupied == 0:
+                    allOccupied = False
         return allOccupied
 
     def _collision(self,lanes):
@@ -337,14 +449,13 @@ class Level(object):
         Loops through the tiles in the hedge lane and if the frog
         collided with them, it returns True.
 
-        Parameter lanes: list of lanes in the level to loop through
-        Precondition: lanes is a list
+        Parameter lanes: hedge lanes in the level to loop through
+        Precondition: lanes is a sequence of Hedge objects
         """
         for lane in lanes:
-            if lane.getTile().source == 'hedge.png' :
-                if self._frog != None and self._frog.collides(lane.getTile()):
-                    self._frog.setY(lane.getTile().y-GRID_SIZE)
-                    return True
+            if self._frog != None and self._frog.collides(lane.getTile()):
+                self._frog.setY(lane.getTile().y-GRID_SIZE)
+                return True
 
     def _containsLog(self,lanes,dt):
         """
@@ -353,27 +464,24 @@ class Level(object):
         It also returns True if frog has jumped on log and turns the animator
         coroutine off, to allow the frog to ride on the log.
 
-        Parameter lanes: list of lanes in the level to loop through
-        Precondition: lanes is a list
+        Parameter lanes: water lanes in the level to loop through
+        Precondition: lanes is a sequence of Water objects
 
         Parameter dt: The time in seconds since last update
         Precondition: dt is a number (int or float)
         """
         for lane in lanes:
-            if lane.getTile().source == 'water.png':
-                for i in range(len(lane.getLogs())):
-                    log = lane.getLogs()[i]
-                    if (self._frog != None and log.contains((self._frog.getX(),
-                       self._frog.getY()))):
-                        self._onlog = True
-                        speed = lane.getSpeed()
-                        if speed < 0:
-                            self._frog.setX(self._frog.x + (speed * dt))
-
-                        if speed > 0:
-                            self._frog.setX(self._frog.x + (speed * dt))
+            if (self._frog != None and lane.logAt((self._frog.getX(),
+               self._frog.getY())) != None):
+                self._onlog = True
+                speed = lane.getSpeed()
+                if speed < 0:
+                    self._frog.setX(self._frog.x + (speed * dt))
 
-                        return True
+                if speed > 0:
+                    self._frog.setX(self._frog.x + (speed * dt))
+
+                return True
         return False
 
     def _drown(self,lanes):
@@ -384,14 +492,13 @@ class Level(object):
         it returns True if the frog has entered the water lane and is not on a
         log.
 
-        Parameter lanes: list of lanes in the level to loop through
-        Precondition: lanes is a list
+        Parameter lanes: water lanes in the level to loop through
+        Precondition: lanes is a sequence of Water objects
         """
         for lane in lanes:
-            if lane.getTile().source == 'water.png':
-                if self._frog != None and self._frog.collides(lane.getTile()):
-                    if self._onlog != True and  self._frog.animator == None:
-                        return True
+            if self._frog != None and self._frog.collides(lane.getTile()):
+                if self._onlog != True and  self._frog.animator == None:
+                    return True
 
     def _containsExit(self,lanes):
         """
@@ -399,24 +506,23 @@ class Level(object):
 
         Once the frog is contained in an exit, it returns True and changes the
         _allOccupied to True once all of the exits in the level have been
-        occupied.
+        occupied. The exits are only searched in the given lanes, but every
+        hedge in the level counts towards _allOccupied.
 
-        Parameter lanes: list of lanes in the level to loop through
-        Precondition: lanes is a list
+        Parameter lanes: hedge lanes in the level to loop through
+        Precondition: lanes is a sequence of Hedge objects
         """
-        allOccupied = True
         for lane in lanes:
-            if lane.getTile().source == 'hedge.png':
-                for i in range(len(lane.getExits())):
-                    exit = lane.getExits()[i]
-                    self._exitX = exit.x
-                    self._exitY = exit.y
-                    if lane._exitsOccupied[i] == 0:
-                        allOccupied = False
-                        if exit.contains((self._frog.getX(),self._frog.getY()+GRID_SIZE)):
-                            lane._exitsOccupied[i]=1
-                            return True
-        if allOccupied  == True :
+            exits = lane.getExits()
+            for i in range(len(exits)):
+                exit = exits[i]
+                self._exitX = exit.x
+                self._exitY = exit.y
+                if lane._exitsOccupied[i] == 0:
+                    if exit.contains((self._frog.getX(),self._frog.getY()+GRID_SIZE)):
+                        lane._exitsOccupied[i]=1
+                        return True
+        if self._checkOccupied(self._hedges) == True:
             self._allOccupied = True
         return False
 
@@ -427,55 +533,61 @@ class Level(object):
         Loops through the hedge lane to look for the openings, and if the frog
         is contained within the tile, it returns True.
 
-        Parameter lanes: list of lanes in the level to loop through
-        Precondition: lanes is a list
+        Parameter lanes: hedge lanes in the level to loop through
+        Precondition: lanes is a sequence of Hedge objects
         """
         for lane in lanes:
-            if lane.getTile().source == 'hedge.png':
-                for i in range (len(lane.getOpenings())):
-                    opening = lane.getOpenings()[i]
-                    if opening.contains((self._frog.getX(),self._frog.getY()+GRID_SIZE)):
-                        self._openingX = self._frog.getX()
-                        return True
-                return False
+            for opening in lane.getOpenings():
+                if opening.contains((self._frog.getX(),self._frog.getY()+GRID_SIZE)):
+                    self._openingX = self._frog.getX()
+                    return True
+            return False
 
     def _updateLives(self):
         """
         Updates the lives bar on the upper right corner of the game.
 
-        When a life is lost, the display subtracts one GObject from the list
-        of frog heads.
+        When a life is lost, the lives bar hides one of its frog heads. Nothing
+        is rebuilt.
         """
         if self._noOfLives >= 1:
             self._noOfLives = self._noOfLives-1
-            self._bar = GLabel(text = "LIVES:",font_name = ALLOY_FONT,
-                font_size = ALLOY_SMALL, linecolor='dark green',
-                x=(self.getWidth()-self._noOfLives-1)*GRID_SIZE-ALLOY_SMALL/2,
-                y=(self.getHeight()+1)*GRID_SIZE -GRID_SIZE/2 )
-            self._lives = []
-            for i in range(self._noOfLives):
-                life = GImage(source = FROG_HEAD,width=GRID_SIZE,height=GRID_SIZE,
-                y=(self.getHeight()+1)*GRID_SIZE - GRID_SIZE/2,
-                x=(self.getWidth()-i)*GRID_SIZE-GRID_SIZE/2)
-                self._lives.append(life)
+            if self._bar != None:
+                self._bar.setCount(self._noOfLives)
         else:
             self._noOfLives = 0
 
-    def _carCrash(self,lanes):
+    def _buildLives(self):
+        """
+        Builds the lives bar on the upper right corner of the game.
+
+        The bar is a Counter: a GLabel followed by one frog head GImage for
+        each life remaining. It is only built when the level is drawn, so that
+        a level can be played without a window.
+        """
+        self._bar = Counter("LIVES:",FROG_HEAD,self._noOfLives,
+                            self.getWidth()*GRID_SIZE,
+                            (self.getHeight()+1)*GRID_SIZE-GRID_SIZE/2)
+
+    def _carCrash(self,lanes,dt):
         """
         Checks if the frog has collided into a car.
 
-        Loops through the road lanes and checks the position of the moving
-        car objects and if the frog collides with it, it returns True.
-        Parameter lanes: list of lanes in the level to loop through
-        Precondition: lanes is a list
+        Loops through the road lanes and checks the road each car covered
+        since the last frame, so that a long frame cannot let a car jump over
+        the frog. The frog is checked along its own path over the same frame
+        (see Road.sweptCollides). If the frog is hit, it returns True.
+
+        Parameter lanes: road lanes in the level to loop through
+        Precondition: lanes is a sequence of Road objects
+
+        Parameter dt: The time in seconds since last update
+        Precondition: dt is a number (int or float)
         """
+        move = self._frogMove()
         for lane in lanes:
-            if lane.getTile().source == 'road.png':
-                for i in range(len(lane.carPos())):
-                    carpos = lane.carPos()[i]
-                    if self._frog != None and self._frog.collides(carpos):
-                        return True
+            if self._frog != None and lane.sweptCollides(self._frog,dt,move):
+                return True
 
     def _reachExit(self):
         """
@@ -510,7 +622,7 @@ class Level(object):
         self._frog.setAngle(FROG_WEST)
         self._frog.animator = self._frog.animate_slideH('left',self.getWidth()*GRID_SIZE)
         next(self._frog.animator) # Start up the animator
-        if self._containHedge(self._lanes) == True:
+        if self._containHedge(self._pointLanes(Hedge)) == True:
             self._frog.setX(dx)
             self._frog.animator = None
 
@@ -523,7 +635,7 @@ class Level(object):
         self._frog.setAngle(FROG_EAST)
         self._frog.animator = self._frog.animate_slideH('right',self.getWidth()*GRID_SIZE)
         next(self._frog.animator) # Start up the animator
-        if self._containHedge(self._lanes) == True:
+        if self._containHedge(self._pointLanes(Hedge)) == True:
             self._frog.setX(dx)
             self._frog.animator = None
 
@@ -539,12 +651,12 @@ class Level(object):
         if self._frog.getY()+ GRID_SIZE < (self.getHeight()*GRID_SIZE):
             dy += GRID_SIZE
             self._frog.setY(dy)
-            if self._collision(self._lanes) == True:
-                if self._containsExit(self._lanes) == True:
+            if self._collision(self._frogLanes(Hedge)) == True:
+                if self._containsExit(self._pointLanes(Hedge,GRID_SIZE)) == True:
                     self._frog.setY(dy)
                     self._reachExit()
-                    self._allOccupied = self._checkOccupied(self._lanes)
-                elif self._containsOpening(self._lanes) == True:
+                    self._allOccupied = self._checkOccupied(self._hedges)
+                elif self._containsOpening(self._hedges) == True:
                     self._frog.setY(dy-GRID_SIZE)
                 else:
                     self._frog.setY(dy-GRID_SIZE)
@@ -568,8 +680,8 @@ class Level(object):
             dy -= GRID_SIZE
             self._frog.setY(dy)
 
-            if self._collision(self._lanes) == True:
-                if self._containsOpening(self._lanes) == True:
+            if self._collision(self._frogLanes(Hedge)) == True:
+                if self._containsOpening(self._hedges) == True:
                     self._frog.setY(dy+GRID_SIZE)
                 else:
                     self._frog.setY(dy+GRID_SIZE)
@@ -583,14 +695,13 @@ class Level(object):
         """
         Checks if the frog is in Hedge Lane.
 
-        Parameter lane: list of lanes in the level to loop through.
-        Precondition: lanes is a list
+        Parameter lanes: hedge lanes in the level to loop through
+        Precondition: lanes is a sequence of Hedge objects
         """
         for lane in lanes:
-            if lane.getTile().source == 'hedge.png':
-                if (self._frog != None and self._frog.getY() >= lane.getY()
-                and self._frog.getY() <= lane.getY()+GRID_SIZE):
-                    return True
+            if (self._frog != None and self._frog.getY() >= lane.getY()
+            and self._frog.getY() <= lane.getY()+GRID_SIZE):
+                return True
 
     def _deadAnimate(self):
         """
@@ -607,3 +718,128 @@ class Level(object):
         self._deadfrog.y = init_y
         self._deadfrog.animator = self._deadfrog.animate()
         next(self._deadfrog.animator) # Start up the animator
+
+    def _buildTypes(self):
+        """
+        Builds the collections of lanes that are used as a whole.
+
+        The exit checks loop over every hedge, and update skips the static lanes
+        entirely. Road and water checks only need the lanes near the frog, so
+        they use the row index instead (see _buildRows).
+        """
+        self._hedges = tuple(lane for lane in self._lanes if isinstance(lane,Hedge))
+        self._moving = tuple(lane for lane in self._lanes if not lane.isStatic())
+
+    def _buildRows(self):
+        """
+        Builds the index from each grid row to the lanes that reach into it.
+
+        A lane reaches into every row covered by its tile, or by the hitbox of
+        any of its objects. The objects in a lane only move horizontally, so
+        this never changes once the lanes are built. Hazard checks use this
+        index so that they only look at the lanes near the frog.
+        """
+        self._rows = [[] for _ in range(max(1,len(self._lanes)))]
+        self._spans = {}
+        for pos in range(len(self._lanes)):
+            lane = self._lanes[pos]
+            bottom = lane.getTile().bottom
+            top = lane.getTile().top
+            for obj in lane.getObjects():
+                bottom = min(bottom,obj.bottom)
+                top = max(top,obj.top)
+            for row in range(self._row(bottom),self._row(top)+1):
+                self._rows[row].append(pos)
+
+    def _row(self,y):
+        """
+        Returns the grid row containing y, clamped to the rows of the level.
+
+        Parameter y: the vertical coordinate
+        Precondition: y is an int or float
+        """
+        return min(max(int(y//GRID_SIZE),0),len(self._rows)-1)
+
+    def _lanesAt(self,bottom,top,kind):
+        """
+        Returns the lanes of the given type that may reach the span bottom..top.
+
+        The lanes are returned in level order (bottom lane first) as a tuple.
+        The tuple for each span of rows is only built once.
+
+        Parameter bottom: the bottom of the span
+        Precondition: bottom is an int or float
+
+        Parameter top: the top of the span
+        Precondition: top is an int or float >= bottom
+
+        Parameter kind: the type of lane to return
+        Precondition: kind is Lane or a subclass of Lane
+        """
+        key = (self._row(bottom),self._row(top),kind)
+        if not key in self._spans:
+            found = set()
+            for row in range(key[0],key[1]+1):
+                found.update(self._rows[row])
+            self._spans[key] = tuple(self._lanes[pos] for pos in sorted(found)
+                                     if isinstance(self._lanes[pos],kind))
+        return self._spans[key]
+
+    def _frogLanes(self,kind):
+        """
+        Returns the lanes of the given type that the frog hitbox may collide with.
+
+        The lanes are in level order. If there is no frog, or the level has no
+        lanes of this type, it returns an empty tuple.
+
+        Parameter kind: the type of lane to return
+        Precondition: kind is Lane or a subclass of Lane
+        """
+        if self._frog == None:
+            return ()
+        return self._lanesAt(self._frog.bottom,self._frog.top,kind)
+
+    def _frogMove(self):
+        """
+        Returns how far (dx,dy) the frog moved in the last update.
+
+        A new frog (one that was restored since the last update) has not moved.
+        If there is no frog, it returns (0,0).
+        """
+        if self._frog == None or self._frogFrom == None or self._frogFrom[0] is not self._frog:
+            return (0,0)
+        return (self._frog.x-self._frogFrom[1],self._frog.y-self._frogFrom[2])
+
+    def _sweptLanes(self,kind):
+        """
+        Returns the lanes of the given type that the frog hitbox may have touched
+        in the last update.
+
+        This is like _frogLanes, but includes the lanes the frog passed through
+        (or left) during the update, as it may have moved.
+
+        Parameter kind: the type of lane to return
+        Precondition: kind is Lane or a subclass of Lane
+        """
+        if self._frog == None:
+            return ()
+        dy = self._frogMove()[1]
+        return self._lanesAt(self._frog.bottom-max(dy,0),self._frog.top-min(dy,0),kind)
+
+    def _pointLanes(self,kind,offset=0):
+        """
+        Returns the lanes of the given type that may contain the frog center.
+
+        The lanes are in level order. If there is no frog, it returns an empty
+        tuple.
+
+        Parameter kind: the type of lane to return
+        Precondition: kind is Lane or a subclass of Lane
+
+        Parameter offset: the vertical distance from the frog center to check
+        Precondition: offset is an int or float
+        """
+        if self._frog == None:
+            return ()
+        y = self._frog.getY()+offset
+        return self._lanesAt(y,y,kind)
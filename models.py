@@ -62,7 +62,8 @@ class Frog(GSprite):         # You will need to change this by Task 3
         """
         Sets angle of frog to value.
         """
-        assert type(value) == int or type(value) == float
+        if CHECKED:
+            assert type(value) == int or type(value) == float
         self.angle = value
 
     def getX(self):
@@ -75,7 +76,8 @@ class Frog(GSprite):         # You will need to change this by Task 3
         """
         Sets x-value of frog to value.
         """
-        assert type(value)==int or type(value)==float
+        if CHECKED:
+            assert type(value)==int or type(value)==float
         self.x = value
 
     def getY(self):
@@ -88,8 +90,9 @@ class Frog(GSprite):         # You will need to change this by Task 3
         """
         Sets y-value of frog to value.
         """
-        assert type(value)==int or type(value)==float
-        assert value >=0
+        if CHECKED:
+            assert type(value)==int or type(value)==float
+            assert value >=0
         self.y = value
 
     # INITIALIZER TO SET FROG POSITION
@@ -348,7 +351,8 @@ class DeadFrog(GSprite):         # You will need to change this by Task 3
         """
         Sets dead frog angle to value.
         """
-        assert type(value) == int or type(value) == float
+        if CHECKED:
+            assert type(value) == int or type(value) == float
         self.angle = value
 
     def getX(self):
@@ -361,7 +365,8 @@ class DeadFrog(GSprite):         # You will need to change this by Task 3
         """
         Sets x-value of dead frog to value.
         """
-        assert type(value)==int or type(value)==float
+        if CHECKED:
+            assert type(value)==int or type(value)==float
         self.x = value
 
     def getY(self):
@@ -374,8 +379,9 @@ class DeadFrog(GSprite):         # You will need to change this by Task 3
         """
         Sets y-value of dead frog to value.
         """
-        assert type(value)==int or type(value)==float
-        assert value >=0
+        if CHECKED:
+            assert type(value)==int or type(value)==float
+            assert value >=0
         self.y = value
 
     # INITIALIZER TO SET FROG POSITION
@@ -423,3 +429,407 @@ class DeadFrog(GSprite):         # You will need to change this by Task 3
                 self.visible = False
                 self.animator = None
                 animating = False
+
+
+class Counter(object):
+    """
+    A class representing a counter in the heads-up display (such as the lives bar).
+
+    A counter is a label followed by a row of icons, one for each unit of the count,
+    ending at a fixed right edge. The label sits just to the left of the icons.
+    Everything is made once, when the counter is created. Changing the count only
+    attaches or detaches icons and slides the label, so no texture or label is ever
+    made again.
+    """
+    # LIST ALL HIDDEN ATTRIBUTES HERE
+    #Attribute _label: the label in front of the icons
+    #Invariant: _label must be a GLabel
+
+    #Attribute _icons: the icons, from right to left, one for each unit of the
+    #largest count
+    #Invariant: _icons must be a list of GImage objects
+
+    #Attribute _count: the current count
+    #Invariant: _count must be an int in 0..len(_icons)
+
+    #Attribute _right: the right edge of the counter
+    #Invariant: _right must be a number
+
+    #Attribute _shown: the number of icons attached to the view
+    #Invariant: _shown must be an int in 0..len(_icons)
+
+    #Attribute _view: the view that the counter is attached to
+    #Invariant: _view must be a GView, or None if the counter has not been drawn
+
+    # GETTERS AND SETTERS
+    def getCount(self):
+        """
+        Returns the current count.
+        """
+        return self._count
+
+    def setCount(self,value):
+        """
+        Sets the current count to value, showing that many icons.
+
+        Parameter value: the new count
+        Precondition: value is an int in 0..the count the counter was made with
+        """
+        assert type(value) == int and 0 <= value <= len(self._icons), \
+            "%s is not a valid count" % repr(value)
+        self._count = value
+        self._layout()
+
+    # INITIALIZER
+    def __init__(self,text,icon,count,right,y):
+        """
+        Initializes a counter with its label, icons, and count.
+
+        Parameter text: the text of the label
+        Precondition: text is a string
+
+        Parameter icon: the image file for each icon
+        Precondition: icon is the name of a file in the Images folder
+
+        Parameter count: the starting (and largest) count
+        Precondition: count is an int >= 0
+
+        Parameter right: the right edge of the counter
+        Precondition: right is a number
+
+        Parameter y: the vertical center of the counter
+        Precondition: y is a number
+        """
+        self._label = GLabel(text = text,font_name = ALLOY_FONT,
+                      font_size = ALLOY_SMALL, linecolor='dark green',y=y)
+        self._icons = []
+        for i in range(count):
+            self._icons.append(GImage(source = icon,width=GRID_SIZE,height=GRID_SIZE,
+                               y=y,x=right-i*GRID_SIZE-GRID_SIZE/2))
+        self._count = count
+        self._right = right
+        self._shown = 0
+        self._view = None
+        self._layout()
+
+    def draw(self,view):
+        """
+        Draws the counter to the view.
+
+        The first time, it attaches the label and the icons to the hud layer of
+        the view. They stay there, so after that this method does nothing.
+
+        Parameter view: view to draw to
+        Precondition: view is a GView
+        """
+        if not self._view is view:
+            self._label.attach(view,'hud')
+            self._view = view
+            self._shown = 0
+            self._layout()
+
+    def _layout(self):
+        """
+        Slides the label next to the icons, and shows just _count icons.
+        """
+        self._label.x = self._right-(self._count+1)*GRID_SIZE-ALLOY_SMALL/2
+        if self._view is None:
+            return
+        for icon in self._icons[self._count:self._shown]:
+            icon.detach()
+        for icon in self._icons[self._shown:self._count]:
+            icon.attach(self._view,'hud')
+        self._shown = self._count
+
+
+class ObjectType(object):
+    """
+    A class representing one kind of lane object (a car, a log, an exit, and so on).
+
+    Every lane object of the same kind has the same image, size, and hitbox, so these
+    are kept once, here, instead of once per object. The types are made by the
+    class method get, which makes each type the first time it is asked for and hands
+    out the same one after that.
+    """
+    # LIST ALL HIDDEN ATTRIBUTES HERE
+    #Attribute _name: the name of the type in the object data (e.g. 'car1')
+    #Invariant: _name must be a string
+
+    #Attribute _source: the image file for the type
+    #Invariant: _source must be the name of a file in the Images folder
+
+    #Attribute _width: the width of the image
+    #Invariant: _width must be a float > 0
+
+    #Attribute _height: the height of the image
+    #Invariant: _height must be a float > 0
+
+    #Attribute _hitbox: the hitbox insets (left, top, right, bottom) of the image
+    #Invariant: _hitbox must be a tuple of four numbers
+
+    #Attribute _halfWidth: half of _width
+    #Invariant: _halfWidth must be a float > 0
+
+    #Attribute _halfHeight: half of _height
+    #Invariant: _halfHeight must be a float > 0
+
+    # The types made so far, by name, size, and hitbox
+    TYPES = {}
+
+    # GETTERS AND SETTERS
+    def getName(self):
+        """
+        Returns the name of the type.
+        """
+        return self._name
+
+    def getSource(self):
+        """
+        Returns the image file of the type.
+        """
+        return self._source
+
+    def getWidth(self):
+        """
+        Returns the width of the type.
+        """
+        return self._width
+
+    def getHeight(self):
+        """
+        Returns the height of the type.
+        """
+        return self._height
+
+    def getHitbox(self):
+        """
+        Returns the hitbox insets (left, top, right, bottom) of the type.
+        """
+        return self._hitbox
+
+    @classmethod
+    def get(cls,name,data):
+        """
+        Returns the type with the given name and data, making it if necessary.
+
+        Two levels loaded from the same object data share their types.
+
+        Parameter name: the name of the type
+        Precondition: name is a string naming an image in the object data
+
+        Parameter data: the entry for the type in the object data
+        Precondition: data is a dictionary with keys 'size' and 'hitbox'
+        """
+        key = (name,tuple(data['size']),tuple(data['hitbox']))
+        if not key in cls.TYPES:
+            cls.TYPES[key] = cls(name,data)
+        return cls.TYPES[key]
+
+    # INITIALIZER
+    def __init__(self,name,data):
+        """
+        Initializes a type from its entry in the object data.
+
+        The image of the type is the name followed by '.png'.
+
+        Parameter name: the name of the type
+        Precondition: name is a string naming an image in the object data
+
+        Parameter data: the entry for the type in the object data
+        Precondition: data is a dictionary with keys 'size' and 'hitbox'
+        """
+        self._name = name
+        self._source = name+'.png'
+        self._width = float(data['size'][0])
+        self._height = float(data['size'][1])
+        self._hitbox = tuple(data['hitbox'])
+        self._halfWidth = self._width/2
+        self._halfHeight = self._height/2
+
+
+class LaneObject(object):
+    """
+    A class representing a single object in a lane (a car, a log, an exit...).
+
+    A lane can have a lot of objects, and all that differs between two objects of
+    the same type is where they are and which way they face. So each object only
+    has its type, its position, and whether it is flipped (turned 180 degrees, for
+    lanes that move to the left). It has no drawing instructions of its own; the
+    lane draws all of its objects at once with a GBatch.
+
+    The object has the attributes of the GImage that it stands in for (x, y, width,
+    height, angle, scale, source, and hitbox), and collides and contains work the
+    same way, so lanes can use it just as they would use a GImage. x and y are
+    plain attributes, so moving an object is not checked, even when game2d
+    checks its own setters (see game2d/checks.py).
+    """
+    __slots__ = ('_type','x','y','_flipped','_box','_boxAt')
+
+    # LIST ALL HIDDEN ATTRIBUTES HERE
+    #Attribute _type: the type of the object
+    #Invariant: _type must be an ObjectType
+
+    #Attribute x: the horizontal center of the object
+    #Invariant: x must be a float
+
+    #Attribute y: the vertical center of the object
+    #Invariant: y must be a float
+
+    #Attribute _flipped: True if the object is turned 180 degrees
+    #Invariant: _flipped must be a bool
+
+    #Attribute _box: the bounding box of the hitbox, when the object was at _boxAt
+    #Invariant: _box must be a tuple (l,t,r,b) of floats, or None
+
+    #Attribute _boxAt: the (x,y) position of the object when _box was computed
+    #Invariant: _boxAt must be a tuple of two floats, or None
+
+    # GETTERS AND SETTERS
+    def getType(self):
+        """
+        Returns the type of the object.
+        """
+        return self._type
+
+    def isFlipped(self):
+        """
+        Returns True if the object is turned 180 degrees.
+        """
+        return self._flipped
+
+    @property
+    def source(self):
+        """
+        The image file of the object.
+        """
+        return self._type._source
+
+    @property
+    def width(self):
+        """
+        The width of the object.
+        """
+        return self._type._width
+
+    @property
+    def height(self):
+        """
+        The height of the object.
+        """
+        return self._type._height
+
+    @property
+    def hitbox(self):
+        """
+        The hitbox insets (left, top, right, bottom) of the object.
+        """
+        return self._type._hitbox
+
+    @property
+    def angle(self):
+        """
+        The angle of the object: 180 if it is flipped, and 0 otherwise.
+        """
+        return 180.0 if self._flipped else 0.0
+
+    @property
+    def scale(self):
+        """
+        The scale of the object, which is always (1,1).
+        """
+        return (1.0,1.0)
+
+    @property
+    def top(self):
+        """
+        The top edge of the hitbox of the object.
+        """
+        return self._bbox()[1]
+
+    @property
+    def bottom(self):
+        """
+        The bottom edge of the hitbox of the object.
+        """
+        return self._bbox()[3]
+
+    # INITIALIZER
+    def __init__(self,kind,x,y,flipped=False):
+        """
+        Initializes an object of the given type at the given position.
+
+        Parameter kind: the type of the object
+        Precondition: kind is an ObjectType
+
+        Parameter x: the horizontal center of the object
+        Precondition: x is a number
+
+        Parameter y: the vertical center of the object
+        Precondition: y is a number
+
+        Parameter flipped: True if the object is turned 180 degrees
+        Precondition: flipped is a bool
+        """
+        if CHECKED:
+            assert isinstance(kind,ObjectType), '%s is not an ObjectType' % repr(kind)
+            assert type(x) in [int,float] and type(y) in [int,float], \
+                '%s is not a valid position' % repr((x,y))
+        self._type = kind
+        self.x = float(x)
+        self.y = float(y)
+        self._flipped = flipped
+        self._box = None
+        self._boxAt = None
+
+    def collides(self,obj):
+        """
+        Returns True if this object collides with obj.
+
+        This is the same test as GObject.collides (with the same hitboxes).
+
+        Parameter obj: the object to check for collision
+        Precondition: obj is a GObject or LaneObject rotated a multiple of 90 degrees
+        """
+        (l0,t0,r0,b0) = obj._bbox()
+        (l1,t1,r1,b1) = self._bbox()
+        isx = l1 <= l0 <= r1 or l0 <= l1 <= r0
+        isy = b1 <= b0 <= t1 or b0 <= b1 <= t0
+        return isx and isy
+
+    def contains(self,point):
+        """
+        Returns True if the hitbox of this object contains the point.
+
+        This is the same test as GObject.contains.
+
+        Parameter point: the point to check
+        Precondition: point is a pair of numbers
+        """
+        (l,t,r,b) = self._bbox()
+        return l <= point[0] <= r and b <= point[1] <= t
+
+    def _bbox(self):
+        """
+        Returns the bounding box (l,t,r,b) of the hitbox of this object.
+
+        This is computed the same way as GObject._bbox, so the boxes (and so
+        the collisions) of a LaneObject and a GImage are exactly the same. x and
+        y are plain attributes, so the box is kept along with the position it
+        was computed at, and only computed again once the object has moved.
+        """
+        at = (self.x,self.y)
+        if at == self._boxAt:
+            return self._box
+        hit = self._type._hitbox
+        w = self._type._halfWidth
+        h = self._type._halfHeight
+        if self._flipped:
+            box = (at[0] + hit[2] - w, at[1] - hit[3] + h,
+                   at[0] - hit[0] + w, at[1] + hit[1] - h)
+        else:
+            box = (at[0] + hit[0] - w, at[1] - hit[1] + h,
+                   at[0] - hit[2] + w, at[1] + hit[3] - h)
+        self._box = box
+        self._boxAt = at
+        return box
+
@@ -0,0 +1,383 @@
+"""
+Input recording and replay module for Froggit
+
+This module records the input of a game of Froggit to a file, and plays it back later
+without a window.  Every time Level.update is called, the recorder saves the arrow
+keys that are held down (along with the number of other keys) and the dt.  The replayer
+feeds exactly the same input back through Level.update, as fast as possible, so the
+game plays out exactly as it did before.
+
+The log is a small binary file.  It starts with the magic bytes REPLAY_MAGIC and the
+name of the level file.  After that is a sequence of runs, each one a tick count, a key
+state, and a dt (see REPLAY_RUN).  A run stands for that many ticks in a row with the
+same key state and dt, so a game at a fixed tick rate takes very little space.  A run
+with a count of 0 means that the level was started again.
+
+To record a game, give the log file as the fourth command line argument to froggit (see
+consts.py), or use the --record option of simulate.  To replay it, type
+
+    python froggit replay session.frog
+"""
+import os
+os.environ.setdefault('GAME2D_HEADLESS','1')
+
+import argparse
+import atexit
+import struct
+import time
+
+from game2d import *
+from consts import *
+from level import *
+from simulate import load_level, restore_frog
+
+# The first bytes of every log file
+REPLAY_MAGIC = b'FROGREC1'
+# The layout of the level name length in the header
+REPLAY_NAME = struct.Struct('<H')
+# The layout of a run: the tick count, the key state, and the dt
+REPLAY_RUN = struct.Struct('<HBd')
+# The most ticks in a single run
+REPLAY_LIMIT = 0xFFFF
+# The keys recorded by name; other keys are only counted
+REPLAY_KEYS = ('up','down','left','right')
+# The most other keys that can be counted at once
+REPLAY_OTHERS = 0xF
+
+
+def encode_keys(input):
+    """
+    Returns the key state of input as a single byte (an int in 0..255).
+
+    Bit i of the lower four bits is set if REPLAY_KEYS[i] is held down.  The upper four
+    bits are the number of other keys held down, as the level only moves the frog when
+    exactly one key is down.
+
+    Parameter input: the input to encode
+    Precondition: input is a GInput or HeadlessInput
+    """
+    state = 0
+    arrows = 0
+    for pos in range(len(REPLAY_KEYS)):
+        if input.is_key_down(REPLAY_KEYS[pos]):
+            state |= 1 << pos
+            arrows += 1
+    others = min(input.key_count-arrows,REPLAY_OTHERS)
+    return state | (others << 4)
+
+
+def decode_keys(input,state):
+    """
+    Changes input so that it has the key state encoded in state.
+
+    The other keys are pressed as the made-up keys 'other0', 'other1', and so on.
+
+    Parameter input: the input to change
+    Precondition: input is a HeadlessInput
+
+    Parameter state: the key state
+    Precondition: state is an int in 0..255, made by encode_keys
+    """
+    input.release_all()
+    for pos in range(len(REPLAY_KEYS)):
+        if state & (1 << pos):
+            input.press(REPLAY_KEYS[pos])
+    for pos in range(state >> 4):
+        input.press('other%d' % pos)
+
+
+class Recorder(object):
+    """
+    A class to record the input to a level in a log file.
+
+    Call record each time that Level.update is called, with the same input and dt.
+    Call restart each time that the level is started again.  The log is closed by
+    close, or automatically when Python exits.
+    """
+    # HIDDEN ATTRIBUTES
+    # Attribute _file: the log file
+    # Invariant: _file is a binary file open for writing, or None if closed
+    #
+    # Attribute _level: the name of the level file
+    # Invariant: _level is a string
+    #
+    # Attribute _state: the key state of the current run
+    # Invariant: _state is an int in 0..255
+    #
+    # Attribute _dt: the dt of the current run
+    # Invariant: _dt is a float
+    #
+    # Attribute _count: the number of ticks in the current run (not yet written)
+    # Invariant: _count is an int in 0..REPLAY_LIMIT
+
+    # GETTERS AND SETTERS
+    def getLevel(self):
+        """
+        Returns the name of the level file.
+        """
+        return self._level
+
+    # INITIALIZER
+    def __init__(self,path,level):
+        """
+        Initializes a recorder writing to the file path.
+
+        Parameter path: the log file to write
+        Precondition: path is a string
+
+        Parameter level: the name of the level file
+        Precondition: level is a string
+        """
+        name = level.encode('utf-8')
+        self._file = open(path,'wb')
+        self._file.write(REPLAY_MAGIC)
+        self._file.write(REPLAY_NAME.pack(len(name)))
+        self._file.write(name)
+        self._level = level
+        self._state = 0
+        self._dt = 0.0
+        self._count = 0
+        atexit.register(self.close)
+
+    def record(self,input,dt):
+        """
+        Records one call to Level.update.
+
+        Parameter input: the input passed to Level.update
+        Precondition: input is a GInput or HeadlessInput
+
+        Parameter dt: the dt passed to Level.update
+        Precondition: dt is a number (int or float)
+        """
+        state = encode_keys(input)
+        if (self._count > 0 and self._count < REPLAY_LIMIT
+            and state == self._state and dt == self._dt):
+            self._count += 1
+        else:
+            self._flush()
+            self._state = state
+            self._dt = float(dt)
+            self._count = 1
+
+    def restart(self):
+        """
+        Records that the level was started again.
+        """
+        self._flush()
+        self._file.write(REPLAY_RUN.pack(0,0,0.0))
+
+    def close(self):
+        """
+        Writes any remaining ticks and closes the log file.
+
+        It is safe to call this method more than once.
+        """
+        if self._file is not None:
+            self._flush()
+            self._file.close()
+            self._file = None
+
+    def _flush(self):
+        """
+        Writes the current run to the log file, if it has any ticks.
+        """
+        if self._count > 0:
+            self._file.write(REPLAY_RUN.pack(self._count,self._state,self._dt))
+            self._count = 0
+
+
+def read_log(path):
+    """
+    Returns the level name and the runs in the log file path.
+
+    The runs are a list of (count,state,dt) tuples.
+
+    Parameter path: the log file to read
+    Precondition: path is a string
+    """
+    with open(path,'rb') as file:
+        data = file.read()
+    if data[:len(REPLAY_MAGIC)] != REPLAY_MAGIC:
+        raise IOError('%s is not a Froggit log file' % repr(path))
+    pos = len(REPLAY_MAGIC)
+    size = REPLAY_NAME.unpack_from(data,pos)[0]
+    pos += REPLAY_NAME.size
+    level = data[pos:pos+size].decode('utf-8')
+    pos += size
+    if (len(data)-pos) % REPLAY_RUN.size != 0:
+        raise IOError('%s is truncated' % repr(path))
+    runs = list(REPLAY_RUN.iter_unpack(data[pos:]))
+    return (level,runs)
+
+
+class Replayer(object):
+    """
+    A class to play back a log file without a window.
+
+    The level is only updated; nothing is drawn.  When the frog has died or reached
+    an exit, it is restored before the next update, just as the Froggit app does when
+    the player presses 'C'.
+    """
+    # HIDDEN ATTRIBUTES
+    # Attribute _name: the name of the level file
+    # Invariant: _name is a string
+    #
+    # Attribute _runs: the runs in the log file
+    # Invariant: _runs is a list of (count,state,dt) tuples
+    #
+    # Attribute _data: the level JSON
+    # Invariant: _data is a dict
+    #
+    # Attribute _objects: the object data (hitboxes) JSON
+    # Invariant: _objects is a dict
+    #
+    # Attribute _level: the level being played
+    # Invariant: _level is a Level
+    #
+    # Attribute _input: the synthetic input passed to the level
+    # Invariant: _input is a HeadlessInput
+    #
+    # Attribute _ticks: the number of ticks replayed so far
+    # Invariant: _ticks is an int >= 0
+    #
+    # Attribute _deaths: the number of lives lost so far
+    # Invariant: _deaths is an int >= 0
+    #
+    # Attribute _wins: the number of levels won so far
+    # Invariant: _wins is an int >= 0
+    #
+    # Attribute _losses: the number of levels lost so far
+    # Invariant: _losses is an int >= 0
+    #
+    # Attribute _over: True if the current level has been won or lost
+    # Invariant: _over is a bool
+
+    # GETTERS AND SETTERS
+    def getName(self):
+        """
+        Returns the name of the level file.
+        """
+        return self._name
+
+    def getLevel(self):
+        """
+        Returns the level being played.
+        """
+        return self._level
+
+    def getTicks(self):
+        """
+        Returns the number of ticks replayed so far.
+        """
+        return self._ticks
+
+    def getLength(self):
+        """
+        Returns the number of ticks in the log file.
+        """
+        return sum(run[0] for run in self._runs)
+
+    def getDeaths(self):
+        """
+        Returns the number of lives lost so far.
+        """
+        return self._deaths
+
+    def getWins(self):
+        """
+        Returns the number of levels won so far.
+        """
+        return self._wins
+
+    def getLosses(self):
+        """
+        Returns the number of levels lost so far.
+        """
+        return self._losses
+
+    # INITIALIZER
+    def __init__(self,path):
+        """
+        Initializes a replay of the log file path.
+
+        Parameter path: the log file to read
+        Precondition: path is a string
+        """
+        self._name, self._runs = read_log(path)
+        self._data = load_level(self._name)
+        self._objects = load_level(OBJECT_DATA)
+        self._input = HeadlessInput()
+        self._ticks = 0
+        self._deaths = 0
+        self._wins = 0
+        self._losses = 0
+        self._restart()
+
+    def run(self):
+        """
+        Replays the entire log file.
+        """
+        for (count,state,dt) in self._runs:
+            if count == 0:
+                self._restart()
+            else:
+                decode_keys(self._input,state)
+                for _ in range(count):
+                    self.step(dt)
+
+    def step(self,dt):
+        """
+        Replays a single call to Level.update with the current key state.
+
+        Parameter dt: the time in seconds since the last update
+        Precondition: dt is a number (int or float)
+        """
+        if self._level.getFrog() is None:
+            restore_frog(self._level,self._objects)
+        lives = self._level.getLives()
+        self._level.update(self._input,dt)
+        self._deaths += lives-self._level.getLives()
+        self._input.refresh()
+        self._ticks += 1
+        if not self._over and self._level.getLives() == 0:
+            self._losses += 1
+            self._over = True
+        elif not self._over and self._level.getOccupied():
+            self._wins += 1
+            self._over = True
+
+    def _restart(self):
+        """
+        Starts the level again.
+        """
+        self._level = Level(self._data,self._objects)
+        self._over = False
+
+
+def main(args=None):
+    """
+    Replays a log file from the command line and reports its speed.
+
+    Parameter args: the command line arguments (after the word replay)
+    Precondition: args is a list of strings, or None to use sys.argv
+    """
+    parser = argparse.ArgumentParser(prog='froggit replay',
+                                     description='Play back a recorded Froggit game without a window.')
+    parser.add_argument('log',help='the log file to replay')
+    parser.add_argument('--repeat',type=int,default=1,help='the number of times to replay it')
+    options = parser.parse_args(args)
+
+    elapsed = 0
+    for _ in range(options.repeat):
+        replayer = Replayer(options.log)
+        start = time.perf_counter()
+        replayer.run()
+        elapsed += time.perf_counter()-start
+
+    ticks = replayer.getTicks()*options.repeat
+    rate = ticks/elapsed if elapsed > 0 else float('inf')
+    print('%s (%s): %d ticks in %.3f seconds (%.0f ticks per second)'
+          % (options.log,replayer.getName(),ticks,elapsed,rate))
+    print('deaths: %d, wins: %d, losses: %d'
+          % (replayer.getDeaths(),replayer.getWins(),replayer.getLosses()))
+    return 0
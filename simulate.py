@@ -0,0 +1,346 @@
+"""
+Headless simulation module for Froggit
+
+This module plays a level of Froggit without a window, textures, or sound.  It steps
+Level.update directly, using a synthetic input in place of the keyboard.  When the
+frog dies or reaches an exit, the simulation restores the frog just like the Froggit
+app does when the player presses 'C'.  When the level is won or lost, it starts the
+level again.
+
+This is useful for running the game on a server, and for measuring how fast the game
+rules are.  To simulate a level from the command line, type
+
+    python froggit simulate easy1.json --ticks 10000
+
+The level file may either be the name of a file in the JSON folder, or a path.
+"""
+import os
+os.environ.setdefault('GAME2D_HEADLESS','1')
+
+import argparse
+import json
+import random
+import time
+
+from game2d import *
+from consts import *
+from level import *
+
+# The resources (Images, Sounds, JSON) are all relative to this folder
+GameApp.set_root(os.path.dirname(os.path.abspath(__file__)))
+
+# The default number of seconds per simulation tick
+SIMULATION_DT = 1/60
+# The keys that a simulated player can press
+SIMULATION_KEYS = ('up','down','left','right')
+
+
+# INPUT POLICIES
+def policy_idle(input,tick,rng):
+    """
+    Never presses a key.
+
+    Parameter input: the synthetic input to change
+    Precondition: input is a HeadlessInput
+
+    Parameter tick: the number of ticks simulated so far
+    Precondition: tick is an int >= 0
+
+    Parameter rng: the random number generator for this simulation
+    Precondition: rng is a random.Random
+    """
+    if input.key_count > 0:
+        input.release_all()
+
+
+def policy_forward(input,tick,rng):
+    """
+    Holds down the up arrow key, so the frog hops north whenever it can.
+
+    Parameter input: the synthetic input to change
+    Precondition: input is a HeadlessInput
+
+    Parameter tick: the number of ticks simulated so far
+    Precondition: tick is an int >= 0
+
+    Parameter rng: the random number generator for this simulation
+    Precondition: rng is a random.Random
+    """
+    input.press('up')
+
+
+def policy_random(input,tick,rng):
+    """
+    Holds down a random arrow key (or no key) for every FROG_SPEED seconds.
+
+    Parameter input: the synthetic input to change
+    Precondition: input is a HeadlessInput
+
+    Parameter tick: the number of ticks simulated so far
+    Precondition: tick is an int >= 0
+
+    Parameter rng: the random number generator for this simulation
+    Precondition: rng is a random.Random
+    """
+    if tick % max(1,round(FROG_SPEED/SIMULATION_DT)) == 0:
+        input.release_all()
+        choice = rng.randrange(len(SIMULATION_KEYS)+1)
+        if choice < len(SIMULATION_KEYS):
+            input.press(SIMULATION_KEYS[choice])
+
+
+# The input policies, by name
+POLICIES = {'idle': policy_idle, 'forward': policy_forward, 'random': policy_random}
+
+
+def load_level(name):
+    """
+    Returns the JSON data for the level file name.
+
+    The name is first treated as a path.  If there is no file at that path, it is
+    treated as the name of a file in the JSON folder.
+
+    Parameter name: the level file
+    Precondition: name is a string
+    """
+    if os.path.isfile(name):
+        with open(name) as file:
+            return json.load(file)
+    data = GameApp.load_json(name)
+    if data is None:
+        raise IOError('Cannot read the level file %s' % repr(name))
+    return data
+
+
+def restore_frog(level,objects):
+    """
+    Restores the frog at the start position, as STATE_CONTINUE does in Froggit.
+
+    Parameter level: the level to restore the frog in
+    Precondition: level is a Level
+
+    Parameter objects: the object data (hitboxes) JSON
+    Precondition: objects is a dict
+    """
+    level.setFrog(Frog(x=level.getX()*GRID_SIZE+GRID_SIZE//2,
+                       y=level.getY()*GRID_SIZE+GRID_SIZE//2,
+                       sFrog=objects['sprites']['frog']))
+    level.getDeadFrog().visible = False
+
+
+class Simulation(object):
+    """
+    A class to play a single level without a window.
+
+    Each call to the method step is one animation frame of the Froggit app in
+    STATE_ACTIVE.  There is no pausing: a frog that has died or reached an exit
+    is restored immediately, and a level that has been won or lost is restarted
+    as a new episode.
+    """
+    # HIDDEN ATTRIBUTES
+    # Attribute _data: the level JSON
+    # Invariant: _data is a dict
+    #
+    # Attribute _objects: the object data (hitboxes) JSON
+    # Invariant: _objects is a dict
+    #
+    # Attribute _level: the level being played
+    # Invariant: _level is a Level
+    #
+    # Attribute _input: the synthetic input passed to the level
+    # Invariant: _input is a HeadlessInput
+    #
+    # Attribute _policy: the function that presses keys each tick
+    # Invariant: _policy is one of the values in POLICIES
+    #
+    # Attribute _rng: the random number generator for the policy
+    # Invariant: _rng is a random.Random
+    #
+    # Attribute _dt: the number of seconds per tick
+    # Invariant: _dt is a float > 0
+    #
+    # Attribute _ticks: the number of ticks simulated so far
+    # Invariant: _ticks is an int >= 0
+    #
+    # Attribute _deaths: the number of lives lost so far
+    # Invariant: _deaths is an int >= 0
+    #
+    # Attribute _wins: the number of episodes won so far
+    # Invariant: _wins is an int >= 0
+    #
+    # Attribute _losses: the number of episodes lost so far
+    # Invariant: _losses is an int >= 0
+    #
+    # Attribute _recorder: the recorder for the input to the level
+    # Invariant: _recorder is a replay.Recorder, or None to not record
+
+    # GETTERS AND SETTERS
+    def getLevel(self):
+        """
+        Returns the level being played.
+        """
+        return self._level
+
+    def getInput(self):
+        """
+        Returns the synthetic input passed to the level.
+        """
+        return self._input
+
+    def getTicks(self):
+        """
+        Returns the number of ticks simulated so far.
+        """
+        return self._ticks
+
+    def getDeaths(self):
+        """
+        Returns the number of lives lost so far.
+        """
+        return self._deaths
+
+    def getWins(self):
+        """
+        Returns the number of episodes won so far.
+        """
+        return self._wins
+
+    def getLosses(self):
+        """
+        Returns the number of episodes lost so far.
+        """
+        return self._losses
+
+    def getRecorder(self):
+        """
+        Returns the recorder for the input to the level (or None).
+        """
+        return self._recorder
+
+    def setRecorder(self,value):
+        """
+        Sets the recorder for the input to the level.
+
+        Parameter value: the new recorder
+        Precondition: value is a replay.Recorder, or None to stop recording
+        """
+        self._recorder = value
+
+    # INITIALIZER
+    def __init__(self,data,objects,policy='idle',seed=None,dt=SIMULATION_DT):
+        """
+        Initializes a simulation of the given level.
+
+        Parameter data: the level JSON
+        Precondition: data is a dict
+
+        Parameter objects: the object data (hitboxes) JSON
+        Precondition: objects is a dict
+
+        Parameter policy: the name of the input policy
+        Precondition: policy is a key in POLICIES
+
+        Parameter seed: the seed for the input policy
+        Precondition: seed is an int or None
+
+        Parameter dt: the number of seconds per tick
+        Precondition: dt is a number > 0
+        """
+        assert policy in POLICIES, '%s is not a valid policy' % repr(policy)
+        assert type(dt) in [int,float] and dt > 0, '%s is not a valid dt' % repr(dt)
+        self._data = data
+        self._objects = objects
+        self._policy = POLICIES[policy]
+        self._rng = random.Random(seed)
+        self._dt = dt
+        self._input = HeadlessInput()
+        self._level = Level(self._data,self._objects)
+        self._ticks = 0
+        self._deaths = 0
+        self._wins = 0
+        self._losses = 0
+        self._recorder = None
+
+    def step(self):
+        """
+        Simulates a single animation frame.
+        """
+        if self._level.getLives() == 0:
+            self._losses += 1
+            self._restart()
+        elif self._level.getOccupied():
+            self._wins += 1
+            self._restart()
+        elif self._level.getFrog() is None:
+            self._restoreFrog()
+
+        self._policy(self._input,self._ticks,self._rng)
+        if self._recorder is not None:
+            self._recorder.record(self._input,self._dt)
+        lives = self._level.getLives()
+        self._level.update(self._input,self._dt)
+        self._deaths += lives-self._level.getLives()
+        self._input.refresh()
+        self._ticks += 1
+
+    def run(self,ticks):
+        """
+        Simulates the given number of animation frames.
+
+        Parameter ticks: the number of frames to simulate
+        Precondition: ticks is an int >= 0
+        """
+        assert type(ticks) == int and ticks >= 0, '%s is not a valid tick count' % repr(ticks)
+        for _ in range(ticks):
+            self.step()
+
+    def _restart(self):
+        """
+        Starts the level again as a new episode.
+        """
+        self._level = Level(self._data,self._objects)
+        if self._recorder is not None:
+            self._recorder.restart()
+
+    def _restoreFrog(self):
+        """
+        Restores the frog at the start position, as STATE_CONTINUE does in Froggit.
+        """
+        restore_frog(self._level,self._objects)
+
+
+def main(args=None):
+    """
+    Runs a headless simulation from the command line and reports its speed.
+
+    Parameter args: the command line arguments (after the word simulate)
+    Precondition: args is a list of strings, or None to use sys.argv
+    """
+    parser = argparse.ArgumentParser(prog='froggit simulate',
+                                     description='Play a Froggit level without a window.')
+    parser.add_argument('level',help='the level file (in the JSON folder, or a path)')
+    parser.add_argument('--ticks',type=int,default=10000,help='the number of frames to simulate')
+    parser.add_argument('--dt',type=float,default=SIMULATION_DT,help='the seconds per frame')
+    parser.add_argument('--policy',choices=sorted(POLICIES),default='random',
+                        help='how the simulated player presses keys')
+    parser.add_argument('--seed',type=int,default=None,help='the seed for the random policy')
+    parser.add_argument('--record',default=None,help='a log file to record the input to')
+    options = parser.parse_args(args)
+
+    simulation = Simulation(load_level(options.level),load_level(OBJECT_DATA),
+                            options.policy,options.seed,options.dt)
+    if options.record:
+        from replay import Recorder
+        simulation.setRecorder(Recorder(options.record,options.level))
+    start = time.perf_counter()
+    simulation.run(options.ticks)
+    elapsed = time.perf_counter()-start
+    if options.record:
+        simulation.getRecorder().close()
+
+    rate = options.ticks/elapsed if elapsed > 0 else float('inf')
+    print('%s: %d ticks in %.3f seconds (%.0f ticks per second)'
+          % (options.level,options.ticks,elapsed,rate))
+    print('deaths: %d, wins: %d, losses: %d'
+          % (simulation.getDeaths(),simulation.getWins(),simulation.getLosses()))
+    return 0